@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify, make_response, request
+from backend.utils.cache import cached
 from backend.utils.db_utils import execute_query, execute_update
 
 allergies_bp = Blueprint("allergies", __name__)
@@ -6,6 +7,7 @@ allergies_bp = Blueprint("allergies", __name__)
 
 # GET /allergies/report - Get food allergy report
 @allergies_bp.route("/report", methods=["GET"])
+@cached(tags=("Allergy", "AllergyUsers"))
 def get_allergy_report():
     query = """
       SELECT DISTINCT a.Name as AllergyName, COUNT(au.UserID) as MemberCount
@@ -33,6 +35,7 @@ def create_allergy():
 
 # GET /allergies - Get existing allergies
 @allergies_bp.route("/", methods=["GET"])
+@cached(tags=("Allergy",))
 def get_allergies():
     query = """
         SELECT  ID,
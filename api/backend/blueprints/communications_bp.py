@@ -1,7 +1,13 @@
 from flask import Blueprint, jsonify, request
 from datetime import datetime
 from backend.db_connection import db
-from backend.utils.db_utils import execute_query, execute_update
+from backend.utils.pagination import add_page_headers, fetch_page
+from backend.utils.db_utils import (
+    execute_many,
+    execute_query,
+    execute_update,
+    transaction,
+)
 
 communications_bp = Blueprint("communications", __name__)
 
@@ -17,19 +23,18 @@ def send_mass_communication():
     if not subject or not content or not recipients:
         return jsonify({"error": "Missing required fields"}), 400
 
-    communication_id = execute_update(
-        """
-    INSERT INTO Communication (Subject, Content, DateSent)
-    VALUES (%s, %s, %s);
-    """,
-        (subject, content, datetime.now()),
-    )
-
-    for member_id in recipients:
-        query = """
-        INSERT INTO CommunicationRecipients (Communication, Member) VALUES (%s, %s)
-        """
-        execute_update(query, (communication_id, member_id))
+    query = """
+    INSERT INTO CommunicationRecipients (Communication, Member) VALUES (%s, %s)
+    """
+    with transaction():
+        communication_id = execute_update(
+            """
+        INSERT INTO Communication (Subject, Content, DateSent)
+        VALUES (%s, %s, %s);
+        """,
+            (subject, content, datetime.now()),
+        )
+        execute_many(query, [(communication_id, member_id) for member_id in recipients])
 
     return jsonify({"message": "Mass communication sent", "id": communication_id}), 201
 
@@ -41,7 +46,8 @@ def view_messages_received(member_id):
         return jsonify({"error": "Missing member_id"}), 400
 
     cursor = db.get_db().cursor()
-    cursor.execute(
+    messages, next_cursor = fetch_page(
+        cursor,
         """
     SELECT c.ID, c.Subject, c.Content, c.DateSent
     FROM Communication c
@@ -50,9 +56,9 @@ def view_messages_received(member_id):
     ORDER BY c.DateSent DESC
     """,
         (member_id,),
+        keyset=(("DateSent", "DESC"), ("ID", "DESC")),
     )
-    messages = cursor.fetchall()
-    return jsonify({"messages": messages}), 200
+    return add_page_headers(jsonify({"messages": messages}), next_cursor), 200
 
 
 # GET /communications/<id> - Get a specific communication
@@ -73,9 +79,10 @@ def get_communication(communication_id):
 # DELETE /communications/<id> - Delete a communication
 @communications_bp.route("/<int:communication_id>", methods=["DELETE"])
 def delete_communication(communication_id):
-    execute_update(
-        "DELETE FROM CommunicationRecipients WHERE Communication = %s",
-        (communication_id,),
-    )
-    execute_update("DELETE FROM Communication WHERE ID = %s", (communication_id,))
+    with transaction():
+        execute_update(
+            "DELETE FROM CommunicationRecipients WHERE Communication = %s",
+            (communication_id,),
+        )
+        execute_update("DELETE FROM Communication WHERE ID = %s", (communication_id,))
     return jsonify({"message": "Communication deleted"}), 200
@@ -1,10 +1,169 @@
-from flask import Blueprint, jsonify, request
-from backend.utils.db_utils import execute_query, execute_update
+import time
+
+import click
+import numpy as np
+from flask import Blueprint, Response, current_app, jsonify, request
+from backend.utils.db_utils import (
+    execute_many,
+    execute_query,
+    execute_update,
+    transaction,
+)
 from backend.db_connection import db
+from backend.utils.cache import cached
+from backend.utils.pubsub import FeedHub
+from backend.utils.tally import METHODS, PreferenceProfile, tally
 from datetime import datetime
+from pymysql.constants import ER
+from pymysql.err import IntegrityError
 
 elections_bp = Blueprint("elections", __name__)
 
+# Per-member reads shared with GET /members/<id>/dashboard
+PENDING_NOMINATIONS_QUERY = """
+    SELECT 
+        N.ID,
+        N.Nominator,
+        N.Position,
+        P.Title as PositionTitle,
+        CONCAT(M1.FirstName, ' ', M1.LastName) as NominatorName,
+        E.Date as ElectionDate,
+        E.NominateBy
+    FROM Nomination N
+    JOIN Position P ON N.Position = P.ID
+    JOIN Member M1 ON N.Nominator = M1.ID
+    JOIN ElectionPositions EP ON N.Position = EP.Position
+    JOIN Election E ON EP.Election = E.ID
+    WHERE N.Nominee = %s AND N.Accepted IS NULL
+    ORDER BY E.Date;
+    """
+
+# To only show future/current elections: WHERE E.Date >= CURDATE()
+MEMBER_BALLOTS_QUERY = """
+    SELECT 
+        B.ID as BallotID,
+        P.Title as PositionTitle,
+        P.BallotOrder,
+        E.Date as ElectionDate,
+        T.Name as TermName,
+        CASE WHEN V.ID IS NOT NULL THEN TRUE ELSE FALSE END as HasVoted
+    FROM Ballot B
+    JOIN Position P ON B.Position = P.ID
+    JOIN Election E ON B.Election = E.ID
+    JOIN Term T ON E.Term = T.ID
+    LEFT JOIN Vote V ON B.ID = V.Ballot AND V.Member = %s
+    ORDER BY P.BallotOrder;
+    """
+
+
+# One round-trip per vote: the SELECT yields a row only when the option
+# belongs to the ballot, and the unique_member_ballot key rejects a second
+# vote atomically, so there is no check-then-insert race
+VOTE_INSERT = """
+    INSERT INTO Vote (Ballot, Member, BallotOption, VotedAt)
+    SELECT BO.Ballot, %s, BO.ID, %s
+    FROM BallotOptions BO
+    WHERE BO.ID = %s AND BO.Ballot = %s;
+    """
+
+# The rest of a ranked vote's order (Preference 1 is Vote.BallotOption)
+RANKING_INSERT = """
+    INSERT INTO VoteRanking (Vote, Preference, BallotOption)
+    VALUES (%s, %s, %s);
+    """
+
+BALLOT_OPTIONS_QUERY = """
+    SELECT 
+        BO.ID as OptionID,
+        CONCAT(M.FirstName, ' ', M.LastName) as CandidateName,
+        M.ID as CandidateID
+    FROM BallotOptions BO
+    JOIN Nomination N ON BO.Nomination = N.ID
+    JOIN Member M ON N.Nominee = M.ID
+    WHERE BO.Ballot = %s
+    ORDER BY M.LastName;
+    """
+
+# One row per preference of every vote on a ballot; a single-choice vote
+# (no VoteRanking rows) reads as its one first preference
+BALLOT_RANKINGS_QUERY = """
+    SELECT V.ID as VoteID,
+           COALESCE(VR.Preference, 1) as Preference,
+           COALESCE(VR.BallotOption, V.BallotOption) as BallotOption
+    FROM Vote V
+    LEFT JOIN VoteRanking VR ON VR.Vote = V.ID
+    WHERE V.Ballot = %s;
+    """
+
+# Ballot generation (see generate_ballots): a ballot for every position of
+# the election that has an accepted nomination, no winner and no ballot yet
+GENERATE_BALLOTS_INSERT = """
+    INSERT INTO Ballot (`Position`, Election, CreatedAt)
+    SELECT EP.Position, EP.Election, %s
+    FROM ElectionPositions EP
+    JOIN Position P ON P.ID = EP.Position
+    WHERE EP.Election = %s
+      AND EXISTS (
+          SELECT 1 FROM Nomination N
+          WHERE N.Position = EP.Position AND N.Accepted = TRUE
+      )
+      AND NOT EXISTS (SELECT 1 FROM Winner W WHERE W.Position = EP.Position)
+      AND NOT EXISTS (
+          SELECT 1 FROM Ballot B
+          WHERE B.Election = EP.Election AND B.Position = EP.Position
+      )
+    ORDER BY P.BallotOrder;
+    """
+
+NEW_BALLOTS_QUERY = """
+    SELECT
+        B.ID as ballot_id,
+        P.Title as position,
+        (SELECT COUNT(*) FROM Nomination N
+         WHERE N.Position = B.Position AND N.Accepted = TRUE) as options_count
+    FROM Ballot B
+    JOIN Position P ON P.ID = B.Position
+    WHERE B.Election = %s
+      AND NOT EXISTS (SELECT 1 FROM BallotOptions BO WHERE BO.Ballot = B.ID)
+    ORDER BY P.BallotOrder;
+    """
+
+GENERATE_OPTIONS_INSERT = """
+    INSERT INTO BallotOptions (Ballot, Nomination)
+    SELECT B.ID, N.ID
+    FROM Ballot B
+    JOIN Nomination N ON N.Position = B.Position AND N.Accepted = TRUE
+    WHERE B.Election = %s
+      AND NOT EXISTS (SELECT 1 FROM BallotOptions BO WHERE BO.Ballot = B.ID)
+    ORDER BY B.ID, N.ID;
+    """
+
+# Results come from BallotOptionTally, so this reads one row per option
+# however many votes have been cast
+BALLOT_RESULTS_QUERY = """
+    SELECT 
+        BO.ID as OptionID,
+        CONCAT(M.FirstName, ' ', M.LastName) as CandidateName,
+        M.ID as CandidateID,
+        COALESCE(T.Votes, 0) as VoteCount
+    FROM BallotOptions BO
+    JOIN Nomination N ON BO.Nomination = N.ID
+    JOIN Member M ON N.Nominee = M.ID
+    LEFT JOIN BallotOptionTally T ON T.BallotOption = BO.ID
+    WHERE BO.Ballot = %s
+    ORDER BY VoteCount DESC, M.LastName;
+    """
+
+# Seconds between keep-alive comments on an idle results stream
+LIVE_RESULTS_HEARTBEAT = 15
+
+# Live per-option vote counts, bumped in the same transaction as the vote
+TALLY_INCREMENT = """
+    INSERT INTO BallotOptionTally (BallotOption, Ballot, Votes)
+    VALUES (%s, %s, 1)
+    ON DUPLICATE KEY UPDATE Votes = Votes + 1;
+    """
+
 
 # ==================== TERMS ====================
 
@@ -31,6 +190,7 @@ def create_term():
 
 # GET /terms - View all terms
 @elections_bp.route("/terms", methods=["GET"])
+@cached(tags=("Term",))
 def view_terms():
     query = """
     SELECT ID, Name, StartDate, EndDate
@@ -55,9 +215,10 @@ def delete_term(term_id):
 
 # GET /positions - View all positions
 @elections_bp.route("/positions", methods=["GET"])
+@cached(tags=("Position",))
 def view_positions():
     query = """
-    SELECT ID, Title, BallotOrder
+    SELECT ID, Title, BallotOrder, Seats
     FROM Position
     ORDER BY BallotOrder;
     """
@@ -70,15 +231,18 @@ def create_position():
     data = request.get_json()
     title = data.get("title")
     ballot_order = data.get("ballot_order")
+    seats = data.get("seats", 1)
 
     if not title or ballot_order is None:
         return jsonify({"error": "Missing required fields"}), 400
+    if not isinstance(seats, int) or seats < 1:
+        return jsonify({"error": "seats must be a positive integer"}), 400
 
     query = """
-    INSERT INTO Position (Title, BallotOrder)
-    VALUES (%s, %s);
+    INSERT INTO Position (Title, BallotOrder, Seats)
+    VALUES (%s, %s, %s);
     """
-    position_id = execute_update(query, (title, ballot_order))
+    position_id = execute_update(query, (title, ballot_order, seats))
 
     return jsonify({"message": "Position created", "position_id": position_id}), 201
 
@@ -116,20 +280,20 @@ def create_election():
     if not term_id or not positions or not date or not nominate_by:
         return jsonify({"error": "Missing required fields"}), 400
 
-    # Create election
-    query = """
-    INSERT INTO Election (Term, Date, NominateBy)
-    VALUES (%s, %s, %s);
-    """
-    election_id = execute_update(query, (term_id, date, nominate_by))
+    with transaction():
+        # Create election
+        query = """
+        INSERT INTO Election (Term, Date, NominateBy)
+        VALUES (%s, %s, %s);
+        """
+        election_id = execute_update(query, (term_id, date, nominate_by))
 
-    # Add positions to election
-    for pos_id in positions:
+        # Add positions to election
         query = """
         INSERT INTO ElectionPositions (Election, `Position`)
         VALUES (%s, %s);
         """
-        execute_update(query, (election_id, pos_id))
+        execute_many(query, [(election_id, pos_id) for pos_id in positions])
 
     return (
         jsonify(
@@ -265,24 +429,7 @@ def accept_nomination(nomination_id):
 # GET /nominations/pending/<member_id> - Get pending nominations for member
 @elections_bp.route("/nominations/pending/<int:member_id>", methods=["GET"])
 def get_pending_nominations(member_id):
-    query = """
-    SELECT 
-        N.ID,
-        N.Nominator,
-        N.Position,
-        P.Title as PositionTitle,
-        CONCAT(M1.FirstName, ' ', M1.LastName) as NominatorName,
-        E.Date as ElectionDate,
-        E.NominateBy
-    FROM Nomination N
-    JOIN Position P ON N.Position = P.ID
-    JOIN Member M1 ON N.Nominator = M1.ID
-    JOIN ElectionPositions EP ON N.Position = EP.Position
-    JOIN Election E ON EP.Election = E.ID
-    WHERE N.Nominee = %s AND N.Accepted IS NULL
-    ORDER BY E.Date;
-    """
-    return execute_query(query, (member_id,))
+    return execute_query(PENDING_NOMINATIONS_QUERY, (member_id,))
 
 
 # GET /nominations/election/<election_id> - Get all nominations for election
@@ -305,7 +452,8 @@ def get_election_nominations(election_id):
     WHERE EP.Election = %s
     ORDER BY P.BallotOrder, M2.LastName;
     """
-    return execute_query(query, (election_id,))
+    # Paginated requests are ordered by ballot order, then nomination ID
+    return execute_query(query, (election_id,), keyset=("BallotOrder", "ID"))
 
 
 # ==================== BALLOTS ====================
@@ -314,77 +462,40 @@ def get_election_nominations(election_id):
 # POST /elections/<election_id>/generate-ballots - Generate ballots for election
 @elections_bp.route("/elections/<int:election_id>/generate-ballots", methods=["POST"])
 def generate_ballots(election_id):
-    # Get positions for this election in ballot order
-    positions_query = """
-    SELECT P.ID, P.Title, P.BallotOrder
-    FROM Position P
-    JOIN ElectionPositions EP ON P.ID = EP.Position
-    WHERE EP.Election = %s
-    ORDER BY P.BallotOrder;
+    """
+    Create a ballot for each of the election's positions that has accepted
+    nominations, no winner and no ballot yet, with one option per accepted
+    nomination. Four statements however many positions and nominees there
+    are; re-running it only fills in positions that still need a ballot.
     """
     cursor = db.get_db().cursor()
-    cursor.execute(positions_query, (election_id,))
-    positions = cursor.fetchall()
-
-    print(positions)  # Debugging line to check positions
-
-    if not positions:
+    cursor.execute(
+        "SELECT COUNT(*) as count FROM ElectionPositions WHERE Election = %s;",
+        (election_id,),
+    )
+    if not cursor.fetchone()["count"]:
         return jsonify({"error": "No positions found for election"}), 400
 
-    ballots_created = []
-
-    for position in positions:
-        # Check if already won by someone in this election
-        winner_check_query = """
-        SELECT COUNT(*) as count
-        FROM Winner W
-        JOIN ElectionPositions EP ON W.Position = EP.Position
-        WHERE EP.Election = %s AND W.Position = %s;
-        """
-        cursor = db.get_db().cursor()
-        cursor.execute(winner_check_query, (election_id, position["ID"]))
-        winner_result = cursor.fetchall()
-
-        if winner_result[0]["count"] > 0:
-            continue  # Skip if position already has winner
-
-        # Get accepted nominations for this position
-        nominations_query = """
-        SELECT N.ID
-        FROM Nomination N
-        JOIN ElectionPositions EP ON N.Position = EP.Position
-        WHERE EP.Election = %s AND N.Position = %s AND N.Accepted = TRUE;
-        """
-        cursor.execute(nominations_query, (election_id, position["ID"]))
-        nominations = cursor.fetchall()
-
-        if len(nominations) == 0:
-            continue  # Skip if no accepted nominations
-
-        # Create ballot
-        ballot_query = """
-        INSERT INTO Ballot (`Position`, Election, CreatedAt)
-        VALUES (%s, %s, %s);
-        """
-        ballot_id = execute_update(
-            ballot_query, (position["ID"], election_id, datetime.now())
-        )
-
-        # Add ballot options
-        for nomination in nominations:
-            option_query = """
-            INSERT INTO BallotOptions (Ballot, Nomination)
-            VALUES (%s, %s);
-            """
-            execute_update(option_query, (ballot_id, nomination["ID"]))
-
-        ballots_created.append(
-            {
-                "ballot_id": ballot_id,
-                "position": position["Title"],
-                "options_count": len(nominations),
-            }
-        )
+    try:
+        # One commit for every ballot and option created below
+        with transaction():
+            execute_update(GENERATE_BALLOTS_INSERT, (datetime.now(), election_id))
+
+            # Ballots only ever gain options in the transaction that creates
+            # them, so the option-less ones are exactly the ones just made
+            cursor.execute(NEW_BALLOTS_QUERY, (election_id,))
+            ballots_created = cursor.fetchall()
+
+            if ballots_created:
+                execute_update(GENERATE_OPTIONS_INSERT, (election_id,))
+    except IntegrityError as e:
+        # unique_election_position: another request generated them first
+        if e.args[0] == ER.DUP_ENTRY:
+            return (
+                jsonify({"error": "Ballots for this election are being generated"}),
+                409,
+            )
+        raise
 
     return (
         jsonify(
@@ -400,23 +511,7 @@ def generate_ballots(election_id):
 # GET /ballots/member/<member_id> - Get available ballots for member
 @elections_bp.route("/ballots/member/<int:member_id>", methods=["GET"])
 def get_member_ballots(member_id):
-    query = """
-    SELECT 
-        B.ID as BallotID,
-        P.Title as PositionTitle,
-        P.BallotOrder,
-        E.Date as ElectionDate,
-        T.Name as TermName,
-        CASE WHEN V.ID IS NOT NULL THEN TRUE ELSE FALSE END as HasVoted
-    FROM Ballot B
-    JOIN Position P ON B.Position = P.ID
-    JOIN Election E ON B.Election = E.ID
-    JOIN Term T ON E.Term = T.ID
-    LEFT JOIN Vote V ON B.ID = V.Ballot AND V.Member = %s
-    ORDER BY P.BallotOrder;
-    """
-    # WHERE E.Date >= CURDATE()  -- Only show future/current elections
-    return execute_query(query, (member_id,))
+    return execute_query(MEMBER_BALLOTS_QUERY, (member_id,))
 
 
 # GET /ballots/<ballot_id> - Get ballot details with options
@@ -428,6 +523,7 @@ def get_ballot_details(ballot_id):
         B.ID,
         B.CreatedAt,
         P.Title as PositionTitle,
+        P.Seats,
         E.Date as ElectionDate,
         T.Name as TermName
     FROM Ballot B
@@ -444,18 +540,7 @@ def get_ballot_details(ballot_id):
         return jsonify({"error": "Ballot not found"}), 404
 
     # Get ballot options
-    options_query = """
-    SELECT 
-        BO.ID as OptionID,
-        CONCAT(M.FirstName, ' ', M.LastName) as CandidateName,
-        M.ID as CandidateID
-    FROM BallotOptions BO
-    JOIN Nomination N ON BO.Nomination = N.ID
-    JOIN Member M ON N.Nominee = M.ID
-    WHERE BO.Ballot = %s
-    ORDER BY M.LastName;
-    """
-    cursor.execute(options_query, (ballot_id,))
+    cursor.execute(BALLOT_OPTIONS_QUERY, (ballot_id,))
     options = cursor.fetchall()
 
     return jsonify({"ballot": ballot[0], "options": options})
@@ -471,67 +556,252 @@ def submit_vote():
     member_id = data.get("member_id")
     ballot_id = data.get("ballot_id")
     ballot_option_id = data.get("ballot_option_id")
+    # Ranked vote: option IDs, most preferred first
+    rankings = data.get("rankings")
+
+    if rankings is not None:
+        if (
+            not isinstance(rankings, list)
+            or not rankings
+            or not all(isinstance(option, int) for option in rankings)
+            or len(set(rankings)) != len(rankings)
+        ):
+            return (
+                jsonify({"error": "rankings must be a list of distinct option IDs"}),
+                400,
+            )
+        ballot_option_id = rankings[0]
 
     if not member_id or not ballot_id or not ballot_option_id:
         return jsonify({"error": "Missing required fields"}), 400
 
-    # Check if member already voted on this ballot
-    check_query = """
-    SELECT COUNT(*) as count
-    FROM Vote
-    WHERE Member = %s AND Ballot = %s;
-    """
-    cursor = db.get_db().cursor()
-    cursor.execute(check_query, (member_id, ballot_id))
-    existing = cursor.fetchall()
+    if rankings and len(rankings) > 1:
+        cursor = db.get_db().cursor()
+        cursor.execute("SELECT ID FROM BallotOptions WHERE Ballot = %s", (ballot_id,))
+        if not set(rankings) <= {row["ID"] for row in cursor.fetchall()}:
+            return (
+                jsonify({"error": "Ballot option does not belong to this ballot"}),
+                400,
+            )
+
+    vote_id = None
+    try:
+        # The vote and its tally increment commit or roll back together
+        with transaction():
+            vote_id = execute_update(
+                VOTE_INSERT, (member_id, datetime.now(), ballot_option_id, ballot_id)
+            )
+            if vote_id:
+                execute_update(TALLY_INCREMENT, (ballot_option_id, ballot_id))
+            if vote_id and rankings and len(rankings) > 1:
+                execute_many(
+                    RANKING_INSERT,
+                    [
+                        (vote_id, preference, option)
+                        for preference, option in enumerate(rankings, start=1)
+                    ],
+                )
+    except IntegrityError as e:
+        # unique_member_ballot: a second vote (or a retry) on the same ballot
+        if e.args[0] == ER.DUP_ENTRY:
+            return jsonify({"error": "Member has already voted on this ballot"}), 409
+        if e.args[0] == ER.NO_REFERENCED_ROW_2:
+            return jsonify({"error": "Member not found"}), 404
+        raise
+
+    if not vote_id:
+        return (
+            jsonify({"error": "Ballot option does not belong to this ballot"}),
+            400,
+        )
 
-    if existing[0]["count"] > 0:
-        return jsonify({"error": "Member has already voted on this ballot"}), 400
+    results_feeds.notify(int(ballot_id))
 
-    # Submit vote
-    vote_query = """
-    INSERT INTO Vote (Ballot, Member, BallotOption, VotedAt)
-    VALUES (%s, %s, %s, %s);
+    return jsonify({"message": "Vote submitted successfully", "vote_id": vote_id}), 201
+
+
+def reconcile_tallies(ballot_id=None):
+    """
+    Compare BallotOptionTally with a fresh count of Vote rows and rewrite
+    any tally that has drifted (for one ballot, or all of them). Returns
+    the options that were corrected with their old and new counts.
     """
-    vote_id = execute_update(
-        vote_query, (ballot_id, member_id, ballot_option_id, datetime.now())
+    where = "WHERE BO.Ballot = %s" if ballot_id is not None else ""
+    params = (ballot_id,) if ballot_id is not None else ()
+    cursor = db.get_db().cursor()
+    cursor.execute(
+        f"""
+    SELECT BO.ID as BallotOption, BO.Ballot,
+           COALESCE(T.Votes, 0) as Tallied, COUNT(V.ID) as Counted
+    FROM BallotOptions BO
+    LEFT JOIN BallotOptionTally T ON T.BallotOption = BO.ID
+    LEFT JOIN Vote V ON V.BallotOption = BO.ID
+    {where}
+    GROUP BY BO.ID, BO.Ballot, T.Votes
+    HAVING Tallied <> Counted;
+    """,
+        params,
     )
+    drifted = cursor.fetchall()
+    if drifted:
+        option_ids = [row["BallotOption"] for row in drifted]
+        placeholders = ", ".join(["%s"] * len(option_ids))
+        # Recount inside the write so votes landing meanwhile aren't lost
+        with transaction():
+            execute_update(
+                f"""
+            INSERT INTO BallotOptionTally (BallotOption, Ballot, Votes)
+            SELECT * FROM (
+                SELECT BO.ID, BO.Ballot,
+                       (SELECT COUNT(*) FROM Vote V WHERE V.BallotOption = BO.ID) AS Votes
+                FROM BallotOptions BO
+                WHERE BO.ID IN ({placeholders})
+            ) AS Recount
+            ON DUPLICATE KEY UPDATE Votes = Recount.Votes;
+            """,
+                option_ids,
+            )
+    return drifted
+
+
+# POST /ballots/tallies/reconcile - Check vote tallies against the Vote rows
+@elections_bp.route("/ballots/tallies/reconcile", methods=["POST"])
+def post_reconcile_tallies():
+    ballot_id = request.args.get("ballot_id", type=int)
+    corrected = reconcile_tallies(ballot_id)
+    return jsonify({"corrected": corrected}), 200
+
+
+@elections_bp.cli.command("reconcile-tallies")
+@click.option("--ballot-id", type=int, default=None)
+def reconcile_tallies_command(ballot_id):
+    """Check vote tallies against the Vote rows and fix any drift."""
+    for row in reconcile_tallies(ballot_id):
+        click.echo(
+            f"Ballot {row['Ballot']} option {row['BallotOption']}: "
+            f"{row['Tallied']} -> {row['Counted']}"
+        )
 
-    return jsonify({"message": "Vote submitted successfully", "vote_id": vote_id}), 201
+
+def ballot_results(ballot_id):
+    cursor = db.get_db().cursor()
+    cursor.execute(BALLOT_RESULTS_QUERY, (ballot_id,))
+    return cursor.fetchall()
+
+
+def _tally_state(ballot_id):
+    # Live-feed state: one field per option (see utils/pubsub.py)
+    return {row["OptionID"]: row for row in ballot_results(ballot_id)}
+
+
+results_feeds = FeedHub(_tally_state)
 
 
 # GET /ballots/<ballot_id>/results - Get voting results
 @elections_bp.route("/ballots/<int:ballot_id>/results", methods=["GET"])
 def get_ballot_results(ballot_id):
-    query = """
-    SELECT 
-        CONCAT(M.FirstName, ' ', M.LastName) as CandidateName,
-        M.ID as CandidateID,
-        COUNT(V.ID) as VoteCount
-    FROM BallotOptions BO
-    JOIN Nomination N ON BO.Nomination = N.ID
-    JOIN Member M ON N.Nominee = M.ID
-    LEFT JOIN Vote V ON BO.ID = V.BallotOption
-    WHERE BO.Ballot = %s
-    GROUP BY BO.ID, M.ID
-    ORDER BY VoteCount DESC, M.LastName;
+    results = ballot_results(ballot_id)
+    total_votes = sum(row["VoteCount"] for row in results)
+
+    return jsonify({"results": results, "total_votes": total_votes})
+
+
+# GET /ballots/<ballot_id>/results/stream - Live results (Server-Sent Events)
+@elections_bp.route("/ballots/<int:ballot_id>/results/stream", methods=["GET"])
+def stream_ballot_results(ballot_id):
+    """
+    The first "tally" event carries every option; later ones carry only
+    the options whose counts changed (at most LIVE_RESULTS_MAX_RATE per
+    second), each with the new total_votes. The stream ends after
+    LIVE_RESULTS_MAX_SECONDS and the client reconnects, so a watcher
+    doesn't hold a server thread indefinitely.
     """
     cursor = db.get_db().cursor()
-    cursor.execute(query, (ballot_id,))
-    results = cursor.fetchall()
+    cursor.execute("SELECT ID FROM Ballot WHERE ID = %s", (ballot_id,))
+    if not cursor.fetchone():
+        return jsonify({"error": "Ballot not found"}), 404
 
-    # Get total vote count
-    total_query = """
-    SELECT COUNT(*) as TotalVotes
-    FROM Vote V
-    JOIN BallotOptions BO ON V.BallotOption = BO.ID
-    WHERE BO.Ballot = %s;
+    config = current_app.config
+    subscription = results_feeds.subscribe(
+        ballot_id,
+        max_rate=config["LIVE_RESULTS_MAX_RATE"],
+        poll_interval=config["LIVE_RESULTS_POLL_INTERVAL"],
+    )
+    max_seconds = config["LIVE_RESULTS_MAX_SECONDS"]
+    dumps = current_app.json.dumps
+
+    def generate():
+        try:
+            yield "retry: 2000\n\n"
+            view = {}
+            deadline = time.monotonic() + max_seconds
+            while (remaining := deadline - time.monotonic()) > 0:
+                delta = subscription.get(timeout=min(LIVE_RESULTS_HEARTBEAT, remaining))
+                if delta is None:
+                    # Comment line; keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                view.update(delta)
+                event = {
+                    "ballot_id": ballot_id,
+                    "results": list(delta.values()),
+                    "total_votes": sum(row["VoteCount"] for row in view.values()),
+                }
+                yield f"event: tally\ndata: {dumps(event)}\n\n"
+        finally:
+            subscription.close()
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# GET /ballots/<ballot_id>/tally - Ranked-choice tally (IRV, STV or Schulze)
+@elections_bp.route("/ballots/<int:ballot_id>/tally", methods=["GET"])
+def get_ballot_tally(ballot_id):
+    """
+    ?method=irv (default), stv or schulze; ?seats= overrides the position's
+    Seats for STV and Schulze. Winners and each round's tallies name ballot
+    options by OptionID; `options` maps them to candidates.
     """
-    cursor.execute(total_query, (ballot_id,))
-    total_result = cursor.fetchall()
-    total_votes = total_result[0]["TotalVotes"] if total_result else 0
+    method = request.args.get("method", "irv")
+    if method not in METHODS:
+        return jsonify({"error": f"method must be one of {', '.join(METHODS)}"}), 400
 
-    return jsonify({"results": results, "total_votes": total_votes})
+    cursor = db.get_db().cursor()
+    cursor.execute(
+        """
+    SELECT COALESCE(P.Seats, 1) as Seats
+    FROM Ballot B
+    LEFT JOIN Position P ON B.Position = P.ID
+    WHERE B.ID = %s;
+    """,
+        (ballot_id,),
+    )
+    ballot = cursor.fetchone()
+    if not ballot:
+        return jsonify({"error": "Ballot not found"}), 404
+    seats = request.args.get("seats", ballot["Seats"], type=int)
+    if seats < 1:
+        return jsonify({"error": "seats must be at least 1"}), 400
+
+    cursor.execute(BALLOT_OPTIONS_QUERY, (ballot_id,))
+    options = cursor.fetchall()
+    cursor.execute(BALLOT_RANKINGS_QUERY, (ballot_id,))
+    rows = cursor.fetchall()
+
+    profile = PreferenceProfile.from_rows(
+        [option["OptionID"] for option in options],
+        np.fromiter((row["VoteID"] for row in rows), np.int64, len(rows)),
+        np.fromiter((row["Preference"] for row in rows), np.int64, len(rows)),
+        np.fromiter((row["BallotOption"] for row in rows), np.int64, len(rows)),
+    )
+    result = tally(profile, method, seats)
+    result["ballot_id"] = ballot_id
+    result["options"] = options
+    return jsonify(result), 200
 
 
 # ==================== WINNERS ====================
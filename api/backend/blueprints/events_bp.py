@@ -1,30 +1,41 @@
 from flask import Blueprint, jsonify, request
 
 from backend.utils.db_utils import execute_query, execute_update
+from backend.utils.fields import column_list, requested_fields, select_columns
+from backend.utils.pagination import add_page_headers, fetch_page
 from backend.db_connection import db
 
 events_bp = Blueprint("events", __name__)
 
+# Columns clients may pick with ?fields=
+EVENT_COLUMNS = (
+    "ID",
+    "Author",
+    "PartySize",
+    "MaxSize",
+    "EventLoc",
+    "Randomized",
+    "Name",
+    "Description",
+    "MeetLoc",
+    "LeadOrg",
+    "EventType",
+    "RecItems",
+    "Picture",
+    "EventDate",
+)
+
 
 # GET /events - List all events
 @events_bp.route("/", methods=["GET"])
 def get_events():
+    # EventDate is serialized as YYYY-MM-DD by the app's JSON provider
+    columns = select_columns(EVENT_COLUMNS)
     cursor = db.get_db().cursor()
-    cursor.execute("SELECT * FROM Event;")
-    events = cursor.fetchall()
-
-    # Format EventDate for each event
-    formatted_events = []
-    for event in events:
-        event_dict = dict(event)
-        if event_dict.get("EventDate"):
-            try:
-                event_dict["EventDate"] = event_dict["EventDate"].strftime("%Y-%m-%d")
-            except:
-                pass  # Keep original if formatting fails
-        formatted_events.append(event_dict)
-
-    return jsonify(formatted_events), 200
+    events, next_cursor = fetch_page(
+        cursor, f"SELECT {columns} FROM Event;", keyset=("ID",)
+    )
+    return add_page_headers(jsonify(events), next_cursor), 200
 
 
 # GET /events/<id> - Get specific event
@@ -32,56 +43,38 @@ def get_events():
 def get_event(event_id):
     cursor = db.get_db().cursor()
 
-    # Get event details
-    event_query = """
-    SELECT * FROM Event WHERE ID = %s;
+    # Get event details (Roster is only loaded when no ?fields= is given or
+    # it is one of them)
+    fields = requested_fields(EVENT_COLUMNS + ("Roster",))
+    columns = column_list([f for f in fields if f != "Roster"]) if fields else "*"
+    event_query = f"""
+    SELECT {columns} FROM Event WHERE ID = %s;
     """
     cursor.execute(event_query, (event_id,))
     event_row = cursor.fetchone()
     if not event_row:
         return jsonify({"error": "Event not found"}), 404
 
-    # Format EventDate as YYYY-MM-DD if present
-    if event_row and "EventDate" in cursor.description:
-        idx = [desc[0] for desc in cursor.description].index("EventDate")
-        event_date = event_row[idx]
-        if event_date:
-            # If it's a datetime/date object, format it
-            try:
-                event_row = dict(
-                    zip([desc[0] for desc in cursor.description], event_row)
-                )
-                event_row["EventDate"] = event_date.strftime("%Y-%m-%d")
-            except Exception:
-                event_row = dict(
-                    zip([desc[0] for desc in cursor.description], event_row)
-                )
-
-    # Get roster for the event
+    event_data = dict(event_row)
+    if fields is not None and "Roster" not in fields:
+        return jsonify(event_data), 200
+
+    # Get roster for the event with each member's allergies aggregated in the
+    # same query (one query regardless of roster size)
     roster_query = """
-  SELECT ER.DateRegistered, ER.Waitlisted, M.ID as MemberID, M.FirstName, M.LastName
+  SELECT ER.DateRegistered, ER.Waitlisted, M.ID as MemberID, M.FirstName, M.LastName,
+         COALESCE(GROUP_CONCAT(A.Name ORDER BY A.Name SEPARATOR ', '), '') as Allergies
   FROM EventRoster ER
   JOIN Member M ON ER.Member = M.ID
-  WHERE ER.Event = %s;
+  LEFT JOIN AllergyUsers AU ON AU.UserID = M.ID
+  LEFT JOIN Allergy A ON A.ID = AU.AllergyID
+  WHERE ER.Event = %s
+  GROUP BY ER.ID, M.ID
+  ORDER BY ER.ID;
   """
     cursor.execute(roster_query, (event_id,))
     roster = cursor.fetchall()
 
-    # For each member, get allergies
-    for member in roster:
-        member_id = member["MemberID"]
-        allergies_query = """
-    SELECT A.Name
-    FROM Allergy A
-    JOIN AllergyUsers AU ON A.ID = AU.AllergyID
-    WHERE AU.UserID = %s;
-    """
-        cursor.execute(allergies_query, (member_id,))
-        allergies = cursor.fetchall()
-        allergies_list = [a["Name"] for a in allergies] if allergies else []
-        member["Allergies"] = ", ".join(allergies_list)
-
-    event_data = dict(event_row)
     event_data["Roster"] = roster
 
     return jsonify(event_data), 200
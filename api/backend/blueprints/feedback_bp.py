@@ -11,7 +11,7 @@ def review_feedback():
     query = """
     SELECT * FROM Feedback;
     """
-    return execute_query(query)
+    return execute_query(query, keyset=("ID",))
 
 
 # POST /feedback - Submit feedback
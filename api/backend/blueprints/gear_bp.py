@@ -3,7 +3,14 @@
 # Remove this file if you are not using it in your project
 ########################################################
 from backend.db_connection import db
-from backend.utils.db_utils import execute_query, execute_update
+from backend.utils.cache import cached
+from backend.utils.fields import select_columns
+from backend.utils.db_utils import (
+    execute_query,
+    execute_update,
+    stream_query,
+    transaction,
+)
 from flask import Blueprint, current_app, jsonify, make_response, request
 
 # ------------------------------------------------------------
@@ -11,16 +18,38 @@ from flask import Blueprint, current_app, jsonify, make_response, request
 # routes.
 gear_bp = Blueprint("gear", __name__)
 
+# Columns clients may pick with ?fields=
+RENTAL_ITEM_COLUMNS = (
+    "ID",
+    "PurchaseOrder",
+    "Name",
+    "Price",
+    "Location",
+    "Quantity",
+    "Size",
+    "Availability",
+    "Status",
+    "Picture",
+)
+
+
+# A member's reserved items (also used by GET /members/<id>/dashboard)
+MEMBER_RESERVATIONS_QUERY = """
+    SELECT GearReservation.ID, Name, CheckOutDate, ReturnDate FROM GearReservation JOIN GearReservationItems ON GearReservation.ID = GearReservationItems.Reservation
+         JOIN RentalItem ON GearReservationItems.Item = RentalItem.ID
+         WHERE Member = %s;
+    """
+
 
 # ------------------------------------------------------------
 # GET / - Browse available gear
 @gear_bp.route("/", methods=["GET"])
+@cached(tags=("RentalItem",))
 def get_rental_items():
-    # Stub: Return empty list or placeholder data
-    query = """
-    SELECT * FROM RentalItem;
+    query = f"""
+    SELECT {select_columns(RENTAL_ITEM_COLUMNS)} FROM RentalItem;
     """
-    return execute_query(query)
+    return execute_query(query, keyset=("ID",))
 
 
 # ------------------------------------------------------------
@@ -47,8 +76,8 @@ def post_rental_item():
 # GET /<id> - Browse specific item
 @gear_bp.route("/<int:item_id>", methods=["GET"])
 def get_rental_item(item_id):
-    query = """
-    SELECT * FROM RentalItem WHERE ID = %s;
+    query = f"""
+    SELECT {select_columns(RENTAL_ITEM_COLUMNS)} FROM RentalItem WHERE ID = %s;
     """
     return execute_query(query, (item_id,))
 
@@ -81,7 +110,7 @@ def get_gear_reservations():
     SELECT * FROM GearReservation JOIN GearReservationItems ON GearReservation.ID = GearReservationItems.Reservation
          JOIN RentalItem ON GearReservationItems.Item = RentalItem.ID;
     """
-    return execute_query(query)
+    return stream_query(query)
 
 
 # ------------------------------------------------------------
@@ -94,14 +123,15 @@ def reserve_gear():
     VALUES (%s, %s, %s);
     """
     params = (data["user_id"], data["start_date"], data["end_date"])
-    execute_update(query, params)
-    # Now do the joiner-table insert
-    query = """
-    INSERT INTO GearReservationItems (Reservation, Item)
-    VALUES (LAST_INSERT_ID(), %s);
-    """
-    params = (data["item_id"],)
-    execute_update(query, params)
+    with transaction():
+        execute_update(query, params)
+        # Now do the joiner-table insert
+        query = """
+        INSERT INTO GearReservationItems (Reservation, Item)
+        VALUES (LAST_INSERT_ID(), %s);
+        """
+        params = (data["item_id"],)
+        execute_update(query, params)
 
     return jsonify({"message": "Gear reserved"}), 200
 
@@ -110,12 +140,7 @@ def reserve_gear():
 # GET /reservations/<member_id> - Get all member's gear reservations
 @gear_bp.route("/reservations/<int:member_id>", methods=["GET"])
 def get_gear_reservation(member_id):
-    query = """
-    SELECT GearReservation.ID, Name, CheckOutDate, ReturnDate FROM GearReservation JOIN GearReservationItems ON GearReservation.ID = GearReservationItems.Reservation
-         JOIN RentalItem ON GearReservationItems.Item = RentalItem.ID
-         WHERE Member = %s;
-    """
-    return execute_query(query, (member_id,))
+    return execute_query(MEMBER_RESERVATIONS_QUERY, (member_id,))
 
 
 # PUT /reservations/<reservation_id>/<status> - Update gear reservation status
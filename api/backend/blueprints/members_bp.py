@@ -1,18 +1,103 @@
 from flask import Blueprint, jsonify, request
 
-from backend.utils.db_utils import execute_query, execute_update
+from backend.blueprints.elections_bp import (
+    MEMBER_BALLOTS_QUERY,
+    PENDING_NOMINATIONS_QUERY,
+)
+from backend.blueprints.gear_bp import MEMBER_RESERVATIONS_QUERY
+from backend.utils.db_utils import (
+    execute_many,
+    execute_query,
+    execute_update,
+    stream_query,
+    transaction,
+)
+from backend.utils import tabular
+from backend.utils.fields import column_list, requested_fields
+from backend.utils.tabular import TabularError
 from backend.db_connection import db
 
 members_bp = Blueprint("members", __name__)
 
+# Columns clients may pick with ?fields= (Allergies is aggregated)
+MEMBER_COLUMNS = (
+    "ID",
+    "FirstName",
+    "LastName",
+    "PreferredName",
+    "GraduationYear",
+    "IsGradStudent",
+    "ActivationDate",
+    "CarPlate",
+    "CarState",
+    "CarPassCount",
+    "EmerContactName",
+    "EmerContactPhone",
+)
+MEMBER_FIELDS = MEMBER_COLUMNS + ("Allergies",)
+
+# Upper bound on IDs resolved by one ?ids= / POST /members/lookup call
+MAX_LOOKUP_IDS = 1000
+
+# How many upcoming events / recent messages the dashboard includes
+DASHBOARD_UPCOMING_EVENTS = 4
+DASHBOARD_RECENT_MESSAGES = 5
+
+
+def member_query(fields=None, where=""):
+    """
+    SELECT for members with their allergy names aggregated, narrowed to
+    `fields` (see requested_fields) and filtered by the `where` clause.
+    The allergy joins are skipped when Allergies isn't requested.
+    """
+    if fields is None:
+        columns = "M.*"
+    else:
+        columns = column_list([f for f in fields if f != "Allergies"], "M")
+        if "Allergies" not in fields:
+            return f"SELECT {columns} FROM Member M {where} ORDER BY M.ID"
+    return f"""
+    SELECT {columns}, COALESCE(GROUP_CONCAT(A.Name), '') as Allergies
+    FROM Member M
+    LEFT JOIN AllergyUsers AU ON M.ID = AU.UserID
+    LEFT JOIN Allergy A ON AU.AllergyID = A.ID
+    {where}
+    GROUP BY M.ID
+    ORDER BY M.ID
+    """
 
-# POST /members - Create new member
-@members_bp.route("/", methods=["POST"])
-def post_member():
-    data = request.json
-    if not data:
-        return jsonify({"error": "No data provided"}), 400
 
+MEMBER_INSERT = """
+INSERT INTO Member (
+    FirstName, LastName, PreferredName, GraduationYear,
+    IsGradStudent, ActivationDate, CarPlate, CarState,
+    CarPassCount, EmerContactName, EmerContactPhone
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Upper bound on rows accepted by one POST /members/bulk upload, and how
+# many rows are validated and inserted at a time
+MAX_BULK_MEMBERS = 5000
+BULK_BATCH_SIZE = 500
+
+# Roster export; columns match the POST /members / bulk upload fields
+MEMBER_EXPORT_QUERY = """
+SELECT ID AS id, FirstName AS first_name, LastName AS last_name,
+    PreferredName AS preferred_name, GraduationYear AS graduation_year,
+    IsGradStudent AS is_grad_student, ActivationDate AS activation_date,
+    CarPlate AS car_plate, CarState AS car_state,
+    CarPassCount AS car_pass_count, EmerContactName AS emer_contact_name,
+    EmerContactPhone AS emer_contact_phone
+FROM Member
+ORDER BY ID
+"""
+
+
+def member_values(data):
+    """
+    Validate a new member's fields (the POST /members body) and return the
+    MEMBER_INSERT parameters. Raises ValueError with a client-facing message.
+    """
     # Required fields
     required_fields = [
         "first_name",
@@ -22,7 +107,7 @@ def post_member():
     ]
     for field in required_fields:
         if field not in data or not data[field]:
-            return jsonify({"error": f"{field} is required"}), 400
+            raise ValueError(f"{field} is required")
 
     # Extract and validate data
     first_name = data["first_name"].strip()
@@ -52,51 +137,76 @@ def post_member():
     # Validate car data consistency
     has_car_data = any([car_plate, car_state, car_pass_count is not None])
     if has_car_data and not all([car_plate, car_state, car_pass_count is not None]):
-        return (
-            jsonify(
-                {
-                    "error": "If providing car information, all car fields (plate, state, pass_count) are required"
-                }
-            ),
-            400,
+        raise ValueError(
+            "If providing car information, all car fields (plate, state, pass_count) are required"
         )
 
-    try:
-        cursor = db.get_db().cursor()
+    return (
+        first_name,
+        last_name,
+        preferred_name,
+        graduation_year,
+        is_grad_student,
+        activation_date,
+        car_plate,
+        car_state,
+        car_pass_count,
+        emer_contact_name,
+        emer_contact_phone,
+    )
 
-        # Get the next available ID by finding max ID and adding 1
-        cursor.execute("SELECT COALESCE(MAX(ID), 0) + 1 as next_id FROM Member")
-        next_id = cursor.fetchone()["next_id"]
-
-        # Insert member with manual ID
-        insert_query = """
-        INSERT INTO Member (
-            ID, FirstName, LastName, PreferredName, GraduationYear, 
-            IsGradStudent, ActivationDate, CarPlate, CarState, 
-            CarPassCount, EmerContactName, EmerContactPhone
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
 
-        values = (
-            next_id,  # Include the calculated ID as first value
-            first_name,
-            last_name,
-            preferred_name,
-            graduation_year,
-            is_grad_student,
-            activation_date,
-            car_plate,
-            car_state,
-            car_pass_count,
-            emer_contact_name,
-            emer_contact_phone,
-        )
+def roster_member(row):
+    """
+    Turn a roster upload row (CSV or Parquet, columns named like the
+    POST /members fields) into the dict member_values() expects: blank
+    cells become None, numbers are parsed and is_grad_student accepts
+    1/0, true/false, yes/no.
+    """
+    data = {}
+    for key, value in row.items():
+        if key is None:
+            raise ValueError("Row has more cells than the header")
+        if isinstance(value, str):
+            value = value.strip() or None
+        data[key.strip().lower()] = value
+
+    for field in ("graduation_year", "car_pass_count"):
+        value = data.get(field)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if value is not None:
+            try:
+                data[field] = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{field} must be a whole number")
 
-        cursor.execute(insert_query, values)
-        db.get_db().commit()
+    grad = data.get("is_grad_student")
+    if not isinstance(grad, bool):
+        grad = str(grad if grad is not None else "false").lower()
+        if grad not in ("1", "0", "true", "false", "yes", "no"):
+            raise ValueError("is_grad_student must be true/false")
+        data["is_grad_student"] = grad in ("1", "true", "yes")
+    return data
+
+
+# POST /members - Create new member
+@members_bp.route("/", methods=["POST"])
+def post_member():
+    data = request.json
+    if not data:
+        return jsonify({"error": "No data provided"}), 400
 
+    try:
+        values = member_values(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        # The ID comes from AUTO_INCREMENT, so concurrent sign-ups can't collide
+        member_id = execute_update(MEMBER_INSERT, values)
         return (
-            jsonify({"message": "Member created successfully", "member_id": next_id}),
+            jsonify({"message": "Member created successfully", "member_id": member_id}),
             201,
         )
 
@@ -105,66 +215,227 @@ def post_member():
         return jsonify({"error": f"Database error: {str(e)}"}), 500
 
 
-# GET /members - View all members
+class _UploadRejected(Exception):
+    """Rolls back a bulk upload that had invalid rows."""
+
+
+# POST /members/bulk - Create members from a roster CSV/Parquet upload
+@members_bp.route("/bulk", methods=["POST"])
+def post_members_bulk():
+    """
+    The file comes as a multipart upload named "file" or as the request
+    body (Content-Type text/csv or application/vnd.apache.parquet). Its
+    columns use the POST /members field names; extra columns such as the
+    "id" of an export are ignored.
+
+    Rows are read and validated BULK_BATCH_SIZE at a time and each batch
+    is inserted with one multi-row INSERT, all inside one transaction.
+    Invalid rows come back in "errors" by row number. By default any
+    invalid row rolls the whole upload back; with ?partial=true the valid
+    rows are kept.
+    """
+    partial = request.args.get("partial", "").lower() in ("1", "true", "yes")
+    member_ids, errors, seen = [], [], 0
+
+    try:
+        with transaction():
+            for batch in tabular.iter_upload(BULK_BATCH_SIZE):
+                seen = batch[-1][0]
+                if seen > MAX_BULK_MEMBERS:
+                    raise TabularError(f"At most {MAX_BULK_MEMBERS} members per upload")
+                rows = []
+                for number, row in batch:
+                    try:
+                        rows.append(member_values(roster_member(row)))
+                    except ValueError as e:
+                        errors.append({"row": number, "error": str(e)})
+                member_ids.extend(execute_many(MEMBER_INSERT, rows))
+            if errors and not partial:
+                raise _UploadRejected()
+    except _UploadRejected:
+        return jsonify({"error": "No members were created", "errors": errors}), 400
+    except TabularError:
+        raise
+    except Exception as e:
+        return jsonify({"error": f"Database error: {str(e)}"}), 500
+
+    if not seen:
+        return jsonify({"error": "Upload has no member rows"}), 400
+
+    return (
+        jsonify(
+            {
+                "message": f"Created {len(member_ids)} members",
+                "member_ids": member_ids,
+                "errors": errors,
+            }
+        ),
+        201,
+    )
+
+
+# GET /members/export - Download the roster as CSV (default) or Parquet
+@members_bp.route("/export", methods=["GET"])
+def export_members():
+    """
+    Streams every member with the POST /members field names as columns
+    (plus id), so an export can be edited and uploaded to /members/bulk.
+    """
+    fmt = request.args.get("format", "csv")
+    return tabular.stream_export(
+        MEMBER_EXPORT_QUERY, fmt=fmt, filename="members", chunk_size=BULK_BATCH_SIZE
+    )
+
+
+# GET /members - View all members (or ?ids=1,2,3 to look up several)
 @members_bp.route("/", methods=["GET"])
 def get_members():
-    cursor = db.get_db().cursor()
-    # Fetch all members
-    query = """
-    SELECT * FROM Member;
+    if "ids" in request.args:
+        return lookup_members(request.args["ids"].split(","))
+
+    # Members with their allergy names aggregated in the same query, streamed
+    # straight from the cursor as {"members": [...]}
+    query = member_query(requested_fields(MEMBER_FIELDS))
+    return stream_query(query, envelope="members", keyset=("ID",))
+
+
+# POST /members/lookup - Look up many members at once ({"ids": [...]}),
+# for lists too long for a query string
+@members_bp.route("/lookup", methods=["POST"])
+def post_members_lookup():
+    data = request.json
+    if not data or not isinstance(data.get("ids"), list):
+        return jsonify({"error": "ids must be a list of member IDs"}), 400
+    return lookup_members(data["ids"])
+
+
+def lookup_members(raw_ids):
     """
-    cursor.execute(query)
-    members = cursor.fetchall()
-    # Build a mapping of member_id -> list of allergy names
-    allergies_query = """
-    SELECT M.ID as member_id, GROUP_CONCAT(A.Name) as Allergies
-    FROM Member M
-    LEFT JOIN AllergyUsers AU ON M.ID = AU.UserID
-    LEFT JOIN Allergy A ON AU.AllergyID = A.ID
-    GROUP BY M.ID;
+    Resolve any number of member IDs in one query. Returns
+    {"members": {id: member}, "missing": [ids not found]}.
     """
-    cursor.execute(allergies_query)
-    allergies_map = {
-        row["member_id"]: row["Allergies"] or "" for row in cursor.fetchall()
-    }
-
-    # Attach allergies to each member
-    members_with_allergies = []
-    for member in members:
-        member_id = member["ID"]
-        member["Allergies"] = allergies_map.get(member_id, "")
-        members_with_allergies.append(member)
+    try:
+        ids = sorted({int(str(member_id).strip()) for member_id in raw_ids})
+    except ValueError:
+        return jsonify({"error": "ids must be integers"}), 400
+    if not ids:
+        return jsonify({"error": "At least one member ID is required"}), 400
+    if len(ids) > MAX_LOOKUP_IDS:
+        return (
+            jsonify({"error": f"At most {MAX_LOOKUP_IDS} IDs per lookup"}),
+            400,
+        )
 
-    return jsonify({"members": members_with_allergies}), 200
+    placeholders = ", ".join(["%s"] * len(ids))
+    query = member_query(
+        requested_fields(MEMBER_FIELDS), f"WHERE M.ID IN ({placeholders})"
+    )
+    cursor = db.get_db().cursor()
+    cursor.execute(query, ids)
+    members = {row["ID"]: row for row in cursor.fetchall()}
+    missing = [member_id for member_id in ids if member_id not in members]
+    return jsonify({"members": members, "missing": missing}), 200
 
 
 # GET /members/<int:member_id> - View specific member
 @members_bp.route("/<int:member_id>", methods=["GET"])
 def get_member(member_id):
     cursor = db.get_db().cursor()
-    # Fetch member
-    member_query = """
-  SELECT * FROM Member WHERE ID = %s;
-  """
-    cursor.execute(member_query, (member_id,))
+    query = member_query(requested_fields(MEMBER_FIELDS), "WHERE M.ID = %s")
+    cursor.execute(query, (member_id,))
     member = cursor.fetchone()
     if not member:
         return jsonify({"error": "Member not found"}), 404
 
-    # Fetch allergies for this member
-    allergies_query = """
-  SELECT GROUP_CONCAT(A.Name) as Allergies
-  FROM AllergyUsers AU
-  LEFT JOIN Allergy A ON AU.AllergyID = A.ID
-  WHERE AU.UserID = %s;
-  """
-    cursor.execute(allergies_query, (member_id,))
-    allergies_row = cursor.fetchone()
-    member["Allergies"] = allergies_row["Allergies"] or ""
-
     return jsonify({"member": member}), 200
 
 
+# GET /members/<int:member_id>/dashboard - Everything Member_Home shows, in
+# one response: member, gear reservations, RSVPs (with their events),
+# upcoming events, recent messages, pending nominations and ballots.
+# All sections are read on the request's one pooled connection.
+@members_bp.route("/<int:member_id>/dashboard", methods=["GET"])
+def get_member_dashboard(member_id):
+    cursor = db.get_db().cursor()
+
+    cursor.execute(member_query(where="WHERE M.ID = %s"), (member_id,))
+    member = cursor.fetchone()
+    if not member:
+        return jsonify({"error": "Member not found"}), 404
+
+    cursor.execute(MEMBER_RESERVATIONS_QUERY, (member_id,))
+    gear_reservations = cursor.fetchall()
+
+    cursor.execute(
+        """
+    SELECT R.ID, R.Event, R.CanBringCar, R.AvailStart, R.AvailEnd,
+           E.Name, E.EventDate, E.EventLoc, E.MeetLoc, E.EventType, E.RecItems
+    FROM RSVP R
+    JOIN Event E ON R.Event = E.ID
+    WHERE R.Member = %s
+    ORDER BY E.EventDate, R.ID;
+    """,
+        (member_id,),
+    )
+    rsvps = cursor.fetchall()
+
+    cursor.execute(
+        """
+    SELECT ID, Name, EventDate, EventLoc, MeetLoc, EventType,
+           DATEDIFF(EventDate, CURDATE()) as DaysUntil
+    FROM Event
+    WHERE EventDate >= CURDATE()
+    ORDER BY EventDate, ID
+    LIMIT %s;
+    """,
+        (DASHBOARD_UPCOMING_EVENTS,),
+    )
+    upcoming_events = cursor.fetchall()
+
+    # Recent messages plus the total in one pass
+    cursor.execute(
+        """
+    SELECT c.ID, c.Subject, c.DateSent, COUNT(*) OVER () as Total
+    FROM Communication c
+    JOIN CommunicationRecipients cr ON c.ID = cr.Communication
+    WHERE cr.Member = %s
+    ORDER BY c.DateSent DESC, c.ID DESC
+    LIMIT %s;
+    """,
+        (member_id, DASHBOARD_RECENT_MESSAGES),
+    )
+    messages = cursor.fetchall()
+    message_count = messages[0]["Total"] if messages else 0
+    for message in messages:
+        del message["Total"]
+
+    cursor.execute(PENDING_NOMINATIONS_QUERY, (member_id,))
+    pending_nominations = cursor.fetchall()
+
+    cursor.execute(MEMBER_BALLOTS_QUERY, (member_id,))
+    ballots = cursor.fetchall()
+
+    return (
+        jsonify(
+            {
+                "member": member,
+                "gear_reservations": gear_reservations,
+                "rsvps": rsvps,
+                "upcoming_events": upcoming_events,
+                "messages": messages,
+                "pending_nominations": pending_nominations,
+                "ballots": ballots,
+                "counts": {
+                    "gear_reservations": len(gear_reservations),
+                    "rsvps": len(rsvps),
+                    "messages": message_count,
+                },
+            }
+        ),
+        200,
+    )
+
+
 # PUT /members/<int:member_id> - Update member details
 @members_bp.route("/<int:member_id>", methods=["PUT"])
 def update_member(member_id):
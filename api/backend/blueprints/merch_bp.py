@@ -2,7 +2,14 @@
 # Sample customers blueprint of endpoints
 # Remove this file if you are not using it in your project
 ########################################################
-from backend.utils.db_utils import execute_query, execute_update
+from backend.utils.cache import cached
+from backend.utils.fields import select_columns
+from backend.utils.db_utils import (
+    execute_query,
+    execute_update,
+    stream_query,
+    transaction,
+)
 from backend.db_connection import db
 from flask import Blueprint, current_app, jsonify, make_response, request
 
@@ -11,16 +18,27 @@ from flask import Blueprint, current_app, jsonify, make_response, request
 # routes.
 merch_bp = Blueprint("merch", __name__)
 
+# Columns clients may pick with ?fields=
+MERCH_ITEM_COLUMNS = (
+    "ID",
+    "PurchaseOrder",
+    "Price",
+    "Quantity",
+    "Name",
+    "Description",
+    "Location",
+)
+
 
 # ------------------------------------------------------------
 # GET /merch-items - Browse available merch
 @merch_bp.route("/", methods=["GET"])
+@cached(tags=("MerchItem",))
 def get_merch_items():
-    # Stub: Return empty list or placeholder data
-    query = """
-   SELECT * FROM MerchItem;
+    query = f"""
+   SELECT {select_columns(MERCH_ITEM_COLUMNS)} FROM MerchItem;
    """
-    return execute_query(query)
+    return execute_query(query, keyset=("ID",))
 
 
 # ------------------------------------------------------------
@@ -28,9 +46,9 @@ def get_merch_items():
 @merch_bp.route("/<int:item_id>", methods=["GET"])
 def get_merch_item(item_id):
     query = f"""
-    SELECT * FROM MerchItem WHERE ID = {item_id};
+    SELECT {select_columns(MERCH_ITEM_COLUMNS)} FROM MerchItem WHERE ID = %s;
     """
-    return execute_query(query)
+    return execute_query(query, (item_id,))
 
 
 # ------------------------------------------------------------
@@ -68,15 +86,16 @@ def post_merch_item():
 def post_merch_sale():
     data = request.json
 
-    # 1. Insert into MerchSale (Cash, SaleDate auto)
-    sale_id = execute_update(
-        "INSERT INTO MerchSale (Cash) VALUES (%s);", (data["cash"],)
-    )
+    with transaction():
+        # 1. Insert into MerchSale (Cash, SaleDate auto)
+        sale_id = execute_update(
+            "INSERT INTO MerchSale (Cash) VALUES (%s);", (data["cash"],)
+        )
 
-    execute_update(
-        "INSERT INTO MerchSaleItems (MerchItem, MerchSale) VALUES (%s, %s);",
-        (data["ID"], sale_id),
-    )
+        execute_update(
+            "INSERT INTO MerchSaleItems (MerchItem, MerchSale) VALUES (%s, %s);",
+            (data["ID"], sale_id),
+        )
 
     return jsonify({"sale_id": sale_id, "status": "success"}), 200
 
@@ -107,4 +126,4 @@ def merch_report():
   JOIN MerchItem ON MerchSaleItems.MerchItem = MerchItem.ID
   GROUP BY MerchSale.ID;
   """
-    return execute_query(query)
+    return stream_query(query)
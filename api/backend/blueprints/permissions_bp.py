@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request
 
+from backend.utils.cache import cached
 from backend.utils.db_utils import execute_query
 
 permissions_bp = Blueprint("permissions", __name__)
@@ -92,6 +93,7 @@ def create_permission():
 
 # GET /permissions - List all permissions
 @permissions_bp.route("/", methods=["GET"])
+@cached(tags=("Permission",))
 def list_permissions():
     query = """
     SELECT * FROM Permission;
@@ -1,17 +1,34 @@
 from flask import Blueprint, jsonify, request
 
-from backend.utils.db_utils import execute_query, execute_update
+from backend.utils.db_utils import (
+    execute_many,
+    execute_query,
+    execute_update,
+    stream_query,
+    transaction,
+)
+from backend.utils.fields import select_columns
 
 reimbursements_bp = Blueprint("reimbursements", __name__)
 
+# Columns clients may pick with ?fields=
+REIMBURSEMENT_COLUMNS = (
+    "ID",
+    "MemberID",
+    "Total",
+    "Type",
+    "Description",
+    "Status",
+)
+
 
 # GET /reimbursements - Reimbursement Overview
 @reimbursements_bp.route("/", methods=["GET"])
 def reimbursement_overview():
-    query = """
-    SELECT * FROM Reimbursement;
+    query = f"""
+    SELECT {select_columns(REIMBURSEMENT_COLUMNS)} FROM Reimbursement;
     """
-    return execute_query(query)
+    return stream_query(query, keyset=("ID",))
 
 
 # POST /reimbursements - Submit reimbursement
@@ -38,18 +55,18 @@ def submit_reimbursement():
     query = """
     INSERT INTO Reimbursement (MemberID, Total, Type) VALUES (%s, %s, %s);
     """
-    reimbursement_id = execute_update(query, (member_id, total, description))
-
-    # Insert each item into ReimbursementItem
-    item_values = ", ".join(
-        f"({reimbursement_id}, '{item['description']}', {item['price']})"
-        for item in items
-    )
-    item_query = f"""
+    item_query = """
     INSERT INTO ReimbursementItem (Reimbursement, Description, Price)
-    VALUES {item_values};
+    VALUES (%s, %s, %s);
     """
-    execute_update(item_query)
+    with transaction():
+        reimbursement_id = execute_update(query, (member_id, total, description))
+
+        # Insert all items into ReimbursementItem in one batch
+        execute_many(
+            item_query,
+            [(reimbursement_id, item["description"], item["price"]) for item in items],
+        )
     return jsonify({"reimbursement_id": reimbursement_id, "status": "Pending"}), 201
 
 
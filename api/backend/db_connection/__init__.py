@@ -1,9 +1,63 @@
 # ------------------------------------------------------------
 # This file creates a shared DB connection resource
 # ------------------------------------------------------------
+from flask import g
 from flaskext.mysql import MySQL
-from pymysql import cursors
+
+from backend.db_connection.instrumentation import InstrumentedDictCursor
+from backend.db_connection.pool import ConnectionPool, PoolTimeout
+
+__all__ = ["PooledMySQL", "PoolTimeout", "db"]
+
+
+class PooledMySQL(MySQL):
+    """
+    flaskext.mysql's MySQL, but get_db() checks a connection out of a bounded
+    pool instead of opening a new one for every app context. The connection is
+    returned to the pool when the app context is torn down.
+    """
+
+    def __init__(self, app=None, prefix="mysql", **connect_args):
+        self.pool = None
+        super().__init__(app, prefix, **connect_args)
+
+    def init_app(self, app):
+        super().init_app(app)
+        app.config.setdefault("MYSQL_POOL_MIN_SIZE", 1)
+        app.config.setdefault("MYSQL_POOL_MAX_SIZE", 10)
+        app.config.setdefault("MYSQL_POOL_MAX_AGE", 1800)
+        app.config.setdefault("MYSQL_POOL_MAX_IDLE", 300)
+        app.config.setdefault("MYSQL_POOL_TIMEOUT", 10)
+        self.pool = ConnectionPool(
+            self.connect,
+            min_size=app.config["MYSQL_POOL_MIN_SIZE"],
+            max_size=app.config["MYSQL_POOL_MAX_SIZE"],
+            max_age=app.config["MYSQL_POOL_MAX_AGE"],
+            max_idle=app.config["MYSQL_POOL_MAX_IDLE"],
+            timeout=app.config["MYSQL_POOL_TIMEOUT"],
+        )
+        app.teardown_appcontext(self.release_db)
+
+    def teardown_request(self, exception):
+        # Connections now live for the whole app context; see release_db
+        pass
+
+    def get_db(self):
+        if "mysql_conn" not in g:
+            g.mysql_conn = self.pool.acquire()
+        return g.mysql_conn
+
+    def release_db(self, exception):
+        conn = g.pop("mysql_conn", None)
+        if conn is not None:
+            self.pool.release(conn)
+
+    def stats(self):
+        """Pool counters: checkouts, wait time, connections created, etc."""
+        return self.pool.stats() if self.pool else {}
+
 
 # the parameter instructs the connection to return data
-# as a dictionary object.
-db = MySQL(cursorclass=cursors.DictCursor)
+# as a dictionary object. The instrumented cursor also records
+# per-request query stats (see instrumentation.py).
+db = PooledMySQL(cursorclass=InstrumentedDictCursor)
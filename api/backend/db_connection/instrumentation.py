@@ -0,0 +1,124 @@
+# ------------------------------------------------------------
+# Per-request SQL instrumentation.
+#
+# Every cursor handed out by db.get_db() is an instrumented cursor
+# that times each statement and records it on flask.g. After the
+# request, the totals go out as a Server-Timing header, and any
+# statement slower than DB_SLOW_QUERY_MS is logged as JSON.
+# ------------------------------------------------------------
+import json
+import time
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from pymysql import cursors
+
+from backend.utils import cache
+
+
+class QueryStats:
+    """Query counters for a single request."""
+
+    __slots__ = ("count", "total_time", "rows", "slowest_sql", "slowest_time")
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.rows = 0
+        self.slowest_sql = None
+        self.slowest_time = 0.0
+
+    def add(self, sql, elapsed, rows):
+        self.count += 1
+        self.total_time += elapsed
+        self.rows += max(rows, 0)
+        if elapsed >= self.slowest_time:
+            self.slowest_sql = sql
+            self.slowest_time = elapsed
+
+    def as_dict(self):
+        return {
+            "query_count": self.count,
+            "db_time_ms": round(self.total_time * 1000, 2),
+            "rows": self.rows,
+            "slowest_ms": round(self.slowest_time * 1000, 2),
+            "slowest_sql": self.slowest_sql,
+        }
+
+
+def get_query_stats():
+    """Return the QueryStats for the current app context, creating it if needed."""
+    if "query_stats" not in g:
+        g.query_stats = QueryStats()
+    return g.query_stats
+
+
+def _compact(sql):
+    return " ".join(str(sql).split())
+
+
+def _record(sql, elapsed, rows):
+    if not has_app_context():
+        return
+    get_query_stats().add(sql, elapsed, rows)
+
+    threshold = current_app.config.get("DB_SLOW_QUERY_MS")
+    if threshold is not None and elapsed * 1000 >= threshold:
+        entry = {
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 2),
+            "rows": rows,
+            "sql": _compact(sql),
+        }
+        if has_request_context():
+            entry.update(
+                method=request.method, path=request.path, endpoint=request.endpoint
+            )
+        current_app.logger.warning(json.dumps(entry, default=str))
+
+
+class InstrumentedCursorMixin:
+    """Times execute() (executemany() goes through it too) on any PyMySQL cursor."""
+
+    def execute(self, query, args=None):
+        started = time.perf_counter()
+        try:
+            result = super().execute(query, args)
+        finally:
+            # Unbuffered cursors don't know their row count up front
+            rows = -1 if isinstance(self, cursors.SSCursor) else self.rowcount
+            _record(query, time.perf_counter() - started, rows)
+        cache.note_write(query)
+        return result
+
+
+class InstrumentedDictCursor(InstrumentedCursorMixin, cursors.DictCursor):
+    pass
+
+
+class InstrumentedSSDictCursor(InstrumentedCursorMixin, cursors.SSDictCursor):
+    """Unbuffered (server-side) dict cursor used for streaming responses."""
+
+
+def init_app(app):
+    """Register the hooks that report per-request query stats."""
+    app.config.setdefault("DB_SLOW_QUERY_MS", 200)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def add_server_timing(response):
+        stats = get_query_stats()
+        timings = [f'db;dur={stats.total_time * 1000:.2f};desc="{stats.count} queries"']
+        if "request_started" in g:
+            total = time.perf_counter() - g.request_started
+            timings.append(f"app;dur={total * 1000:.2f}")
+        response.headers.add("Server-Timing", ", ".join(timings))
+
+        if stats.count:
+            summary = {"event": "request_db_summary", "path": request.path}
+            summary.update(stats.as_dict())
+            summary["slowest_sql"] = _compact(summary["slowest_sql"])
+            current_app.logger.debug(json.dumps(summary, default=str))
+        return response
@@ -0,0 +1,239 @@
+# ------------------------------------------------------------
+# A small bounded connection pool for PyMySQL connections.
+#
+# Connections are created lazily up to max_size, health checked
+# (ping) when they are checked out, and recycled once they are
+# older than max_age or have been idle for longer than max_idle.
+# Callers that find the pool exhausted wait up to `timeout`
+# seconds for a connection to be released.
+# ------------------------------------------------------------
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the wait timeout."""
+
+
+class _Slot:
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        factory,
+        min_size=1,
+        max_size=10,
+        max_age=1800,
+        max_idle=300,
+        timeout=10,
+    ):
+        """
+        Args:
+            factory: zero-argument callable returning a new PyMySQL connection
+            min_size: idle connections kept warm even past max_idle
+            max_size: hard cap on open connections
+            max_age: seconds after which a connection is recycled (0 disables)
+            max_idle: seconds an idle connection may sit before it is closed
+            timeout: seconds to wait for a free connection before PoolTimeout
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_idle = max_idle
+        self.timeout = timeout
+
+        self._idle = deque()
+        self._in_use = {}
+        self._size = 0
+        self._cond = threading.Condition()
+        self._stats = {
+            "checkouts": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "health_check_failures": 0,
+            "timeouts": 0,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+
+    # ---------------------- checkout / checkin ----------------------
+    def acquire(self, timeout=None):
+        """Check out a healthy connection, waiting up to `timeout` seconds."""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+        stale = []
+
+        try:
+            with self._cond:
+                while True:
+                    slot = self._take_idle(stale)
+                    if slot is None and self._size < self.max_size:
+                        # Reserve the slot before releasing the lock to connect
+                        self._size += 1
+                        break
+                    if slot is not None:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(
+                            f"No database connection available after {timeout}s "
+                            f"(pool max_size={self.max_size})"
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+        finally:
+            # Closing is network I/O; never do it while holding the lock
+            for expired in stale:
+                self._close(expired)
+
+        if slot is None:
+            slot = self._create()
+        elif not self._healthy(slot):
+            self._discard(slot)
+            return self.acquire(max(deadline - time.monotonic(), 0))
+
+        wait_time = time.monotonic() - started
+        with self._cond:
+            slot.last_used = time.monotonic()
+            self._in_use[id(slot.conn)] = slot
+            self._stats["checkouts"] += 1
+            self._stats["wait_time_total"] += wait_time
+            self._stats["wait_time_max"] = max(self._stats["wait_time_max"], wait_time)
+            if waited:
+                self._stats["waits"] += 1
+        return slot.conn
+
+    def release(self, conn):
+        """Return a connection to the pool, discarding it if it is unusable."""
+        with self._cond:
+            slot = self._in_use.pop(id(conn), None)
+        if slot is None:
+            return
+
+        try:
+            # Never hand an open transaction to the next request
+            if conn.open:
+                conn.rollback()
+        except Exception:
+            pass
+
+        now = time.monotonic()
+        too_old = self.max_age and now - slot.created_at > self.max_age
+        if not conn.open or too_old:
+            self._discard(slot)
+            return
+
+        with self._cond:
+            slot.last_used = now
+            self._idle.append(slot)
+            self._cond.notify()
+
+    def close(self):
+        """Close every idle connection. Checked-out connections are closed on release."""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+        for slot in idle:
+            self._discard(slot)
+
+    def stats(self):
+        """Return a snapshot of pool counters and current occupancy."""
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot.update(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=len(self._in_use),
+                min_size=self.min_size,
+                max_size=self.max_size,
+            )
+        checkouts = snapshot["checkouts"]
+        snapshot["wait_time_avg"] = (
+            snapshot["wait_time_total"] / checkouts if checkouts else 0.0
+        )
+        return snapshot
+
+    # ---------------------- internals ----------------------
+    def _take_idle(self, stale):
+        """
+        Pop the most recently used idle slot. Expired ones are dropped from
+        the pool and appended to `stale` for the caller to close. Lock held.
+        """
+        now = time.monotonic()
+        # The oldest idle connections sit at the left; reap those first
+        while self._idle and self._expired(self._idle[0], now):
+            slot = self._idle.popleft()
+            self._forget_locked(slot)
+            stale.append(slot)
+        while self._idle:
+            slot = self._idle.pop()
+            if self._expired(slot, now):
+                self._forget_locked(slot)
+                stale.append(slot)
+                continue
+            return slot
+        return None
+
+    def _expired(self, slot, now):
+        if self.max_age and now - slot.created_at > self.max_age:
+            return True
+        if (
+            self.max_idle
+            and now - slot.last_used > self.max_idle
+            and self._size > self.min_size
+        ):
+            return True
+        return False
+
+    def _healthy(self, slot):
+        try:
+            slot.conn.ping(reconnect=False)
+            return True
+        except Exception:
+            with self._cond:
+                self._stats["health_check_failures"] += 1
+            return False
+
+    def _create(self):
+        try:
+            conn = self.factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["connections_created"] += 1
+        return _Slot(conn)
+
+    def _discard(self, slot):
+        with self._cond:
+            self._forget_locked(slot)
+            self._cond.notify()
+        self._close(slot)
+
+    def _forget_locked(self, slot):
+        """Stop counting `slot` toward the pool size. Lock held; close it after."""
+        self._size -= 1
+        self._stats["connections_closed"] += 1
+
+    @staticmethod
+    def _close(slot):
+        try:
+            slot.conn.close()
+        except Exception:
+            pass
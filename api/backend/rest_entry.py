@@ -15,14 +15,23 @@ from backend.blueprints import (
     permissions_bp,
     reimbursements_bp,
 )
-from backend.db_connection import db
+from backend.db_connection import PoolTimeout, db, instrumentation
+from backend.utils import cache, compression, conditional
+from backend.utils.fields import FieldsError
+from backend.utils.json_provider import FastJSONProvider
+from backend.utils.pagination import PaginationError
+from backend.utils.tabular import TabularError
 from dotenv import load_dotenv
-from flask import Flask
+from flask import Flask, jsonify
 
 
 def create_app():
     app = Flask(__name__)
 
+    # Serialize responses with orjson and ISO 8601 dates/datetimes
+    # (see utils/json_provider.py)
+    app.json = FastJSONProvider(app)
+
     # Configure logging
     # Create logs directory if it doesn't exist
     setup_logging(app)
@@ -50,10 +59,100 @@ def create_app():
         "DB_NAME"
     ).strip()  # Change this to your DB name
 
+    # Connection pool sizing and recycling (seconds for the time limits)
+    app.config["MYSQL_POOL_MIN_SIZE"] = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    app.config["MYSQL_POOL_MAX_SIZE"] = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    app.config["MYSQL_POOL_MAX_AGE"] = int(os.getenv("DB_POOL_MAX_AGE", "1800"))
+    app.config["MYSQL_POOL_MAX_IDLE"] = int(os.getenv("DB_POOL_MAX_IDLE", "300"))
+    app.config["MYSQL_POOL_TIMEOUT"] = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
     # Initialize the database object with the settings above.
     app.logger.info("current_app(): starting the database connection")
     db.init_app(app)
 
+    # Per-request query counts/timings, Server-Timing header and slow-query log
+    app.config["DB_SLOW_QUERY_MS"] = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+    instrumentation.init_app(app)
+
+    # Requests that can't get a pooled connection in time get a 503
+    @app.errorhandler(PoolTimeout)
+    def handle_pool_timeout(e):
+        app.logger.warning(f"DB pool exhausted: {db.stats()}")
+        return jsonify({"error": "Database busy, please retry"}), 503
+
+    # Page sizes for ?limit= / ?after= keyset pagination on collection routes
+    app.config["PAGINATION_DEFAULT_LIMIT"] = int(
+        os.getenv("PAGINATION_DEFAULT_LIMIT", "50")
+    )
+    app.config["PAGINATION_MAX_LIMIT"] = int(os.getenv("PAGINATION_MAX_LIMIT", "500"))
+
+    # Bad ?limit= / ?after= values on paginated collection routes
+    @app.errorhandler(PaginationError)
+    def handle_pagination_error(e):
+        return jsonify({"error": str(e)}), 400
+
+    # ?fields= naming columns outside a route's whitelist
+    @app.errorhandler(FieldsError)
+    def handle_fields_error(e):
+        return jsonify({"error": str(e)}), 400
+
+    @app.errorhandler(TabularError)
+    def handle_tabular_error(e):
+        return jsonify({"error": str(e)}), 400
+
+    # Pool counters for monitoring
+    @app.route("/health/db-pool", methods=["GET"])
+    def db_pool_stats():
+        return jsonify(db.stats()), 200
+
+    # Negotiated zstd/br/gzip compression (see utils/compression.py).
+    # Registered before the ETag hook so it runs after it.
+    app.config["COMPRESS_ENABLED"] = os.getenv("COMPRESS_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    app.config["COMPRESS_MIN_SIZE"] = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+    app.config["COMPRESS_ALGORITHMS"] = tuple(
+        name.strip()
+        for name in os.getenv("COMPRESS_ALGORITHMS", "zstd,br,gzip").split(",")
+    )
+    app.config["COMPRESS_GZIP_LEVEL"] = int(os.getenv("COMPRESS_GZIP_LEVEL", "4"))
+    app.config["COMPRESS_BR_LEVEL"] = int(os.getenv("COMPRESS_BR_LEVEL", "4"))
+    app.config["COMPRESS_ZSTD_LEVEL"] = int(os.getenv("COMPRESS_ZSTD_LEVEL", "3"))
+    compression.init_app(app)
+
+    # Tag-invalidated response cache for the read-mostly lookup routes
+    # (see utils/cache.py); counters at /health/cache
+    app.config["RESPONSE_CACHE_ENABLED"] = os.getenv(
+        "RESPONSE_CACHE_ENABLED", "true"
+    ).lower() in ("1", "true", "yes")
+    app.config["RESPONSE_CACHE_TTL"] = int(os.getenv("RESPONSE_CACHE_TTL", "300"))
+    app.config["RESPONSE_CACHE_MAX_ENTRIES"] = int(
+        os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024")
+    )
+    cache.init_app(app)
+
+    # Strong ETags on GET responses; If-None-Match gets a bodyless 304
+    # (see utils/conditional.py)
+    app.config["ETAG_ENABLED"] = os.getenv("ETAG_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    conditional.init_app(app)
+
+    # Live ballot results stream (see utils/pubsub.py): updates per second
+    # per ballot, seconds between tally reloads when no local vote lands,
+    # and how long one stream stays open before the client reconnects
+    app.config["LIVE_RESULTS_MAX_RATE"] = float(os.getenv("LIVE_RESULTS_MAX_RATE", "2"))
+    app.config["LIVE_RESULTS_POLL_INTERVAL"] = float(
+        os.getenv("LIVE_RESULTS_POLL_INTERVAL", "1")
+    )
+    app.config["LIVE_RESULTS_MAX_SECONDS"] = int(
+        os.getenv("LIVE_RESULTS_MAX_SECONDS", "300")
+    )
+
     # Register the routes from each Blueprint with the app object
     # and give a url prefix to each
     app.logger.info("create_app(): registering blueprints with Flask app object.")
@@ -0,0 +1,195 @@
+# ------------------------------------------------------------
+# Tag-based response cache for read-heavy, rarely-changing GETs.
+#
+# Routes opt in with @cached(tags=("Position",)). Responses are
+# keyed by path + query string, expire after a TTL, and the store
+# evicts least-recently-used entries past RESPONSE_CACHE_MAX_ENTRIES.
+#
+# Every write statement that goes through an instrumented cursor
+# (execute_update, execute_many and raw cursor.execute calls alike)
+# names its table; entries tagged with that table are evicted right
+# away and again when the request finishes, after its commit.
+#
+# The default store lives in each worker process, so with several
+# gunicorn workers a write only evicts the worker that served it and
+# the TTL bounds staleness elsewhere. A shared store can be plugged
+# in by passing any object with the MemoryCacheStore interface to
+# init_app().
+# ------------------------------------------------------------
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, g, has_app_context, jsonify, request
+
+from backend.utils import conditional
+
+_WRITE_RE = re.compile(
+    r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)"
+    r"\s+`?(\w+)`?",
+    re.I,
+)
+
+
+def written_table(sql):
+    """Return the table an INSERT/UPDATE/DELETE writes to, else None."""
+    match = _WRITE_RE.match(str(sql))
+    return match.group(1) if match else None
+
+
+class MemoryCacheStore:
+    """Thread-safe in-process LRU store with per-entry TTL and tags."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, tags, value)
+        self._by_tag = {}  # tag -> set of keys
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[2]
+
+    def set(self, key, value, ttl, tags):
+        tags = frozenset(tag.lower() for tag in tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, tags, value)
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def invalidate_tags(self, tags):
+        with self._lock:
+            for tag in tags:
+                for key in self._by_tag.pop(tag.lower(), ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def stats(self):
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["entries"] = len(self._entries)
+            snapshot["max_entries"] = self.max_entries
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_ratio"] = round(snapshot["hits"] / lookups, 4) if lookups else 0.0
+        return snapshot
+
+    def _remove(self, key):
+        _, tags, _ = self._entries.pop(key)
+        for tag in tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+
+def get_store():
+    return current_app.extensions["response_cache"]
+
+
+def note_write(sql):
+    """Called for every executed statement; evicts tags of written tables."""
+    if not has_app_context() or "response_cache" not in current_app.extensions:
+        return
+    table = written_table(sql)
+    if table:
+        get_store().invalidate_tags([table])
+        g.setdefault("cache_dirty_tables", set()).add(table)
+
+
+def cached(tags, ttl=None):
+    """Cache a GET route's 200 responses, tagged with the tables it reads."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET" or not current_app.config.get(
+                "RESPONSE_CACHE_ENABLED", True
+            ):
+                return view(*args, **kwargs)
+
+            store = get_store()
+            key = f"{request.path}?{request.query_string.decode()}"
+            hit = store.get(key)
+            if hit is not None:
+                body, status, headers = hit
+                response = current_app.response_class(
+                    body, status=status, headers=headers
+                )
+                response.headers["X-Cache"] = "HIT"
+                return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                # Hash once here so hits don't re-hash in conditional.py
+                response.set_etag(conditional.body_etag(response.get_data()))
+                headers = [
+                    (k, v)
+                    for k, v in response.headers.items()
+                    if k.lower() not in ("content-length", "server-timing", "x-cache")
+                ]
+                store.set(
+                    key,
+                    (response.get_data(), response.status_code, headers),
+                    ttl or current_app.config.get("RESPONSE_CACHE_TTL", 300),
+                    tags,
+                )
+            response.headers["X-Cache"] = "MISS"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def init_app(app, store=None):
+    """Attach a cache store and the end-of-request invalidation hook."""
+    app.config.setdefault("RESPONSE_CACHE_ENABLED", True)
+    app.config.setdefault("RESPONSE_CACHE_TTL", 300)
+    app.config.setdefault("RESPONSE_CACHE_MAX_ENTRIES", 1024)
+    app.extensions["response_cache"] = store or MemoryCacheStore(
+        app.config["RESPONSE_CACHE_MAX_ENTRIES"]
+    )
+
+    @app.teardown_request
+    def invalidate_written_tables(exception):
+        # A second pass after the request's commit, so a concurrent read
+        # can't keep a copy cached from before the write became visible
+        tables = g.pop("cache_dirty_tables", None)
+        if tables:
+            app.extensions["response_cache"].invalidate_tags(tables)
+
+    @app.route("/health/cache", methods=["GET"])
+    def response_cache_stats():
+        return jsonify(app.extensions["response_cache"].stats()), 200
@@ -0,0 +1,162 @@
+# ------------------------------------------------------------
+# Negotiated response compression.
+#
+# JSON/NDJSON/text responses are compressed with the best encoding
+# the client lists in Accept-Encoding, in COMPRESS_ALGORITHMS order
+# (zstd, br, gzip by default). brotli and zstandard are optional
+# packages; without them only gzip is offered.
+#
+# Buffered bodies smaller than COMPRESS_MIN_SIZE bytes go out as-is.
+# Streamed bodies (stream_query) are compressed chunk by chunk and
+# flushed after each chunk, so clients still see rows as they're read.
+#
+# Compressed responses get a weak ETag (W/"...") because the bytes
+# differ from the identity body the strong ETag was computed from;
+# If-None-Match still matches it (see conditional.py).
+# ------------------------------------------------------------
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/html",
+    "text/plain",
+    "text/csv",
+)
+
+
+class _Gzip:
+    def __init__(self, level):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._obj.compress(data)
+
+    def flush(self):
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _Brotli:
+    def __init__(self, level):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._obj.process(data)
+
+    def flush(self):
+        return self._obj.flush()
+
+    def finish(self):
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, level):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._obj.compress(data)
+
+    def flush(self):
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._obj.flush()
+
+
+def available_encodings():
+    encodings = {"gzip": _Gzip}
+    if brotli is not None:
+        encodings["br"] = _Brotli
+    if zstandard is not None:
+        encodings["zstd"] = _Zstd
+    return encodings
+
+
+def negotiate(accept_encodings, preferred, encodings):
+    """Pick the first of `preferred` the client accepts, or None."""
+    for name in preferred:
+        if name in encodings and accept_encodings.quality(name) > 0:
+            return name
+    return None
+
+
+def _compress_stream(chunks, compressor):
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            data = compressor.compress(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def init_app(app):
+    """
+    Register the after_request hook that compresses responses. Register it
+    before conditional.init_app so it runs after the ETag/304 handling.
+    """
+    app.config.setdefault("COMPRESS_ENABLED", True)
+    app.config.setdefault("COMPRESS_MIN_SIZE", 1024)
+    app.config.setdefault("COMPRESS_ALGORITHMS", ("zstd", "br", "gzip"))
+    app.config.setdefault("COMPRESS_GZIP_LEVEL", 4)
+    app.config.setdefault("COMPRESS_BR_LEVEL", 4)
+    app.config.setdefault("COMPRESS_ZSTD_LEVEL", 3)
+    encodings = available_encodings()
+
+    @app.after_request
+    def compress_response(response):
+        if (
+            not app.config["COMPRESS_ENABLED"]
+            or request.method == "HEAD"
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        name = negotiate(
+            request.accept_encodings, app.config["COMPRESS_ALGORITHMS"], encodings
+        )
+        if name is None:
+            return response
+        level = app.config[f"COMPRESS_{name.upper()}_LEVEL"]
+        compressor = encodings[name](level)
+
+        if response.is_streamed:
+            response.response = _compress_stream(response.response, compressor)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < app.config["COMPRESS_MIN_SIZE"]:
+                return response
+            response.set_data(compressor.compress(data) + compressor.finish())
+
+        response.headers["Content-Encoding"] = name
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
@@ -0,0 +1,38 @@
+# ------------------------------------------------------------
+# Conditional GET support.
+#
+# Every buffered 200 response to a GET/HEAD gets a strong ETag
+# (a hash of the body). A request whose If-None-Match matches it is
+# answered with 304 Not Modified and no body, so a client that kept
+# the earlier copy only pays for the headers. Streamed responses are
+# left alone: hashing them would mean buffering the whole body.
+# ------------------------------------------------------------
+import hashlib
+
+from flask import request
+
+
+def body_etag(data):
+    """Strong validator for a response body."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def init_app(app):
+    """Register the after_request hook that adds ETags and answers 304s."""
+    app.config.setdefault("ETAG_ENABLED", True)
+
+    @app.after_request
+    def add_etag(response):
+        if (
+            not app.config["ETAG_ENABLED"]
+            or request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or response.is_streamed
+        ):
+            return response
+
+        if not response.get_etag()[0]:
+            response.set_etag(body_etag(response.get_data()))
+        # Ask clients to revalidate rather than reuse a copy blindly
+        response.headers.setdefault("Cache-Control", "no-cache")
+        return response.make_conditional(request)
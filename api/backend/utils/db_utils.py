@@ -1,29 +1,173 @@
-from flask import jsonify, make_response
+import re
+from contextlib import contextmanager
+
+from flask import (
+    Response,
+    current_app,
+    g,
+    jsonify,
+    make_response,
+    request,
+    stream_with_context,
+)
 from backend.db_connection import db
+from backend.db_connection.instrumentation import InstrumentedSSDictCursor
+from backend.utils.pagination import add_page_headers, fetch_page, page_request
+
+_VALUES_RE = re.compile(r"\bVALUES\s*\(", re.I)
+
 
+def _split_insert(query):
+    """Split "INSERT ... VALUES (row) tail" into (head, row, tail)."""
+    query = query.strip().rstrip(";")
+    match = _VALUES_RE.search(query)
+    if not match or not query.upper().startswith("INSERT"):
+        raise ValueError("execute_many expects a single-row INSERT ... VALUES query")
+    start = match.end() - 1
+    depth = 0
+    for end in range(start, len(query)):
+        depth += {"(": 1, ")": -1}.get(query[end], 0)
+        if depth == 0:
+            return query[:start], query[start : end + 1], query[end + 1 :]
+    raise ValueError("Unbalanced parentheses in INSERT ... VALUES query")
+
+
+def execute_query(query, params=None, keyset=None):
+    """
+    Execute a SELECT query and return JSON response.
 
-def execute_query(query, params=None):
-    """Execute a SELECT query and return JSON response"""
+    Collection routes pass `keyset` (see utils/pagination.py) so clients can
+    page through them with ?limit=&after=.
+    """
     cursor = db.get_db().cursor()
-    cursor.execute(query, params or ())
-    data = cursor.fetchall()
+    if keyset:
+        data, next_cursor = fetch_page(cursor, query, params, keyset)
+    else:
+        cursor.execute(query, params or ())
+        data, next_cursor = cursor.fetchall(), None
     response = make_response(jsonify(data))
     response.status_code = 200
-    return response
+    return add_page_headers(response, next_cursor)
+
+
+def wants_ndjson():
+    """True if the client asked for newline-delimited JSON instead of an array."""
+    if request.args.get("format") == "ndjson":
+        return True
+    best = request.accept_mimetypes.best_match(
+        ["application/json", "application/x-ndjson"]
+    )
+    return best == "application/x-ndjson"
+
+
+def stream_query(query, params=None, envelope=None, keyset=None, chunk_size=500):
+    """
+    Execute a SELECT query on an unbuffered server-side cursor and stream the
+    rows back as they are read, so memory stays flat whatever the row count.
+
+    The body is a JSON array (wrapped as {envelope: [...]} when `envelope` is
+    given, to keep existing response shapes), or NDJSON with one row per line
+    when the client sends ?format=ndjson or Accept: application/x-ndjson.
+
+    A paginated request (see `keyset`) is bounded by its limit, so it is
+    answered from a regular buffered cursor with the next-page headers.
+    """
+    if keyset and page_request() is not None:
+        rows, next_cursor = fetch_page(db.get_db().cursor(), query, params, keyset)
+        response = make_response(jsonify({envelope: rows} if envelope else rows))
+        return add_page_headers(response, next_cursor)
+
+    ndjson = wants_ndjson()
+    dumps = current_app.json.dumps
+
+    def generate():
+        cursor = db.get_db().cursor(InstrumentedSSDictCursor)
+        try:
+            cursor.execute(query, params or ())
+            if not ndjson:
+                yield f'{{"{envelope}": [' if envelope else "["
+            first = True
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if ndjson:
+                    yield "".join(dumps(row) + "\n" for row in rows)
+                else:
+                    chunk = ",".join(dumps(row) for row in rows)
+                    yield chunk if first else "," + chunk
+                first = False
+            if not ndjson:
+                yield "]}" if envelope else "]"
+        finally:
+            # Drains any unread rows so the pooled connection is reusable
+            cursor.close()
+
+    mimetype = "application/x-ndjson" if ndjson else "application/json"
+    return Response(stream_with_context(generate()), status=200, mimetype=mimetype)
+
+
+def in_transaction():
+    """True while inside a transaction() block for the current request."""
+    return g.get("tx_depth", 0) > 0
+
+
+def _commit(conn):
+    # Inside transaction() the commit is deferred to the end of the block
+    if not in_transaction():
+        conn.commit()
+
+
+@contextmanager
+def transaction():
+    """
+    Group several execute_update/execute_many calls into one unit of work.
+
+    The outermost block commits once when it exits cleanly and rolls back if
+    an exception escapes. Nested blocks become savepoints, so an inner failure
+    that is caught by the caller only undoes the inner block's statements.
+
+        with transaction():
+            sale_id = execute_update("INSERT INTO MerchSale ...", ...)
+            execute_update("INSERT INTO MerchSaleItems ...", (item_id, sale_id))
+    """
+    conn = db.get_db()
+    depth = g.get("tx_depth", 0)
+    savepoint = f"sp_{depth}"
+    if depth == 0:
+        conn.begin()
+    else:
+        conn.cursor().execute(f"SAVEPOINT {savepoint}")
+    g.tx_depth = depth + 1
+    try:
+        yield conn
+    except Exception:
+        g.tx_depth = depth
+        if depth == 0:
+            conn.rollback()
+        else:
+            conn.cursor().execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+        raise
+    g.tx_depth = depth
+    if depth == 0:
+        conn.commit()
+    else:
+        conn.cursor().execute(f"RELEASE SAVEPOINT {savepoint}")
 
 
 def execute_update(query, params=None):
     """
     Execute an INSERT/UPDATE/DELETE query and return the inserted ID if available.
     Does NOT return a Flask Response — returns plain Python values for reuse.
+    Commits immediately unless called inside a transaction() block.
     """
     conn = db.get_db()
     cursor = conn.cursor()
     try:
         cursor.execute(query, params or ())
-        conn.commit()
+        _commit(conn)
 
-        print(f"Executed query: {query} with params: {params}")
+        current_app.logger.debug(f"Executed query: {query} with params: {params}")
 
         inserted_id = (
             cursor.lastrowid if query.strip().upper().startswith("INSERT") else None
@@ -33,3 +177,48 @@ def execute_update(query, params=None):
         if "RESTRICT" in str(e):
             raise ValueError("Cannot delete due to existing references to this record")
         raise
+
+
+def execute_many(query, rows, chunk_size=500):
+    """
+    Insert many rows with chunked multi-row INSERT statements in one transaction.
+
+    `query` is a single-row INSERT such as
+    "INSERT INTO T (A, B) VALUES (%s, %s)"; its VALUES tuple is repeated
+    `chunk_size` times per statement, so N rows cost ceil(N / chunk_size)
+    round-trips and a single commit (deferred when inside transaction()).
+
+    Returns the list of generated AUTO_INCREMENT IDs in row order (empty for
+    tables without one). IDs are consecutive within each chunk.
+    """
+    rows = [tuple(row) for row in rows]
+    if not rows:
+        return []
+
+    head, row_sql, tail = _split_insert(query)
+
+    conn = db.get_db()
+    cursor = conn.cursor()
+    inserted_ids = []
+    try:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            statement = head + ", ".join([row_sql] * len(chunk)) + tail
+            params = [value for row in chunk for value in row]
+            cursor.execute(statement, params)
+            # LAST_INSERT_ID() is the first ID of a multi-row insert
+            if cursor.lastrowid:
+                first_id = cursor.lastrowid
+                inserted_ids.extend(range(first_id, first_id + len(chunk)))
+        _commit(conn)
+    except Exception:
+        # An enclosing transaction() decides what to roll back
+        if not in_transaction():
+            conn.rollback()
+        raise
+
+    current_app.logger.debug(
+        f"Executed batch insert: {len(rows)} rows in "
+        f"{-(-len(rows) // chunk_size)} statements for query: {query}"
+    )
+    return inserted_ids
@@ -0,0 +1,50 @@
+# ------------------------------------------------------------
+# Sparse fieldsets for read endpoints.
+#
+# A route that supports ?fields=ID,FirstName,LastName declares the
+# columns a client may ask for; requested_fields() validates the
+# parameter against that whitelist and column_list() turns it into
+# the SELECT list, so MySQL only reads and ships those columns.
+# Requests without ?fields= get every column as before.
+# ------------------------------------------------------------
+from flask import request
+
+
+class FieldsError(ValueError):
+    """Raised for a ?fields= value naming a column that isn't allowed."""
+
+
+def requested_fields(allowed, required=("ID",)):
+    """
+    Return the validated ?fields= column names (in whitelist order, with
+    `required` columns such as the keyset/primary key always included), or
+    None when the request did not ask for a sparse fieldset.
+    """
+    raw = request.args.get("fields")
+    if raw is None:
+        return None
+
+    names = {name.strip() for name in raw.split(",") if name.strip()}
+    if not names:
+        raise FieldsError("'fields' must name at least one column")
+    unknown = sorted(names - set(allowed))
+    if unknown:
+        raise FieldsError(
+            f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    names.update(required)
+    return [name for name in allowed if name in names]
+
+
+def column_list(fields, alias=None):
+    """SELECT list for whitelisted column names, e.g. `M`.`ID`, `M`.`FirstName`."""
+    prefix = f"`{alias}`." if alias else ""
+    return ", ".join(f"{prefix}`{name}`" for name in fields)
+
+
+def select_columns(allowed, alias=None):
+    """SELECT list for a plain table read: the ?fields= subset, else every column."""
+    fields = requested_fields(allowed)
+    if fields is None:
+        return f"{alias}.*" if alias else "*"
+    return column_list(fields, alias)
@@ -0,0 +1,73 @@
+# ------------------------------------------------------------
+# JSON provider for the Flask app.
+#
+# DictCursor rows are full of Decimal, date, datetime and bytes
+# values. Flask's default provider renders dates as RFC 1123
+# strings ("Wed, 01 Jan 2025 00:00:00 GMT") through the slow
+# stdlib encoder. This provider serializes with orjson when it is
+# installed (falling back to the stdlib json module) and uses one
+# format everywhere:
+#
+#   date      -> "2025-01-01"
+#   datetime  -> "2025-01-01T18:30:00"
+#   Decimal   -> "12.50" (a string, so no precision is lost)
+#   timedelta -> "1:30:00" (MySQL TIME columns)
+#   bytes     -> UTF-8 text, or base64 when not valid UTF-8
+# ------------------------------------------------------------
+import base64
+import datetime
+import decimal
+import json
+
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def default(value):
+    """Serialize the values DictCursor rows contain that JSON can't."""
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value)
+        try:
+            return value.decode("utf-8")
+        except UnicodeDecodeError:
+            return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(JSONProvider):
+    """Registered in create_app() as app.json; used by jsonify and stream_query."""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj, **kwargs):
+        if orjson is not None and not kwargs:
+            # orjson handles date/datetime natively (ISO 8601) and calls
+            # default() for the rest; it returns bytes
+            return orjson.dumps(
+                obj, default=default, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        kwargs.setdefault("default", default)
+        kwargs.setdefault("ensure_ascii", False)
+        kwargs.setdefault("separators", (",", ":"))
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(f"{self.dumps(obj)}\n", mimetype=self.mimetype)
@@ -0,0 +1,135 @@
+# ------------------------------------------------------------
+# Keyset (cursor) pagination for collection endpoints.
+#
+# A route opts in by passing its sort key to execute_query /
+# stream_query / fetch_page, e.g. keyset=("ID",) or
+# keyset=(("DateSent", "DESC"), ("ID", "DESC")). Key columns are
+# names in the query's result set and together must be unique.
+#
+# Clients page with ?limit=N and ?after=<token>. Each paginated
+# response carries the token for the following page in the
+# X-Next-Cursor header (plus a Link: rel="next" header); the
+# header is absent on the last page. Requests without limit/after
+# get the full, unpaginated result as before.
+# ------------------------------------------------------------
+import base64
+import json
+from urllib.parse import urlencode
+
+from flask import current_app, request
+
+
+class PaginationError(ValueError):
+    """Raised for a malformed limit or after parameter."""
+
+
+def _normalize_keyset(keyset):
+    keys = []
+    for key in keyset:
+        column, direction = (key, "ASC") if isinstance(key, str) else key
+        direction = direction.upper()
+        if direction not in ("ASC", "DESC"):
+            raise ValueError(f"Invalid keyset direction: {direction}")
+        keys.append((column, direction))
+    return keys
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid 'after' cursor")
+    if not isinstance(values, list):
+        raise PaginationError("Invalid 'after' cursor")
+    return values
+
+
+def page_request():
+    """
+    Return (limit, after_values) for the current request, or None when the
+    client did not ask for pagination.
+    """
+    limit = request.args.get("limit")
+    after = request.args.get("after")
+    if limit is None and after is None:
+        return None
+
+    max_limit = current_app.config.get("PAGINATION_MAX_LIMIT", 500)
+    if limit is None:
+        limit = current_app.config.get("PAGINATION_DEFAULT_LIMIT", 50)
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise PaginationError("'limit' must be an integer")
+    if limit < 1 or limit > max_limit:
+        raise PaginationError(f"'limit' must be between 1 and {max_limit}")
+
+    return limit, decode_cursor(after) if after else None
+
+
+def paginate_query(query, params, keyset, limit, after):
+    """Wrap `query` so it returns up to limit + 1 rows after the cursor."""
+    keys = _normalize_keyset(keyset)
+    params = list(params or ())
+    where = ""
+    if after is not None:
+        if len(after) != len(keys):
+            raise PaginationError("Invalid 'after' cursor")
+        # (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... honouring each direction
+        clauses = []
+        for i, (column, direction) in enumerate(keys):
+            op = ">" if direction == "ASC" else "<"
+            parts = [f"`page_src`.`{c}` = %s" for c, _ in keys[:i]]
+            parts.append(f"`page_src`.`{column}` {op} %s")
+            clauses.append("(" + " AND ".join(parts) + ")")
+            params.extend(after[: i + 1])
+        where = "WHERE " + " OR ".join(clauses)
+
+    order = ", ".join(f"`page_src`.`{c}` {d}" for c, d in keys)
+    sql = f"""
+    SELECT * FROM ({query.strip().rstrip(";")}) AS page_src
+    {where}
+    ORDER BY {order}
+    LIMIT %s
+    """
+    params.append(limit + 1)
+    return sql, params
+
+
+def fetch_page(cursor, query, params=None, keyset=("ID",)):
+    """
+    Execute `query` on `cursor`, paginated when the request asks for it.
+    Returns (rows, next_cursor); next_cursor is None on the last page or
+    when the request is unpaginated.
+    """
+    page = page_request()
+    if page is None:
+        cursor.execute(query, params or ())
+        return cursor.fetchall(), None
+
+    limit, after = page
+    sql, sql_params = paginate_query(query, params, keyset, limit, after)
+    cursor.execute(sql, sql_params)
+    rows = list(cursor.fetchall())
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    keys = _normalize_keyset(keyset)
+    return rows, encode_cursor([rows[-1][column] for column, _ in keys])
+
+
+def add_page_headers(response, next_cursor):
+    """Attach X-Next-Cursor / Link headers when there is another page."""
+    if next_cursor:
+        args = request.args.to_dict()
+        args["after"] = next_cursor
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return response
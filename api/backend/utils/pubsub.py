@@ -0,0 +1,140 @@
+# ------------------------------------------------------------
+# In-process publish/subscribe for live (SSE) feeds.
+#
+# A FeedHub serves one kind of live state (e.g. ballot tallies) keyed
+# by ID. While a key has subscribers, one background thread in this
+# worker reloads its state with load(key) and pushes what changed to
+# every subscriber, so a hundred watchers cost one query per refresh,
+# not a hundred polling loops.
+#
+# The thread reloads when a local write calls notify(key), and at
+# least every poll_interval seconds otherwise (so writes served by
+# other gunicorn workers show up too), but never more than max_rate
+# times a second. A subscriber that falls behind gets its pending
+# deltas merged, so it only ever sees the latest value per field.
+# ------------------------------------------------------------
+import threading
+import time
+
+from flask import current_app
+
+
+class Subscription:
+    """One watcher's queue of merged deltas. Always close() it when done."""
+
+    def __init__(self, feed):
+        self._feed = feed
+        self._pending = {}
+        self._ready = threading.Condition()
+
+    def _push(self, delta):
+        with self._ready:
+            self._pending.update(delta)
+            self._ready.notify()
+
+    def get(self, timeout=None):
+        """Wait for changes; return {field: value}, or None on timeout."""
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._pending, timeout):
+                return None
+            delta, self._pending = self._pending, {}
+            return delta
+
+    def close(self):
+        self._feed.unsubscribe(self)
+
+
+class _Feed:
+    def __init__(self, hub, key, app, max_rate, poll_interval):
+        self.hub = hub
+        self.key = key
+        self.app = app
+        self.min_gap = 1.0 / max_rate
+        self.poll_interval = poll_interval
+        self.state = None
+        self.subscribers = set()
+        self.wake = threading.Event()
+        self.wake.set()  # load immediately for the first subscriber
+        self.thread = threading.Thread(
+            target=self._run, name=f"feed-{key}", daemon=True
+        )
+
+    def unsubscribe(self, subscription):
+        with self.hub._lock:
+            self.subscribers.discard(subscription)
+        self.wake.set()  # let the thread notice if it was the last one
+
+    def _run(self):
+        last_load = 0.0
+        while True:
+            self.wake.wait(self.poll_interval)
+            self.wake.clear()
+            with self.hub._lock:
+                if not self.subscribers:
+                    del self.hub._feeds[self.key]
+                    return
+
+            # Coalesce: bursts of notify() within min_gap become one load
+            delay = last_load + self.min_gap - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            last_load = time.monotonic()
+
+            try:
+                with self.app.app_context():
+                    state = self.hub._load(self.key)
+            except Exception:
+                self.app.logger.exception(f"Live feed load failed for {self.key}")
+                continue
+
+            with self.hub._lock:
+                old = self.state or {}
+                delta = {k: v for k, v in state.items() if old.get(k) != v}
+                self.state = state
+                subscribers = list(self.subscribers)
+            if delta:
+                for subscription in subscribers:
+                    subscription._push(delta)
+
+
+class FeedHub:
+    """
+    Live state for many keys, loaded by `load(key)` -> {field: value}
+    (run inside an app context, so it can use db.get_db()).
+    """
+
+    def __init__(self, load):
+        self._load = load
+        self._lock = threading.Lock()
+        self._feeds = {}
+
+    def subscribe(self, key, max_rate=2.0, poll_interval=1.0):
+        """
+        Watch `key`. The first delta is the full current state. `max_rate`
+        and `poll_interval` apply when this call starts the key's feed.
+        """
+        with self._lock:
+            feed = self._feeds.get(key)
+            start = feed is None
+            if start:
+                app = current_app._get_current_object()
+                feed = _Feed(self, key, app, max_rate, poll_interval)
+                self._feeds[key] = feed
+            subscription = Subscription(feed)
+            feed.subscribers.add(subscription)
+            if feed.state:
+                subscription._push(dict(feed.state))
+        if start:
+            feed.thread.start()
+        return subscription
+
+    def notify(self, key):
+        """A local write changed `key`; refresh its watchers soon."""
+        with self._lock:
+            feed = self._feeds.get(key)
+        if feed is not None:
+            feed.wake.set()
+
+    def stats(self):
+        with self._lock:
+            return {key: len(feed.subscribers) for key, feed in self._feeds.items()}
@@ -0,0 +1,223 @@
+# ------------------------------------------------------------
+# Streaming CSV / Parquet for bulk uploads and exports.
+#
+# iter_upload() reads an uploaded file (multipart "file" or the raw
+# request body) in batches of rows, so a large roster never sits in
+# memory as a whole. The format is picked from the file name or
+# Content-Type; CSV is the default.
+#
+# stream_export() runs a SELECT on an unbuffered server-side cursor
+# and streams the rows out as CSV, or as Parquet with one row group
+# per chunk. Parquet needs the optional pyarrow package; without it
+# Parquet requests get a 400.
+# ------------------------------------------------------------
+import csv
+import io
+import shutil
+import tempfile
+
+from flask import Response, request, stream_with_context
+from pymysql.constants import FIELD_TYPE
+
+from backend.db_connection import db
+from backend.db_connection.instrumentation import InstrumentedSSDictCursor
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+PARQUET_TYPES = ("application/vnd.apache.parquet", "application/x-parquet")
+
+# Raw Parquet bodies are spooled to disk past this size (Parquet needs seeks)
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+class TabularError(ValueError):
+    """Raised for an upload or export format that can't be read or produced."""
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise TabularError("Parquet support requires the pyarrow package")
+
+
+def upload_format():
+    """Return "parquet" or "csv" for the current request's upload."""
+    upload = request.files.get("file")
+    name = (upload.filename or "") if upload else ""
+    mimetype = upload.mimetype if upload else request.mimetype
+    if mimetype in PARQUET_TYPES or name.lower().endswith(".parquet"):
+        return "parquet"
+    return "csv"
+
+
+def _batched(rows, batch_size):
+    batch = []
+    for number, row in enumerate(rows, start=1):
+        batch.append((number, row))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _csv_rows(stream):
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        if not reader.fieldnames:
+            raise TabularError("No CSV data provided")
+        yield from reader
+    except UnicodeDecodeError:
+        raise TabularError("CSV must be UTF-8")
+    except csv.Error as e:
+        raise TabularError(f"Malformed CSV: {e}")
+    finally:
+        # Leave the request stream for Werkzeug to close
+        text.detach()
+
+
+def _parquet_rows(stream, batch_size):
+    _require_pyarrow()
+    if not stream.seekable():
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        shutil.copyfileobj(stream, spooled)
+        spooled.seek(0)
+        stream = spooled
+    try:
+        parquet_file = pyarrow.parquet.ParquetFile(stream)
+    except pyarrow.ArrowException as e:
+        raise TabularError(f"Malformed Parquet file: {e}")
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from record_batch.to_pylist()
+
+
+def iter_upload(batch_size=500):
+    """
+    Yield the uploaded rows as lists of (row_number, dict), at most
+    `batch_size` per list. Row numbers count data rows from 1. CSV cells
+    are strings; Parquet values keep their column types.
+    """
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+    if upload_format() == "parquet":
+        rows = _parquet_rows(stream, batch_size)
+    else:
+        rows = _csv_rows(stream)
+    yield from _batched(rows, batch_size)
+
+
+def _arrow_type(type_code):
+    if type_code in (
+        FIELD_TYPE.TINY,
+        FIELD_TYPE.SHORT,
+        FIELD_TYPE.LONG,
+        FIELD_TYPE.INT24,
+        FIELD_TYPE.LONGLONG,
+        FIELD_TYPE.YEAR,
+    ):
+        return pyarrow.int64()
+    if type_code in (FIELD_TYPE.FLOAT, FIELD_TYPE.DOUBLE):
+        return pyarrow.float64()
+    if type_code in (FIELD_TYPE.DECIMAL, FIELD_TYPE.NEWDECIMAL):
+        return pyarrow.float64()
+    if type_code in (FIELD_TYPE.DATE, FIELD_TYPE.NEWDATE):
+        return pyarrow.date32()
+    if type_code in (FIELD_TYPE.DATETIME, FIELD_TYPE.TIMESTAMP):
+        return pyarrow.timestamp("us")
+    return pyarrow.string()
+
+
+class _Sink:
+    """Write-only file object that hands back what was written since last drain."""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks = []
+        self._size = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._size
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _csv_chunks(cursor, chunk_size):
+    columns = [column[0] for column in cursor.description]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        writer.writerows([row[column] for column in columns] for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _parquet_chunks(cursor, chunk_size):
+    schema = pyarrow.schema(
+        [(column[0], _arrow_type(column[1])) for column in cursor.description]
+    )
+    sink = _Sink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        writer.write_table(pyarrow.Table.from_pylist(rows, schema=schema))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def stream_export(query, params=None, fmt="csv", filename="export", chunk_size=500):
+    """
+    Stream a SELECT's rows as a CSV or Parquet download named
+    `filename`.<fmt>. Column names come from the query's result set.
+    """
+    if fmt == "parquet":
+        _require_pyarrow()
+        chunks, mimetype = _parquet_chunks, PARQUET_TYPES[0]
+    elif fmt == "csv":
+        chunks, mimetype = _csv_chunks, "text/csv"
+    else:
+        raise TabularError(f"Unsupported export format: {fmt}")
+
+    def generate():
+        cursor = db.get_db().cursor(InstrumentedSSDictCursor)
+        try:
+            cursor.execute(query, params or ())
+            yield from chunks(cursor, chunk_size)
+        finally:
+            # Drains any unread rows so the pooled connection is reusable
+            cursor.close()
+
+    return Response(
+        stream_with_context(generate()),
+        status=200,
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
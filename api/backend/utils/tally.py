@@ -0,0 +1,343 @@
+# ------------------------------------------------------------
+# Ranked-ballot tallies: instant-runoff (IRV), single transferable
+# vote (STV) for multi-seat positions, and Schulze (Condorcet).
+#
+# Ballots are held as a PreferenceProfile: an integer matrix with
+# one row per distinct ranking and one column per preference, plus
+# how many voters cast each ranking. Every round is a few NumPy
+# operations over that matrix rather than a loop over ballots, so
+# ten thousand ballots tally in a few milliseconds.
+#
+# IRV and STV return each round's counts, who was elected or
+# eliminated and how many ballots were exhausted, so a result can be
+# audited. STV uses the Droop quota and transfers surpluses at a
+# fractional weight (weighted inclusive Gregory). Ties for last place
+# are broken by the earlier rounds' counts, then by candidate order
+# (the later-listed candidate goes); rounds that needed one say so.
+#
+# Benchmark on synthetic ballots:
+#   cd api && python -m backend.utils.tally --ballots 20000 --candidates 8
+# ------------------------------------------------------------
+import argparse
+import time
+
+import numpy as np
+
+# Counts closer than this are equal (STV transfers are fractional)
+EPSILON = 1e-9
+
+
+class PreferenceProfile:
+    """
+    prefs[i, r] is the index into `candidates` of ranking i's (r + 1)th
+    choice, or -1 past its last one; weights[i] is how many voters cast it.
+    """
+
+    def __init__(self, candidates, prefs, weights=None):
+        self.candidates = list(candidates)
+        dtype = np.int16 if len(self.candidates) < 2**15 else np.int32
+        prefs = np.asarray(prefs, dtype=dtype)
+        if weights is None:
+            weights = np.ones(len(prefs))
+
+        # Rankings with no valid choice can't count toward anything
+        keep = (prefs >= 0).any(axis=1)
+        prefs, weights = prefs[keep], np.asarray(weights, dtype=float)[keep]
+        if not len(prefs):
+            self.prefs = np.full((0, 1), -1, dtype=dtype)
+            self.weights = np.zeros(0)
+            return
+
+        # Store each distinct ranking once
+        self.prefs, inverse = np.unique(prefs, axis=0, return_inverse=True)
+        self.weights = np.bincount(
+            inverse.ravel(), weights=weights, minlength=len(self.prefs)
+        )
+
+    @classmethod
+    def from_rankings(cls, candidates, rankings):
+        """Build from one list of candidates (most preferred first) per voter."""
+        index = {candidate: i for i, candidate in enumerate(candidates)}
+        width = max((len(ranking) for ranking in rankings), default=1)
+        prefs = np.full((len(rankings), width), -1, dtype=np.int32)
+        for row, ranking in enumerate(rankings):
+            prefs[row, : len(ranking)] = [index[candidate] for candidate in ranking]
+        return cls(candidates, prefs)
+
+    @classmethod
+    def from_rows(cls, candidates, ballots, preferences, choices):
+        """
+        Build from parallel arrays with one entry per (ballot, preference,
+        choice), e.g. ranking rows read from the database. Preferences only
+        need to sort within a ballot; gaps are closed up.
+        """
+        candidates = list(candidates)
+        ballots = np.asarray(ballots)
+        if not len(ballots):
+            return cls(candidates, np.full((0, 1), -1))
+
+        labels = np.asarray(candidates)
+        order = np.argsort(labels, kind="stable")
+        slots = np.searchsorted(labels[order], choices).clip(max=len(labels) - 1)
+        choice_index = order[slots]
+        unknown = labels[choice_index] != np.asarray(choices)
+        if unknown.any():
+            raise ValueError(f"Unknown candidate: {np.asarray(choices)[unknown][0]}")
+
+        # Sort by ballot, then preference; a choice's column is its
+        # position within its ballot's run of rows
+        _, ballot_index = np.unique(ballots, return_inverse=True)
+        ballot_index = ballot_index.ravel()
+        sort = np.lexsort((np.asarray(preferences), ballot_index))
+        ballot_index, choice_index = ballot_index[sort], choice_index[sort]
+        starts = np.flatnonzero(np.r_[True, np.diff(ballot_index) != 0])
+        lengths = np.diff(np.r_[starts, len(ballot_index)])
+        columns = np.arange(len(ballot_index)) - np.repeat(starts, lengths)
+
+        prefs = np.full((len(starts), lengths.max()), -1, dtype=np.int32)
+        prefs[ballot_index, columns] = choice_index
+        return cls(candidates, prefs)
+
+    @property
+    def total(self):
+        return float(self.weights.sum())
+
+
+def _top_choices(prefs, active):
+    """Each ranking's highest-ranked active candidate, or -1 if exhausted."""
+    live = prefs >= 0
+    live[live] = active[prefs[live]]
+    top = prefs[np.arange(len(prefs)), live.argmax(axis=1)].astype(np.int64)
+    top[~live.any(axis=1)] = -1
+    return top
+
+
+def _count(top, weights, size):
+    held = top >= 0
+    return np.bincount(top[held], weights=weights[held], minlength=size)
+
+
+def _votes(value):
+    value = round(float(value), 4)
+    return int(value) if value.is_integer() else value
+
+
+def _lowest(counts, active, history):
+    """The active candidate to eliminate, and whether a tie had to be broken."""
+    tied = np.flatnonzero(active & (counts <= counts[active].min() + EPSILON))
+    was_tied = len(tied) > 1
+    for earlier in reversed(history):
+        if len(tied) == 1:
+            break
+        tied = tied[earlier[tied] <= earlier[tied].min() + EPSILON]
+    return int(tied[-1]), was_tied
+
+
+def _round(profile, number, counts, active, exhausted):
+    ranked = sorted(np.flatnonzero(active), key=lambda i: -counts[i])
+    return {
+        "round": number,
+        "tallies": [
+            {"candidate": profile.candidates[i], "votes": _votes(counts[i])}
+            for i in ranked
+        ],
+        "exhausted": _votes(exhausted),
+        "elected": [],
+        "eliminated": [],
+    }
+
+
+def irv(profile):
+    """Instant-runoff: drop the last-placed candidate until one holds a majority."""
+    size = len(profile.candidates)
+    active = np.ones(size, dtype=bool)
+    rounds, history, winners = [], [], []
+
+    while size and active.any():
+        top = _top_choices(profile.prefs, active)
+        counts = _count(top, profile.weights, size)
+        exhausted = profile.weights[top < 0].sum()
+        current = _round(profile, len(rounds) + 1, counts, active, exhausted)
+        rounds.append(current)
+
+        continuing = counts[active].sum()
+        if continuing <= 0:
+            break
+        leader = int(np.flatnonzero(active)[np.argmax(counts[active])])
+        if counts[leader] * 2 > continuing + EPSILON or active.sum() == 1:
+            winners.append(leader)
+            current["elected"].append(profile.candidates[leader])
+            break
+
+        loser, was_tied = _lowest(counts, active, history)
+        current["eliminated"].append(profile.candidates[loser])
+        current["tie_break"] = was_tied
+        active[loser] = False
+        history.append(counts)
+
+    return _result("irv", profile, 1, winners, rounds)
+
+
+def stv(profile, seats):
+    """
+    Single transferable vote for `seats` winners: elect anyone at the
+    Droop quota and pass on their surplus, else drop the last-placed
+    candidate; once the remaining candidates fit the open seats, elect them.
+    """
+    size = len(profile.candidates)
+    weights = profile.weights.astype(float)
+    quota = np.floor(profile.total / (seats + 1)) + 1
+    active = np.ones(size, dtype=bool)
+    rounds, history, winners = [], [], []
+
+    while len(winners) < seats and active.any():
+        top = _top_choices(profile.prefs, active)
+        counts = _count(top, weights, size)
+        exhausted = weights[top < 0].sum()
+        current = _round(profile, len(rounds) + 1, counts, active, exhausted)
+        rounds.append(current)
+        open_seats = seats - len(winners)
+
+        if active.sum() <= open_seats:
+            elected = sorted(np.flatnonzero(active), key=lambda i: -counts[i])
+        else:
+            reached = np.flatnonzero(active & (counts >= quota - EPSILON))
+            elected = sorted(reached, key=lambda i: -counts[i])[:open_seats]
+
+        if elected:
+            for candidate in elected:
+                # Ballots stay with their next choice at the surplus fraction
+                if counts[candidate] > 0:
+                    surplus = max(counts[candidate] - quota, 0.0)
+                    weights[top == candidate] *= surplus / counts[candidate]
+                active[candidate] = False
+                winners.append(int(candidate))
+                current["elected"].append(profile.candidates[candidate])
+        else:
+            loser, was_tied = _lowest(counts, active, history)
+            current["eliminated"].append(profile.candidates[loser])
+            current["tie_break"] = was_tied
+            active[loser] = False
+        history.append(counts)
+
+    result = _result("stv", profile, seats, winners, rounds)
+    result["quota"] = _votes(quota)
+    return result
+
+
+def _pairwise(profile, chunk_size=4096):
+    """d[i, j]: voters ranking i above j (unranked candidates tie for last)."""
+    prefs, size = profile.prefs, len(profile.candidates)
+    position = np.full((len(prefs), size), prefs.shape[1], dtype=np.int32)
+    rows, columns = np.nonzero(prefs >= 0)
+    np.minimum.at(position, (rows, prefs[rows, columns]), columns)
+
+    d = np.zeros((size, size))
+    for start in range(0, len(prefs), chunk_size):
+        chunk = position[start : start + chunk_size]
+        above = chunk[:, :, None] < chunk[:, None, :]
+        d += np.tensordot(profile.weights[start : start + chunk_size], above, axes=1)
+    return d
+
+
+def schulze(profile, seats=1):
+    """
+    Schulze: rank candidates by their strongest beatpath against each other
+    candidate; the first `seats` in that order win.
+    """
+    size = len(profile.candidates)
+    d = _pairwise(profile)
+
+    # Widest paths (Floyd-Warshall over the pairwise wins)
+    p = np.where(d > d.T, d, 0.0)
+    for k in range(size):
+        p = np.maximum(p, np.minimum(p[:, k, None], p[None, k, :]))
+    np.fill_diagonal(p, 0.0)
+
+    beats = p > p.T + EPSILON
+    wins = beats.sum(axis=1)
+    order = sorted(range(size), key=lambda i: -wins[i])
+    winners = order[:seats]
+    tie = seats < size and not beats[order[seats - 1], order[seats]]
+
+    result = _result("schulze", profile, seats, winners, [])
+    result.update(
+        {
+            "ranking": [profile.candidates[i] for i in order],
+            "tie": bool(tie),
+            "pairwise": [[_votes(v) for v in row] for row in d],
+            "strongest_paths": [[_votes(v) for v in row] for row in p],
+        }
+    )
+    return result
+
+
+def _result(method, profile, seats, winners, rounds):
+    return {
+        "method": method,
+        "seats": seats,
+        "ballots": _votes(profile.total),
+        "candidates": profile.candidates,
+        "winners": [profile.candidates[i] for i in winners],
+        "rounds": rounds,
+    }
+
+
+METHODS = {
+    "irv": lambda profile, seats: irv(profile),
+    "stv": stv,
+    "schulze": schulze,
+}
+
+
+def tally(profile, method="irv", seats=1):
+    """Run `method` ("irv", "stv" or "schulze"); ValueError for anything else."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown tally method: {method}")
+    return METHODS[method](profile, seats)
+
+
+def synthetic_profile(ballots, candidates, seed=0):
+    """
+    Random ballots for benchmarking: voters rank candidates by a shared
+    popularity plus personal noise and stop after a random number of choices.
+    """
+    rng = np.random.default_rng(seed)
+    popularity = rng.normal(size=candidates)
+    utility = popularity + rng.normal(scale=1.5, size=(ballots, candidates))
+    prefs = np.argsort(-utility, axis=1)
+    lengths = rng.integers(1, candidates + 1, size=ballots)
+    prefs[np.arange(candidates) >= lengths[:, None]] = -1
+    return PreferenceProfile(range(candidates), prefs)
+
+
+def _benchmark():
+    parser = argparse.ArgumentParser(description="Time the ranked-ballot tallies.")
+    parser.add_argument("--ballots", type=int, default=10000)
+    parser.add_argument("--candidates", type=int, default=8)
+    parser.add_argument("--seats", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    profile = synthetic_profile(args.ballots, args.candidates)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(
+        f"{args.ballots} ballots, {args.candidates} candidates "
+        f"({len(profile.prefs)} distinct rankings), built in {build_ms:.1f} ms"
+    )
+
+    for method, seats in (("irv", 1), ("stv", args.seats), ("schulze", 1)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = tally(profile, method, seats)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(
+            f"{method:>8}: best {min(timings):7.2f} ms over {args.repeat} runs, "
+            f"{len(result['rounds'])} rounds, winners {result['winners']}"
+        )
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -9,6 +9,9 @@ from backend.rest_entry import create_app
 # create the app object
 app = create_app()
 
+# In the container the app is served by gunicorn (see gunicorn.conf.py
+# and the Dockerfile). Running this file directly starts the single-process
+# Flask dev server instead.
 if __name__ == "__main__":
     # we want to run in debug mode (for hot reloading)
     # this app will be bound to port 4000.
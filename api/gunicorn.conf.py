@@ -0,0 +1,40 @@
+###
+# Gunicorn settings for the production API server
+#
+# Every value can be overridden from the environment (or the .env
+# file) so the same image can be tuned per deployment.
+###
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# bind to the same port the dev server used (see docker-compose.yaml)
+bind = os.getenv("API_BIND", "0.0.0.0:4000")
+
+# pre-fork worker processes, each running a pool of request threads.
+# The app is imported in each worker (no preload_app), so every worker
+# builds its own DB connection pool after the fork.
+workers = int(os.getenv("API_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("API_THREADS", "4"))
+worker_class = "gthread"
+
+# seconds to hold idle keep-alive connections open
+keepalive = int(os.getenv("API_KEEPALIVE", "5"))
+
+# recycle each worker after this many requests (0 disables), with jitter
+# so the workers don't all restart at the same time
+max_requests = int(os.getenv("API_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("API_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.getenv("API_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("API_GRACEFUL_TIMEOUT", "30"))
+
+# hot reload for local development only
+reload = os.getenv("API_RELOAD", "false").lower() == "true"
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("API_LOG_LEVEL", "info")
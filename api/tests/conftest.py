@@ -0,0 +1,141 @@
+# ------------------------------------------------------------
+# Test fixtures: the real Flask app on top of a fake MySQL server.
+#
+# FakeConnection replaces the PyMySQL connection underneath the
+# app's own pool and instrumented cursors, so every statement is
+# bound by PyMySQL's parameter formatting exactly as it would be
+# against MySQL (a placeholder/argument mismatch raises the same
+# ProgrammingError). FakeDatabase records each bound statement and
+# answers it from rules the test registers with on().
+#
+# Run from the api folder:  python -m pytest
+# ------------------------------------------------------------
+import logging
+import os
+import tempfile
+import threading
+
+import pytest
+from pymysql import converters
+
+os.environ.setdefault("DB_USER", "root")
+os.environ.setdefault("MYSQL_ROOT_PASSWORD", "test")
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_PORT", "3306")
+os.environ.setdefault("DB_NAME", "ClubStack")
+
+from backend.db_connection import db  # noqa: E402
+from backend.db_connection.pool import ConnectionPool  # noqa: E402
+from backend.rest_entry import create_app  # noqa: E402
+
+
+class FakeResult:
+    """What PyMySQL cursors read after a query (rows are already dicts)."""
+
+    description = None
+    fields = ()
+    has_next = False
+    warning_count = 0
+
+    def __init__(self, rows=(), rowcount=None, lastrowid=0):
+        self.rows = tuple(rows)
+        self.affected_rows = len(self.rows) if rowcount is None else rowcount
+        self.insert_id = lastrowid
+
+
+class FakeDatabase:
+    """Records bound statements and answers them from registered rules."""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+        self._rules = []
+        self._lock = threading.Lock()
+
+    def on(self, fragment, rows=(), rowcount=None, lastrowid=0, handler=None):
+        """
+        Answer statements containing `fragment`. `handler(sql)` may return a
+        FakeResult or raise (e.g. an IntegrityError). Later rules win.
+        """
+        with self._lock:
+            self._rules.insert(0, (fragment, rows, rowcount, lastrowid, handler))
+
+    def queries(self, fragment=""):
+        with self._lock:
+            return [sql for sql in self.statements if fragment in sql]
+
+    def answer(self, sql):
+        sql = " ".join(sql.split())
+        with self._lock:
+            self.statements.append(sql)
+            rules = list(self._rules)
+        for fragment, rows, rowcount, lastrowid, handler in rules:
+            if fragment in sql:
+                if handler is not None:
+                    return handler(sql)
+                return FakeResult(rows, rowcount, lastrowid)
+        return FakeResult()
+
+
+class FakeConnection:
+    """Just enough of pymysql.connections.Connection for the app's cursors."""
+
+    charset = "utf8mb4"
+    encoding = "utf8"
+    open = True
+
+    def __init__(self, database):
+        self.database = database
+        self._result = None
+
+    def cursor(self, cursor=None):
+        return (cursor or db.connect_args["cursorclass"])(self)
+
+    def escape(self, obj, mapping=None):
+        return converters.escape_item(obj, self.charset, mapping=mapping)
+
+    def query(self, sql, unbuffered=False):
+        self._result = self.database.answer(sql)
+        return self._result.affected_rows
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        with self.database._lock:
+            self.database.commits += 1
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+@pytest.fixture(scope="session")
+def app():
+    # setup_logging() writes ./logs; keep that out of the source tree
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        app = create_app()
+    finally:
+        os.chdir(cwd)
+    app.logger.setLevel(logging.WARNING)
+    return app
+
+
+@pytest.fixture
+def fake_db(app):
+    database = FakeDatabase()
+    db.pool = ConnectionPool(lambda: FakeConnection(database), max_size=32)
+    app.extensions["response_cache"].clear()
+    return database
+
+
+@pytest.fixture
+def client(app, fake_db):
+    return app.test_client()
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from backend.db_connection.pool import ConnectionPool
+
+
+class SlowCloseConnection:
+    """Records whether the pool's lock was free while close() ran."""
+
+    open = True
+
+    def __init__(self, pool_ref, closed):
+        self.pool_ref = pool_ref
+        self.closed = closed
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        got_lock = []
+        probe = threading.Thread(
+            target=lambda: got_lock.append(self.pool_ref[0]._cond.acquire(False))
+        )
+        probe.start()
+        probe.join()
+        if got_lock[0]:
+            self.pool_ref[0]._cond.release()
+        self.closed.append(got_lock[0])
+
+
+def make_pool(**kwargs):
+    pool_ref, closed = [], []
+    pool = ConnectionPool(lambda: SlowCloseConnection(pool_ref, closed), **kwargs)
+    pool_ref.append(pool)
+    return pool, closed
+
+
+def test_expired_idle_connections_close_outside_the_lock():
+    pool, closed = make_pool(min_size=0, max_size=2, max_idle=0.01)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    time.sleep(0.05)
+
+    pool.release(pool.acquire())
+
+    assert closed == [True, True]
+    assert pool.stats()["connections_closed"] == 2
+
+
+def test_discarded_connection_closes_outside_the_lock():
+    pool, closed = make_pool(max_size=1)
+    conn = pool.acquire()
+    conn.open = False
+    pool.release(conn)
+
+    assert closed == [True]
+    assert pool.stats()["size"] == 0
@@ -0,0 +1,258 @@
+# This file is how every page talks to the API.
+#
+# - One process-wide requests.Session keeps connections to the API alive
+#   and pooled instead of opening a new one per call.
+# - Every call gets a timeout, and idempotent calls are retried with
+#   exponential backoff when the API is restarting or busy (502/503/504).
+# - get() sends back the ETag from the last response for the same URL as
+#   If-None-Match; a 304 reuses the stored response.
+# - get_json() caches parsed bodies with st.cache_data for a TTL. A
+#   successful POST/PUT/PATCH/DELETE invalidates everything cached under
+#   the same top-level path (e.g. /events/...), so pages see their own
+#   writes on the next rerun.
+# - fetch_all() runs independent GETs in parallel on a shared thread
+#   pool, so a page that needs several resources waits for the slowest
+#   one instead of the sum of all of them.
+# - stream_events() reads a Server-Sent Events endpoint as it arrives.
+#
+# Paths are relative to API_BASE ("/events/3"), which defaults to the
+# api container and can be overridden with the API_BASE env var.
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util.retry import Retry
+
+API_BASE = (os.getenv("API_BASE") or "http://api:4000").rstrip("/")
+
+# (connect, read) seconds
+TIMEOUT = (3.05, 15)
+
+# Keep-alive connections kept per host; Streamlit serves each browser
+# session on its own thread, so this is roughly the concurrency we expect
+POOL_SIZE = 16
+
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,  # 0.3s, 0.6s, 1.2s
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,  # hand the last response back to the page
+)
+
+# (connect, read) seconds for event streams; the API sends a keep-alive
+# comment at least every 15s, so a longer silence means it's gone
+STREAM_TIMEOUT = (3.05, 45)
+
+# st.cache_data TTL tiers (seconds) for get_json()
+SHORT_TTL = 10
+DEFAULT_TTL = 60
+LONG_TTL = 300
+
+MAX_ETAG_ENTRIES = 256
+
+_lock = threading.Lock()
+_etag_responses = OrderedDict()  # (url, params) -> last 200 response with an ETag
+_generations = {}  # top-level path segment -> bumped on every write under it
+
+
+@st.cache_resource
+def session():
+    """The process-wide keep-alive session (created once per app process)."""
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+@st.cache_resource
+def _executor():
+    # Sized to the connection pool so parallel calls never queue for a socket
+    return ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="api")
+
+
+def url(path):
+    """Absolute API URL for `path` (absolute URLs are passed through)."""
+    if path.startswith(("http://", "https://")):
+        return path
+    return f"{API_BASE}/{path.lstrip('/')}"
+
+
+def _resource(path):
+    """Top-level path segment a URL belongs to, e.g. "/events/3" -> "events"."""
+    full = url(path)
+    if full.startswith(API_BASE):
+        full = full[len(API_BASE) :]
+    return full.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+def _freeze(params):
+    if not params:
+        return ()
+    items = params.items() if isinstance(params, dict) else params
+    return tuple(sorted((str(k), str(v)) for k, v in items))
+
+
+def invalidate(*resources):
+    """
+    Drop cached data for the given top-level resources ("events", "gear"),
+    or for everything when called with no arguments.
+    """
+    with _lock:
+        if not resources:
+            _etag_responses.clear()
+            _generations.clear()
+        for resource in resources:
+            _generations[resource] = _generations.get(resource, 0) + 1
+    if not resources:
+        for fetch in _TTL_TIERS.values():
+            fetch.clear()
+
+
+def request(method, path, invalidates=(), **kwargs):
+    """
+    Send a request through the shared session. A successful write also
+    invalidates its own resource plus any listed in `invalidates`.
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    response = session().request(method, url(path), **kwargs)
+    if method.upper() not in ("GET", "HEAD", "OPTIONS") and response.ok:
+        invalidate(_resource(path), *invalidates)
+    return response
+
+
+def get(path, params=None, **kwargs):
+    """GET with ETag revalidation; returns a requests.Response."""
+    key = (url(path), _freeze(params))
+    with _lock:
+        cached = _etag_responses.get(key)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cached is not None:
+        headers["If-None-Match"] = cached.headers["ETag"]
+
+    response = request("GET", path, params=params, headers=headers, **kwargs)
+
+    with _lock:
+        if response.status_code == 304 and cached is not None:
+            _etag_responses.move_to_end(key)
+            return cached
+        if response.status_code == 200 and "ETag" in response.headers:
+            _etag_responses[key] = response
+            _etag_responses.move_to_end(key)
+            while len(_etag_responses) > MAX_ETAG_ENTRIES:
+                _etag_responses.popitem(last=False)
+        else:
+            _etag_responses.pop(key, None)
+    return response
+
+
+def post(path, **kwargs):
+    return request("POST", path, **kwargs)
+
+
+def put(path, **kwargs):
+    return request("PUT", path, **kwargs)
+
+
+def delete(path, **kwargs):
+    return request("DELETE", path, **kwargs)
+
+
+def _fetch_json(full_url, params, generation):
+    # `generation` is only part of the cache key: bumping it on a write
+    # makes the next read miss
+    response = get(full_url, params=dict(params) or None)
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=SHORT_TTL, show_spinner=False, max_entries=512)
+def _get_json_short(full_url, params, generation):
+    return _fetch_json(full_url, params, generation)
+
+
+@st.cache_data(ttl=DEFAULT_TTL, show_spinner=False, max_entries=512)
+def _get_json_default(full_url, params, generation):
+    return _fetch_json(full_url, params, generation)
+
+
+@st.cache_data(ttl=LONG_TTL, show_spinner=False, max_entries=512)
+def _get_json_long(full_url, params, generation):
+    return _fetch_json(full_url, params, generation)
+
+
+_TTL_TIERS = {
+    SHORT_TTL: _get_json_short,
+    DEFAULT_TTL: _get_json_default,
+    LONG_TTL: _get_json_long,
+}
+
+
+def get_json(path, params=None, ttl=DEFAULT_TTL):
+    """
+    GET `path` and return the parsed body, cached for `ttl` seconds (one of
+    SHORT_TTL, DEFAULT_TTL, LONG_TTL). Raises requests.HTTPError for error
+    responses (those are never cached).
+    """
+    if ttl not in _TTL_TIERS:
+        raise ValueError(f"ttl must be one of {sorted(_TTL_TIERS)}")
+    with _lock:
+        generation = _generations.get(_resource(path), 0)
+    return _TTL_TIERS[ttl](url(path), _freeze(params), generation)
+
+
+def fetch_all(calls):
+    """
+    GET several independent paths in parallel and wait for all of them.
+
+    `calls` maps a key to a path or a (path, params) pair. Returns a dict
+    with the same keys whose values are finished futures: .result() gives
+    the requests.Response, or re-raises that call's exception, so one
+    failing call doesn't affect the others.
+    """
+    ctx = get_script_run_ctx()
+
+    def run(path, params):
+        # Let st.cache_* inside get() see the page's script context
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return get(path, params=params)
+
+    session()  # create the shared session on the page's own thread
+    futures = {}
+    for key, call in calls.items():
+        path, params = (call, None) if isinstance(call, str) else call
+        futures[key] = _executor().submit(run, path, params)
+    wait(futures.values())
+    return futures
+
+
+def stream_events(path, params=None):
+    """
+    Yield (event, data) for each Server-Sent Event from `path`, with `data`
+    parsed as JSON, until the server ends the stream. Raises
+    requests.HTTPError if the stream can't be opened.
+    """
+    with session().get(
+        url(path), params=params, stream=True, timeout=STREAM_TIMEOUT
+    ) as response:
+        response.raise_for_status()
+        response.encoding = "utf-8"
+        event, data = "message", []
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                # A blank line ends the event
+                if data:
+                    yield event, json.loads("\n".join(data))
+                event, data = "message", []
+            elif line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                data.append(line[5:].lstrip())
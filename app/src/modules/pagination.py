@@ -0,0 +1,45 @@
+# This file has functions for paging through the API's collection
+# endpoints (?limit= / ?after=) instead of pulling whole tables.
+
+import streamlit as st
+
+from modules import api_client
+
+PAGE_SIZE = 50
+
+
+def fetch_pages(
+    path, state_key, envelope=None, page_size=PAGE_SIZE, params=None, **kwargs
+):
+    """
+    Fetch as many pages of a paginated collection as this session has asked
+    for so far (one to start; load_more_button() adds another).
+
+    The API returns the token for the following page in the X-Next-Cursor
+    header. `envelope` is the key holding the rows when the endpoint wraps
+    its list (e.g. "members"). `params` are extra query parameters (e.g.
+    {"fields": "ID,Name"}); other kwargs go to api_client.get.
+
+    Returns (rows, has_more).
+    """
+    pages = st.session_state.setdefault(f"{state_key}_pages", 1)
+    rows, after = [], None
+    for _ in range(pages):
+        page_params = dict(params or {}, limit=page_size)
+        if after:
+            page_params["after"] = after
+        response = api_client.get(path, params=page_params, **kwargs)
+        response.raise_for_status()
+        body = response.json()
+        rows.extend(body.get(envelope, []) if envelope else body)
+        after = response.headers.get("X-Next-Cursor")
+        if not after:
+            break
+    return rows, bool(after)
+
+
+def load_more_button(state_key, has_more, label="Load more"):
+    """Show a button that loads the next page of `state_key` on the next run."""
+    if has_more and st.button(label, key=f"{state_key}_load_more"):
+        st.session_state[f"{state_key}_pages"] += 1
+        st.rerun()
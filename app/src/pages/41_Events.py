@@ -1,5 +1,7 @@
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks
+from modules import api_client
+from modules.pagination import fetch_pages, load_more_button
 import world_bank_data as wb
 import streamlit as st
 import plotly.express as px
@@ -10,9 +12,9 @@ import logging
 import requests
 
 
-# data from api
+# data from api, one page at a time
 data = {}
-data = requests.get("http://api:4000/events").json()
+data, more_events = fetch_pages("/events", "events")
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ st.write(f"### Hi, {st.session_state['first_name']}.")
 
 st.header("Browse Events")
 st.dataframe(data)
+load_more_button("events", more_events, label="Load more events")
 data_frame = pd.DataFrame(data)
 
 # Select event to view details
@@ -97,7 +100,7 @@ if st.session_state.get("first_name", "").lower() in ("chance", "jacob"):
                 "EventDate": "2025-08-13",
             }
             try:
-                response = requests.post("http://api:4000/events", json=payload)
+                response = api_client.post("/events", json=payload)
                 response.raise_for_status()
                 st.success("Event created successfully!")
                 st.json(response.json())
@@ -126,7 +129,7 @@ if st.session_state.get("first_name", "").lower() in ("chance", "jacob"):
             cancel = st.form_submit_button("Cancel")
         if submitted:
             try:
-                response = requests.delete(f"http://api:4000/events/{event_id}")
+                response = api_client.delete(f"/events/{event_id}")
                 response.raise_for_status()
                 st.success("Event deleted successfully!")
                 st.json(response.json())
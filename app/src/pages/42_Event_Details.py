@@ -1,5 +1,6 @@
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks
+from modules import api_client
 import world_bank_data as wb
 import streamlit as st
 import plotly.express as px
@@ -7,12 +8,11 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import logging
-import requests
 
 
 # data from api
 data = {}
-data = requests.get("http://api:4000/events").json()
+data = api_client.get_json("/events")
 
 logger = logging.getLogger(__name__)
 data_frame = pd.DataFrame(data)
@@ -45,7 +45,7 @@ for key, value in event_info.items():
 
 
 # display event roster
-response = requests.get(f"http://api:4000/events/{event_info['ID']}/roster")
+response = api_client.get(f"/events/{event_info['ID']}/roster")
 response.raise_for_status()
 data = response.json()
 st.subheader(f"Roster for Event {data['event_id']}")
@@ -119,9 +119,7 @@ if st.session_state.get("first_name", "").lower() in ("chance", "jacob"):
                 "RecItems": rec_items,
             }
             try:
-                response = requests.put(
-                    f"http://api:4000/events/{event_id}", json=payload
-                )
+                response = api_client.put(f"/events/{event_id}", json=payload)
                 response.raise_for_status()
                 st.success("Event updated successfully!")
                 st.session_state.edit_mode = False
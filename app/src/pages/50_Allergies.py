@@ -1,5 +1,6 @@
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks
+from modules import api_client
 import world_bank_data as wb
 import streamlit as st
 import plotly.express as px
@@ -12,7 +13,7 @@ import requests
 
 # data from api
 data = {}
-data = requests.get("http://api:4000/allergies").json()
+data = api_client.get_json("/allergies", ttl=api_client.LONG_TTL)
 
 logger = logging.getLogger(__name__)
 data_frame = pd.DataFrame(data)
@@ -29,7 +30,7 @@ st.write(f"### Hi, {st.session_state['first_name']}.")
 # generate report
 if st.button("Generate Allergy Report"):
     try:
-        response = requests.get("http://api:4000/allergies/report")
+        response = api_client.get("/allergies/report")
         response.raise_for_status()
         data = response.json()
 
@@ -62,7 +63,7 @@ if st.session_state.show_allergy_form:
             "Name": allergy_name,
         }
         try:
-            response = requests.post("http://api:4000/allergies/", json=payload)
+            response = api_client.post("/allergies/", json=payload)
             response.raise_for_status()
             st.success("Allergy created successfully!")
             st.json(response.json())
@@ -77,7 +78,7 @@ if st.session_state.show_allergy_form:
 # display existing allergies
 st.subheader("Allergies List")
 
-response = requests.get("http://api:4000/allergies/")
+response = api_client.get("/allergies/")
 response.raise_for_status()
 allergies = response.json()
 
@@ -91,7 +92,7 @@ allergy_id = st.number_input("Enter Allergy ID to delete", min_value=1, step=1)
 if st.button("Delete Allergy"):
     if allergy_id:
         try:
-            response = requests.delete(f"http://api:4000/allergies/{allergy_id}")
+            response = api_client.delete(f"/allergies/{allergy_id}")
             response.raise_for_status()
             st.success("Allergy deleted successfully!")
         except requests.exceptions.RequestException as e:
@@ -1,4 +1,5 @@
 from modules.nav import SideBarLinks
+from modules import api_client
 import streamlit as st
 import requests
 import logging
@@ -9,12 +10,43 @@ logger = logging.getLogger(__name__)
 st.set_page_config(layout="wide")
 SideBarLinks()
 
-# API base URL
-API_BASE = "http://api:4000/elections"
-
 st.title("🗳️ Election Administration")
 st.write("Complete election management system for administrators")
 
+# Every tab renders on each run, so load the lists they share up front, in
+# parallel; each tab reads its copy with .result() inside its own try block
+shared = api_client.fetch_all(
+    {
+        "elections": "/elections/",
+        "terms": "/elections/terms",
+        "positions": "/elections/positions",
+        "election_list": "/elections/elections",
+    }
+)
+
+
+def render_results(results, total_votes):
+    st.write(f"**Total Votes: {total_votes}**")
+    st.write("---")
+
+    for candidate in results:
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            st.write(f"**{candidate['CandidateName']}**")
+        with col2:
+            st.write(f"Votes: {candidate['VoteCount']}")
+        with col3:
+            percentage = (
+                (candidate["VoteCount"] / total_votes * 100) if total_votes > 0 else 0
+            )
+            st.write(f"{percentage:.1f}%")
+
+        # Progress bar
+        if total_votes > 0:
+            st.progress(candidate["VoteCount"] / total_votes)
+        st.write("---")
+
+
 # Create tabs for different admin functions
 tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
     [
@@ -36,7 +68,7 @@ with tab1:
     with col1:
         st.subheader("Current Elections")
         try:
-            response = requests.get(f"{API_BASE}/")
+            response = shared["elections"].result()
             if response.status_code == 200:
                 elections = response.json()
                 if elections:
@@ -88,7 +120,7 @@ with tab2:
                         "end_date": end_date.strftime("%Y-%m-%d"),
                     }
                     try:
-                        response = requests.post(f"{API_BASE}/terms", json=data)
+                        response = api_client.post("/elections/terms", json=data)
                         if response.status_code == 201:
                             st.rerun()
                         else:
@@ -103,7 +135,7 @@ with tab2:
             with st.form("delete_term"):
                 # Get terms for dropdown
                 try:
-                    terms_response = requests.get(f"{API_BASE}/terms")
+                    terms_response = shared["terms"].result()
                     terms = (
                         terms_response.json()
                         if terms_response.status_code == 200
@@ -118,8 +150,8 @@ with tab2:
                         if selected_term:
                             try:
                                 term_id = term_options[selected_term]
-                                response = requests.delete(
-                                    f"{API_BASE}/terms/{term_id}"
+                                response = api_client.delete(
+                                    f"/elections/terms/{term_id}"
                                 )
                                 response.raise_for_status()
                                 st.rerun()
@@ -135,7 +167,7 @@ with tab2:
         with col2:
             st.write("**Existing Terms**")
             try:
-                response = requests.get(f"{API_BASE}/terms")
+                response = shared["terms"].result()
                 if response.status_code == 200:
                     terms = response.json()
                     for term in terms:
@@ -161,11 +193,18 @@ with tab2:
                     "Position Title", placeholder="e.g., President"
                 )
                 ballot_order = st.number_input("Ballot Order", min_value=1, step=1)
+                seats = st.number_input(
+                    "Seats", min_value=1, step=1, help="Winners elected (STV tally)"
+                )
 
                 if st.form_submit_button("Create Position", use_container_width=True):
-                    data = {"title": position_title, "ballot_order": ballot_order}
+                    data = {
+                        "title": position_title,
+                        "ballot_order": ballot_order,
+                        "seats": seats,
+                    }
                     try:
-                        response = requests.post(f"{API_BASE}/positions", json=data)
+                        response = api_client.post("/elections/positions", json=data)
                         if response.status_code == 201:
                             st.success("Position created successfully!")
                             st.rerun()
@@ -180,7 +219,7 @@ with tab2:
             with st.form("delete_position"):
                 # Get positions for dropdown
                 try:
-                    positions_response = requests.get(f"{API_BASE}/positions")
+                    positions_response = shared["positions"].result()
                     positions = (
                         positions_response.json()
                         if positions_response.status_code == 200
@@ -197,8 +236,8 @@ with tab2:
                         if selected_position:
                             try:
                                 position_id = position_options[selected_position]
-                                response = requests.delete(
-                                    f"{API_BASE}/positions/{position_id}"
+                                response = api_client.delete(
+                                    f"/elections/positions/{position_id}"
                                 )
                                 response.raise_for_status()
                                 st.rerun()
@@ -214,11 +253,15 @@ with tab2:
         with col2:
             st.write("**Existing Positions**")
             try:
-                response = requests.get(f"{API_BASE}/positions")
+                response = shared["positions"].result()
                 if response.status_code == 200:
                     positions = response.json()
                     for pos in positions:
-                        st.write(f"**{pos['Title']}** (Order: {pos['BallotOrder']})")
+                        seats = pos.get("Seats", 1)
+                        seats_note = f", {seats} seats" if seats > 1 else ""
+                        st.write(
+                            f"**{pos['Title']}** (Order: {pos['BallotOrder']}{seats_note})"
+                        )
                 else:
                     st.error("Failed to load positions")
             except:
@@ -234,7 +277,7 @@ with tab2:
             with col1:
                 # Get terms for dropdown
                 try:
-                    terms_response = requests.get(f"{API_BASE}/terms")
+                    terms_response = shared["terms"].result()
                     terms = (
                         terms_response.json()
                         if terms_response.status_code == 200
@@ -255,7 +298,7 @@ with tab2:
             with col2:
                 # Get positions for multi-select
                 try:
-                    positions_response = requests.get(f"{API_BASE}/positions")
+                    positions_response = shared["positions"].result()
                     positions = (
                         positions_response.json()
                         if positions_response.status_code == 200
@@ -280,7 +323,7 @@ with tab2:
                         "nominate_by": nominate_by.strftime("%Y-%m-%d"),
                     }
                     try:
-                        response = requests.post(f"{API_BASE}/", json=data)
+                        response = api_client.post("/elections/", json=data)
                         if response.status_code == 201:
                             st.success("Election created successfully!")
                             st.rerun()
@@ -297,7 +340,7 @@ with tab2:
         with st.form("delete_election"):
             # Get elections for dropdown
             try:
-                elections_response = requests.get(f"{API_BASE}/elections")
+                elections_response = shared["election_list"].result()
                 elections = (
                     elections_response.json()
                     if elections_response.status_code == 200
@@ -314,8 +357,8 @@ with tab2:
                     if selected_election:
                         try:
                             election_id = election_options[selected_election]
-                            response = requests.delete(
-                                f"{API_BASE}/elections/{election_id}"
+                            response = api_client.delete(
+                                f"/elections/elections/{election_id}"
                             )
                             response.raise_for_status()
                             st.rerun()
@@ -352,7 +395,7 @@ with tab3:
             with col3:
                 # Get positions for dropdown
                 try:
-                    positions_response = requests.get(f"{API_BASE}/positions")
+                    positions_response = shared["positions"].result()
                     positions = (
                         positions_response.json()
                         if positions_response.status_code == 200
@@ -374,7 +417,7 @@ with tab3:
                         "position": position_options[selected_position],
                     }
                     try:
-                        response = requests.post(f"{API_BASE}/nominations", json=data)
+                        response = api_client.post("/elections/nominations", json=data)
                         if response.status_code == 201:
                             st.success("Nomination submitted successfully!")
                             st.rerun()
@@ -390,7 +433,7 @@ with tab3:
         st.subheader("View Nominations by Election")
 
         try:
-            elections_response = requests.get(f"{API_BASE}/")
+            elections_response = shared["elections"].result()
             elections = (
                 elections_response.json()
                 if elections_response.status_code == 200
@@ -409,8 +452,8 @@ with tab3:
                     election_id = election_options[selected_election]
 
                     # Get nominations for selected election
-                    noms_response = requests.get(
-                        f"{API_BASE}/nominations/election/{election_id}"
+                    noms_response = api_client.get(
+                        f"/elections/nominations/election/{election_id}"
                     )
                     if noms_response.status_code == 200:
                         nominations = noms_response.json()
@@ -435,8 +478,8 @@ with tab3:
                                             use_container_width=True,
                                         ):
                                             accept_data = {"accepted": True}
-                                            accept_response = requests.put(
-                                                f"{API_BASE}/nominations/{nom['ID']}/accept",
+                                            accept_response = api_client.put(
+                                                f"/elections/nominations/{nom['ID']}/accept",
                                                 json=accept_data,
                                             )
                                             if accept_response.status_code == 200:
@@ -447,8 +490,8 @@ with tab3:
                                             use_container_width=True,
                                         ):
                                             decline_data = {"accepted": False}
-                                            decline_response = requests.put(
-                                                f"{API_BASE}/nominations/{nom['ID']}/accept",
+                                            decline_response = api_client.put(
+                                                f"/elections/nominations/{nom['ID']}/accept",
                                                 json=decline_data,
                                             )
                                             if decline_response.status_code == 200:
@@ -477,7 +520,7 @@ with tab4:
         st.subheader("Generate Ballots for Election")
 
         try:
-            elections_response = requests.get(f"{API_BASE}/")
+            elections_response = shared["elections"].result()
             elections = (
                 elections_response.json()
                 if elections_response.status_code == 200
@@ -502,8 +545,8 @@ with tab4:
                     ):
                         election_id = election_options[selected_election]
                         try:
-                            response = requests.post(
-                                f"{API_BASE}/elections/{election_id}/generate-ballots"
+                            response = api_client.post(
+                                f"/elections/elections/{election_id}/generate-ballots"
                             )
                             if response.status_code == 201:
                                 result = response.json()
@@ -523,7 +566,7 @@ with tab4:
 
                 with col2:
                     st.info(
-                        "This will create ballots for all positions with accepted nominations that don't already have winners."
+                        "This will create ballots for all positions with accepted nominations that don't already have winners or ballots, so it is safe to run again."
                     )
         except:
             st.error("Could not load elections")
@@ -541,7 +584,7 @@ with tab4:
 
         if st.button("View Member Ballots"):
             try:
-                response = requests.get(f"{API_BASE}/ballots/member/{member_id}")
+                response = api_client.get(f"/elections/ballots/member/{member_id}")
                 if response.status_code == 200:
                     ballots = response.json()
                     if ballots:
@@ -579,38 +622,130 @@ with tab5:
             "Enter Ballot ID", min_value=1, step=1, key="results_ballot"
         )
 
-        if st.button("View Results"):
+        live = st.toggle("Watch live", key="results_live")
+
+        if live:
+            # Each event carries only the options that changed, so keep the
+            # latest row per option; re-render in place as votes arrive. The
+            # server ends the stream after a few minutes, so reconnect then.
+            placeholder = st.empty()
+            options = {}
             try:
-                response = requests.get(f"{API_BASE}/ballots/{ballot_id}/results")
+                for event, data in api_client.stream_events(
+                    f"/elections/ballots/{ballot_id}/results/stream"
+                ):
+                    if event != "tally":
+                        continue
+                    for row in data["results"]:
+                        options[row["OptionID"]] = row
+                    with placeholder.container():
+                        ranked = sorted(
+                            options.values(), key=lambda row: -row["VoteCount"]
+                        )
+                        render_results(ranked, data["total_votes"])
+            except requests.HTTPError as e:
+                if e.response.status_code == 404:
+                    st.error("Ballot not found")
+                else:
+                    st.error("Could not load results")
+            except requests.RequestException:
+                st.error("Could not connect to API")
+            else:
+                st.rerun()
+        elif st.button("View Results"):
+            try:
+                response = api_client.get(f"/elections/ballots/{ballot_id}/results")
                 if response.status_code == 200:
                     results = response.json()
-
-                    st.write(f"**Total Votes: {results['total_votes']}**")
-                    st.write("---")
-
-                    for candidate in results["results"]:
-                        col1, col2, col3 = st.columns([2, 1, 1])
-                        with col1:
-                            st.write(f"**{candidate['CandidateName']}**")
-                        with col2:
-                            st.write(f"Votes: {candidate['VoteCount']}")
-                        with col3:
-                            percentage = (
-                                (candidate["VoteCount"] / results["total_votes"] * 100)
-                                if results["total_votes"] > 0
-                                else 0
-                            )
-                            st.write(f"{percentage:.1f}%")
-
-                        # Progress bar
-                        if results["total_votes"] > 0:
-                            st.progress(candidate["VoteCount"] / results["total_votes"])
-                        st.write("---")
+                    render_results(results["results"], results["total_votes"])
                 else:
                     st.error("Could not load results")
             except:
                 st.error("Could not connect to API")
 
+        st.write("---")
+        st.subheader("Ranked-Choice Tally")
+        st.caption(
+            "Instant-runoff elects one winner, STV fills the position's seats "
+            "and Schulze picks the candidate who beats every other head-to-head."
+        )
+
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            method = st.selectbox(
+                "Method",
+                ["irv", "stv", "schulze"],
+                format_func={
+                    "irv": "Instant-runoff (IRV)",
+                    "stv": "Single transferable vote (STV)",
+                    "schulze": "Schulze (Condorcet)",
+                }.get,
+                key="tally_method",
+            )
+        with col2:
+            seats = st.number_input(
+                "Seats (0 = position default)",
+                min_value=0,
+                step=1,
+                key="tally_seats",
+            )
+
+        if st.button("Run Tally"):
+            params = {"method": method}
+            if seats:
+                params["seats"] = seats
+            try:
+                response = api_client.get(
+                    f"/elections/ballots/{ballot_id}/tally", params=params
+                )
+                if response.status_code == 200:
+                    result = response.json()
+                    names = {
+                        option["OptionID"]: option["CandidateName"]
+                        for option in result["options"]
+                    }
+                    winners = ", ".join(names[w] for w in result["winners"]) or "None"
+                    st.success(f"**Winner(s):** {winners}")
+                    st.write(f"Ballots counted: {result['ballots']}")
+
+                    if result["method"] == "schulze":
+                        st.write("**Ranking:**")
+                        for place, option in enumerate(result["ranking"], start=1):
+                            st.write(f"{place}. {names[option]}")
+                        if result["tie"]:
+                            st.warning("The last seat is tied.")
+
+                    for tally_round in result["rounds"]:
+                        st.write(f"**Round {tally_round['round']}**")
+                        st.dataframe(
+                            [
+                                {
+                                    "Candidate": names[row["candidate"]],
+                                    "Votes": row["votes"],
+                                }
+                                for row in tally_round["tallies"]
+                            ],
+                            hide_index=True,
+                        )
+                        notes = [
+                            f"Elected: {names[option]}"
+                            for option in tally_round["elected"]
+                        ] + [
+                            f"Eliminated: {names[option]}"
+                            for option in tally_round["eliminated"]
+                        ]
+                        if tally_round.get("tie_break"):
+                            notes.append("(tie broken by earlier rounds)")
+                        if tally_round["exhausted"]:
+                            notes.append(f"Exhausted: {tally_round['exhausted']}")
+                        st.write(" · ".join(notes))
+                else:
+                    st.error(
+                        f"Error: {response.json().get('error', 'Could not run tally')}"
+                    )
+            except requests.exceptions.RequestException:
+                st.error("Could not connect to API")
+
     # DECLARE WINNERS
     with result_tab2:
         st.subheader("Declare Election Winners")
@@ -628,8 +763,8 @@ with tab5:
         if st.button("Declare Winner", type="primary"):
             data = {"member_id": winner_member_id}
             try:
-                response = requests.post(
-                    f"{API_BASE}/ballots/{ballot_id_winner}/declare-winner", json=data
+                response = api_client.post(
+                    f"/elections/ballots/{ballot_id_winner}/declare-winner", json=data
                 )
                 if response.status_code == 201:
                     st.success("Winner declared successfully!")
@@ -643,7 +778,7 @@ with tab6:
     st.header("Election Reports")
 
     try:
-        elections_response = requests.get(f"{API_BASE}/")
+        elections_response = shared["elections"].result()
         elections = (
             elections_response.json() if elections_response.status_code == 200 else []
         )
@@ -661,10 +796,15 @@ with tab6:
             if selected_election:
                 election_id = election_options[selected_election]
 
-                # Get winners for this election
-                winners_response = requests.get(
-                    f"{API_BASE}/elections/{election_id}/winners"
+                report = api_client.fetch_all(
+                    {
+                        "winners": f"/elections/elections/{election_id}/winners",
+                        "nominations": f"/elections/nominations/election/{election_id}",
+                    }
                 )
+
+                # Get winners for this election
+                winners_response = report["winners"].result()
                 if winners_response.status_code == 200:
                     winners = winners_response.json()
 
@@ -680,9 +820,7 @@ with tab6:
                         st.info("No winners declared yet")
 
                 # Get nomination statistics
-                nominations_response = requests.get(
-                    f"{API_BASE}/nominations/election/{election_id}"
-                )
+                nominations_response = report["nominations"].result()
                 if nominations_response.status_code == 200:
                     nominations = nominations_response.json()
 
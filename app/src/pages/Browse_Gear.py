@@ -1,5 +1,6 @@
-import requests
 from modules.nav import SideBarLinks
+from modules import api_client
+from modules.pagination import fetch_pages, load_more_button
 import streamlit as st
 import pandas as pd
 import logging
@@ -18,12 +19,13 @@ st.header("Browse Gear")
 # Access the session state for a personalized app experience
 st.write(f"### Hi, {st.session_state['first_name']}.")
 
-# Fetch gear data from the API
-data = requests.get("http://api:4000/gear").json()
+# Fetch gear data from the API, one page at a time
+data, more_gear = fetch_pages("/gear", "gear")
 gear_df = pd.DataFrame(data)
 
 # Display the gear data
 st.dataframe(gear_df)
+load_more_button("gear", more_gear, label="Load more gear")
 
 # Allow users to reserve gear
 st.subheader("Reserve Gear")
@@ -58,7 +60,7 @@ if st.button("Reserve Gear"):
         "start_date": check_out_date.strftime("%Y-%m-%d"),
         "end_date": return_date.strftime("%Y-%m-%d"),
     }
-    response = requests.post("http://api:4000/gear/reservation", json=reservation_data)
+    response = api_client.post("/gear/reservation", json=reservation_data)
     if response.status_code == 200:
         st.success(f"You have reserved {selected_gear}(s).")
     else:
@@ -86,7 +88,7 @@ if st.session_state.get("first_name") == "Jacob":
                 "PurchaseOrder": 0,  # Default purchase order
                 "Availability": "Available for checkout",  # Default availability
             }
-            response = requests.post("http://api:4000/", json=new_gear_data)
+            response = api_client.post("/", json=new_gear_data)
             if response.status_code == 201:
                 st.success(f"{new_gear} has been added.")
             else:
@@ -99,7 +101,7 @@ if st.session_state.get("first_name") == "Jacob":
 
     if st.button("Delete Gear"):
         gear_id = gear_df.loc[gear_df["Name"] == gear_to_delete, "ID"].values[0]
-        response = requests.delete(f"http://api:4000/{gear_id}")
+        response = api_client.delete(f"/{gear_id}")
         if response.status_code == 204:
             gear_df = gear_df[gear_df["Name"] != gear_to_delete]
             st.success(f"{gear_to_delete} has been deleted.")
@@ -1,4 +1,5 @@
 from modules.nav import SideBarLinks
+from modules import api_client
 import streamlit as st
 import requests
 import logging
@@ -8,9 +9,6 @@ logger = logging.getLogger(__name__)
 st.set_page_config(layout="wide")
 SideBarLinks()
 
-# Define the base URL for the API
-BASE_URL = "http://api:4000"
-
 # Initialize cart in session state
 if "cart" not in st.session_state:
     st.session_state.cart = {}
@@ -19,13 +17,11 @@ if "show_cart" not in st.session_state:
     st.session_state.show_cart = False
 
 
-# Function to fetch merch items from the API
-@st.cache_data(ttl=60)  # Cache for 1 minute
+# Function to fetch merch items from the API (cached by api_client; adding,
+# selling or deleting items invalidates it)
 def fetch_merch_items():
     try:
-        response = requests.get(f"{BASE_URL}/merch")
-        response.raise_for_status()
-        return response.json()
+        return api_client.get_json("/merch")
     except requests.exceptions.ConnectionError:
         st.error("Unable to connect to the API. Please ensure the server is running.")
         return []
@@ -159,8 +155,8 @@ if st.session_state.get("checkout_mode", False):
                     for _ in range(item["quantity"]):
                         try:
                             cash = payment_method == "Cash"
-                            response = requests.post(
-                                f"{BASE_URL}/merch/merch-sales",
+                            response = api_client.post(
+                                "/merch/merch-sales",
                                 json={"cash": cash, "ID": int(item_id)},
                             )
                             if response.status_code == 200:
@@ -204,8 +200,8 @@ if (
         if st.button("Add Item", use_container_width=True):
             if new_item_name and new_item_price >= 0:
                 try:
-                    response = requests.post(
-                        f"{BASE_URL}/merch/merch-items",
+                    response = api_client.post(
+                        "/merch/merch-items",
                         json={
                             "name": new_item_name,
                             "price": new_item_price,
@@ -215,7 +211,6 @@ if (
                     )
                     if response.status_code == 201:
                         st.success(f"Added {new_item_name}!")
-                        st.cache_data.clear()  # Clear cache to refresh items
                         st.rerun()
                     else:
                         st.error("Failed to add item")
@@ -231,7 +226,7 @@ if st.session_state["role"] in ["treasurer", "vp", "administrator"]:
 
         try:
             # Fetch sales data
-            sales_response = requests.get(f"{BASE_URL}/merch/merch-report")
+            sales_response = api_client.get("/merch/merch-report")
             if sales_response.status_code == 200:
                 sales_data = sales_response.json()
 
@@ -288,8 +283,8 @@ if st.session_state["role"] in ["treasurer", "vp", "administrator"]:
                         filtered_sales = []
                         for sale in sales_data:
                             try:
-                                sale_date = datetime.strptime(
-                                    sale["SaleDate"], "%a, %d %b %Y %H:%M:%S %Z"
+                                sale_date = datetime.fromisoformat(
+                                    sale["SaleDate"]
                                 ).date()
 
                                 if date_filter == "Today" and sale_date == today:
@@ -341,9 +336,7 @@ if st.session_state["role"] in ["treasurer", "vp", "administrator"]:
                                 reverse=True,
                             ):
                                 try:
-                                    sale_date = datetime.strptime(
-                                        sale["SaleDate"], "%a, %d %b %Y %H:%M:%S %Z"
-                                    )
+                                    sale_date = datetime.fromisoformat(sale["SaleDate"])
                                     formatted_date = sale_date.strftime(
                                         "%m/%d/%Y %H:%M"
                                     )
@@ -398,9 +391,7 @@ if st.session_state["role"] in ["treasurer", "vp", "administrator"]:
                             # Format the data
                             for index, row in df.iterrows():
                                 try:
-                                    sale_date = datetime.strptime(
-                                        row["SaleDate"], "%a, %d %b %Y %H:%M:%S %Z"
-                                    )
+                                    sale_date = datetime.fromisoformat(row["SaleDate"])
                                     df.at[index, "SaleDate"] = sale_date.strftime(
                                         "%Y-%m-%d %H:%M:%S"
                                     )
@@ -482,12 +473,11 @@ if not st.session_state.get("checkout_mode", False):
                                     "🗑️", key=f"delete_{item['ID']}", help="Delete item"
                                 ):
                                     try:
-                                        response = requests.delete(
-                                            f"{BASE_URL}/merch/{item['ID']}"
+                                        response = api_client.delete(
+                                            f"/merch/{item['ID']}"
                                         )
                                         if response.status_code == 200:
                                             st.success("Deleted!")
-                                            st.cache_data.clear()
                                             st.rerun()
                                         else:
                                             st.error("Delete failed")
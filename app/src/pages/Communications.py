@@ -1,6 +1,6 @@
 from modules.nav import SideBarLinks
+from modules import api_client
 import streamlit as st
-import requests
 import logging
 from datetime import datetime, timedelta
 
@@ -9,8 +9,6 @@ logger = logging.getLogger(__name__)
 st.set_page_config(layout="wide")
 SideBarLinks()
 
-# Define the base URL for the API
-BASE_URL = "http://api:4000"
 member_id = st.session_state.get("member_id")
 user_role = st.session_state.get("role", "member")
 
@@ -23,13 +21,18 @@ is_admin = user_role in ["administrator", "vp", "president", "secretary"]
 if is_admin:
     tab1, tab2 = st.tabs(["📨 Send Messages", "📥 My Messages"])
 
+    # Both tabs render on each run; load their data in parallel
+    fetched = api_client.fetch_all(
+        {"members": "/members", "messages": f"/communications/{member_id}"}
+    )
+
     # ==================== SEND MESSAGES TAB ====================
     with tab1:
         st.header("Send Mass Communication")
 
         # Fetch all members for recipient selection
         try:
-            members_response = requests.get(f"{BASE_URL}/members")
+            members_response = fetched["members"].result()
             if members_response.status_code == 200:
                 all_members = members_response.json()
 
@@ -168,8 +171,8 @@ if is_admin:
                             }
 
                             try:
-                                response = requests.post(
-                                    f"{BASE_URL}/communications",
+                                response = api_client.post(
+                                    "/communications",
                                     json=communication_data,
                                 )
                                 if response.status_code == 201:
@@ -202,7 +205,7 @@ if is_admin:
 
         try:
             # Get messages for the current user
-            messages_response = requests.get(f"{BASE_URL}/communications/{member_id}")
+            messages_response = fetched["messages"].result()
             if messages_response.status_code == 200:
                 data = messages_response.json()
                 messages = data.get("messages", [])
@@ -237,9 +240,7 @@ if is_admin:
                         filtered_messages = []
                         for msg in messages:
                             try:
-                                msg_date = datetime.strptime(
-                                    msg["DateSent"], "%a, %d %b %Y %H:%M:%S %Z"
-                                )
+                                msg_date = datetime.fromisoformat(msg["DateSent"])
                                 if msg_date >= cutoff_date:
                                     filtered_messages.append(msg)
                             except:
@@ -264,9 +265,7 @@ if is_admin:
                     for message in filtered_messages:
                         # Format date
                         try:
-                            msg_date = datetime.strptime(
-                                message["DateSent"], "%a, %d %b %Y %H:%M:%S %Z"
-                            )
+                            msg_date = datetime.fromisoformat(message["DateSent"])
                             formatted_date = msg_date.strftime("%B %d, %Y at %I:%M %p")
                         except:
                             formatted_date = message["DateSent"]
@@ -275,18 +274,18 @@ if is_admin:
                         with st.expander(f"📧 {message['Subject']} - {formatted_date}"):
                             st.write(f"**Subject:** {message['Subject']}")
                             st.write(f"**Date:** {formatted_date}")
-                            st.write(f"**Message:**")
+                            st.write("**Message:**")
                             st.write(message["Content"])
 
                             # Delete button for admins
                             if st.button(
-                                f"🗑️ Delete",
+                                "🗑️ Delete",
                                 key=f"delete_{message['ID']}",
                                 help="Delete this message",
                             ):
                                 try:
-                                    delete_response = requests.delete(
-                                        f"{BASE_URL}/communications/{message['ID']}"
+                                    delete_response = api_client.delete(
+                                        f"/communications/{message['ID']}"
                                     )
                                     if delete_response.status_code == 200:
                                         st.success("Message deleted!")
@@ -308,7 +307,7 @@ else:
 
     try:
         # Get messages for the current user
-        messages_response = requests.get(f"{BASE_URL}/communications/{member_id}")
+        messages_response = api_client.get(f"/communications/{member_id}")
         if messages_response.status_code == 200:
             data = messages_response.json()
             messages = data.get("messages", [])
@@ -337,9 +336,7 @@ else:
                 for message in filtered_messages:
                     # Format date
                     try:
-                        msg_date = datetime.strptime(
-                            message["DateSent"], "%a, %d %b %Y %H:%M:%S %Z"
-                        )
+                        msg_date = datetime.fromisoformat(message["DateSent"])
                         formatted_date = msg_date.strftime("%B %d, %Y at %I:%M %p")
                     except:
                         formatted_date = message["DateSent"]
@@ -348,7 +345,7 @@ else:
                     with st.expander(f"📧 {message['Subject']} - {formatted_date}"):
                         st.write(f"**Subject:** {message['Subject']}")
                         st.write(f"**Date:** {formatted_date}")
-                        st.write(f"**Message:**")
+                        st.write("**Message:**")
                         st.write(message["Content"])
             else:
                 st.info("📭 No messages received yet")
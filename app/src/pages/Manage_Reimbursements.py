@@ -2,6 +2,8 @@ import requests
 import streamlit as st
 import pandas as pd
 from modules.nav import SideBarLinks
+from modules import api_client
+from modules.pagination import fetch_pages, load_more_button
 
 st.set_page_config(layout="wide")
 SideBarLinks()
@@ -14,13 +16,18 @@ if is_treasurer:
 
     # Fetch reimbursement data
     try:
-        reimbursement_data = requests.get("http://api:4000/reimbursements").json()
+        reimbursement_data, more_reimbursements = fetch_pages(
+            "/reimbursements", "reimbursements"
+        )
 
         if not reimbursement_data:
             st.info("No reimbursement requests found.")
         else:
             # Create DataFrame
             df = pd.DataFrame(reimbursement_data)
+            load_more_button(
+                "reimbursements", more_reimbursements, label="Load more requests"
+            )
 
             # Summary metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -53,17 +60,23 @@ if is_treasurer:
                 )
 
             with col_filter2:
-                # Member filter - fetch names using API for each unique MemberID
-                member_ids = df["MemberID"].unique().tolist()
-                member_names = {}
-                for member_id in member_ids:
-                    try:
-                        resp = requests.get(f"http://api:4000/members/{member_id}")
-                        if resp.status_code == 200:
-                            data = resp.json()
-                            member_data = data.get(
-                                "member", {}
-                            )  # Extract the member object
+                # Member filter - fetch names for every unique MemberID in one call
+                member_ids = df["MemberID"].dropna().unique().tolist()
+                member_names = {
+                    member_id: f"ID {member_id}" for member_id in member_ids
+                }
+                try:
+                    resp = api_client.post(
+                        "/members/lookup",
+                        params={"fields": "FirstName,PreferredName,LastName"},
+                        json={"ids": [int(member_id) for member_id in member_ids]},
+                    )
+                    if resp.status_code == 200:
+                        found = resp.json().get("members", {})
+                        for member_id in member_ids:
+                            member_data = found.get(str(int(member_id)))
+                            if not member_data:
+                                continue
                             # Prefer PreferredName if available, else FirstName
                             first_name = member_data.get(
                                 "PreferredName"
@@ -71,10 +84,8 @@ if is_treasurer:
                             last_name = member_data.get("LastName", "")
                             full_name = f"{first_name} {last_name}".strip()
                             member_names[member_id] = full_name
-                        else:
-                            member_names[member_id] = f"ID {member_id}"
-                    except Exception:
-                        member_names[member_id] = f"ID {member_id}"
+                except Exception:
+                    pass
 
                 # Map MemberID to MemberName in df
                 df["MemberName"] = df["MemberID"].map(member_names)
@@ -137,8 +148,8 @@ if is_treasurer:
                                     type="primary",
                                 ):
                                     try:
-                                        response = requests.put(
-                                            f"http://api:4000/reimbursements/{row['ID']}/approve"
+                                        response = api_client.put(
+                                            f"/reimbursements/{row['ID']}/approve"
                                         )
                                         if response.status_code == 200:
                                             st.success(
@@ -190,8 +201,8 @@ if is_treasurer:
                             success_count = 0
                             for _, row in pending_in_filter.iterrows():
                                 try:
-                                    response = requests.put(
-                                        f"http://api:4000/reimbursements/{row['ID']}/approve"
+                                    response = api_client.put(
+                                        f"/reimbursements/{row['ID']}/approve"
                                     )
                                     if response.status_code == 200:
                                         success_count += 1
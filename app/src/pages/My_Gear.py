@@ -1,6 +1,6 @@
-import requests
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks
+from modules import api_client
 import streamlit as st
 import pandas as pd
 import logging
@@ -19,8 +19,8 @@ st.write(f"### Hi, {st.session_state['first_name']}.")
 
 # Display user's gear reservations
 st.subheader("Your Gear Reservations")
-user_reservations = requests.get(
-    f"http://api:4000/gear/reservations/{st.session_state.get('member_id')}"
+user_reservations = api_client.get(
+    f"/gear/reservations/{st.session_state.get('member_id')}"
 ).json()  # Assuming this endpoint returns user's reservations
 st.dataframe(pd.DataFrame(user_reservations))
 
@@ -34,8 +34,8 @@ if st.session_state.get("first_name") == "Jacob":
 
     if st.button("Add Gear"):
         if new_gear and new_available > 0 and new_price >= 0:
-            response = requests.post(
-                "http://api:4000/add_gear",
+            response = api_client.post(
+                "/add_gear",
                 json={"gear": new_gear, "available": new_available, "price": new_price},
             )
             if response.status_code == 200:
@@ -47,7 +47,7 @@ if st.session_state.get("first_name") == "Jacob":
     gear_to_delete = st.selectbox("Select Gear to Delete", gear_df["Gear"])
 
     if st.button("Delete Gear"):
-        response = requests.delete(f"http://api:4000/delete_gear/{gear_to_delete}")
+        response = api_client.delete(f"/delete_gear/{gear_to_delete}")
         if response.status_code == 200:
             st.success(f"{gear_to_delete} has been deleted.")
         else:
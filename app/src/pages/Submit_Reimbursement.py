@@ -5,13 +5,12 @@ import requests
 
 st.set_page_config(layout="wide")
 from modules.nav import SideBarLinks
+from modules import api_client
 
 SideBarLinks()
 
 st.title("Submit Reimbursement Request")
 
-API_BASE = "http://api:4000"
-
 # Get member ID from session state
 member_id = st.session_state.get("member_id")
 
@@ -111,13 +110,11 @@ if st.button("Submit Reimbursement", use_container_width=True):
 
     try:
         with st.spinner("Submitting reimbursement..."):
-            response = requests.post(
-                f"{API_BASE}/reimbursements/", json=payload, timeout=10
-            )
+            response = api_client.post("/reimbursements/", json=payload, timeout=10)
             response.raise_for_status()
 
         result = response.json()
-        st.success(f"✅ Reimbursement submitted successfully!")
+        st.success("✅ Reimbursement submitted successfully!")
         st.info(f"Reimbursement ID: {result.get('reimbursement_id')}")
         st.info(f"Status: {result.get('status', 'Pending')}")
 
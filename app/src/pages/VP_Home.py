@@ -1,6 +1,5 @@
 from modules.nav import SideBarLinks
 import streamlit as st
-import requests
 import logging
 
 logger = logging.getLogger(__name__)
@@ -1,16 +1,15 @@
 # ManageMembers.py
-import os
 import requests
 import pandas as pd
 import streamlit as st
 from modules.nav import SideBarLinks
+from modules import api_client
+from modules.pagination import fetch_pages, load_more_button
 
 st.set_page_config(layout="wide")
 SideBarLinks()
 st.title("Manage Members")
 
-API_BASE = os.getenv("API_BASE") or "http://web-api:4000"
-
 # The logged-in user's info (actor)
 actor_id = st.session_state.get("member_id")
 if not actor_id:
@@ -19,15 +18,27 @@ if not actor_id:
 
 headers = {"X-Actor-ID": str(actor_id)}  # used if you add backend permission checks
 
-# ---- Load all members
+# ---- Load members, one page at a time
 with st.spinner("Loading members..."):
     try:
-        resp = requests.get(f"{API_BASE}/members", headers=headers, timeout=15)
-        if resp.status_code == 403:
+        members, more_members = fetch_pages(
+            "/members",
+            "members",
+            envelope="members",
+            # Only what the filters and picker table use
+            params={
+                "fields": "ID,FirstName,PreferredName,LastName,"
+                "GraduationYear,IsGradStudent"
+            },
+            headers=headers,
+            timeout=15,
+        )
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 403:
             st.error("You do not have permission to manage members.")
             st.stop()
-        resp.raise_for_status()
-        members = resp.json().get("members", [])
+        st.error(f"Failed to fetch members: {e}")
+        st.stop()
     except Exception as e:
         st.error(f"Failed to fetch members: {e}")
         st.stop()
@@ -100,6 +111,7 @@ cols = [
 ]
 df = pd.DataFrame(filtered)[[c for c in cols if c in filtered[0].keys()]]
 st.dataframe(df, use_container_width=True, hide_index=True)
+load_more_button("members", more_members, label="Load more members")
 
 # ---- Select a member to edit
 labels = [
@@ -111,7 +123,7 @@ selected_id = label_to_id[selected_label]
 
 # ---- Load fresh single-member view (to avoid stale data)
 try:
-    one = requests.get(f"{API_BASE}/members/{selected_id}", headers=headers, timeout=10)
+    one = api_client.get(f"/members/{selected_id}", headers=headers, timeout=10)
     one.raise_for_status()
     profile = one.json()["member"]
 except Exception as e:
@@ -169,8 +181,8 @@ with st.form("edit_member_form", clear_on_submit=False):
             "emer_contact_phone": emer_contact_phone,
         }
         try:
-            up = requests.put(
-                f"{API_BASE}/members/{selected_id}",
+            up = api_client.put(
+                f"/members/{selected_id}",
                 json=payload,
                 headers=headers,
                 timeout=15,
@@ -190,8 +202,8 @@ colA, colB = st.columns([1, 4])
 with colA:
     if st.button("Renew / Activate"):
         try:
-            act = requests.put(
-                f"{API_BASE}/members/{selected_id}/activate",
+            act = api_client.put(
+                f"/members/{selected_id}/activate",
                 headers=headers,
                 timeout=10,
             )
@@ -242,8 +254,8 @@ with st.form("add_member_form"):
                 "emer_contact_phone": new_emer_phone,
             }
             try:
-                resp = requests.post(
-                    f"{API_BASE}/members", json=payload, headers=headers, timeout=15
+                resp = api_client.post(
+                    "/members", json=payload, headers=headers, timeout=15
                 )
                 if resp.status_code == 201:
                     st.success("Member added successfully")
@@ -252,3 +264,32 @@ with st.form("add_member_form"):
                     st.error(f"Failed to add member (status {resp.status_code})")
             except Exception as e:
                 st.error(f"Error adding member: {e}")
+
+# ---- Bulk import from a roster file (same columns as Add Member)
+st.divider()
+st.subheader("Import Roster")
+st.caption(
+    "CSV or Parquet with columns first_name, last_name, preferred_name, "
+    "graduation_year, is_grad_student, activation_date, car_plate, car_state, "
+    "car_pass_count, emer_contact_name, emer_contact_phone"
+)
+roster_file = st.file_uploader("Roster file", type=["csv", "parquet"])
+keep_valid = st.checkbox("Import valid rows even if some rows have errors")
+if roster_file is not None and st.button("Import Members"):
+    try:
+        resp = api_client.post(
+            "/members/bulk",
+            params={"partial": "true"} if keep_valid else None,
+            files={"file": (roster_file.name, roster_file.getvalue())},
+            headers=headers,
+            timeout=120,
+        )
+        result = resp.json()
+        if resp.status_code == 201:
+            st.success(result["message"])
+        else:
+            st.error(result.get("error", f"Import failed (status {resp.status_code})"))
+        if result.get("errors"):
+            st.dataframe(pd.DataFrame(result["errors"]), use_container_width=True)
+    except Exception as e:
+        st.error(f"Error importing roster: {e}")
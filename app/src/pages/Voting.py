@@ -1,6 +1,6 @@
 from modules.nav import SideBarLinks
+from modules import api_client
 import streamlit as st
-import requests
 import logging
 from datetime import datetime
 
@@ -9,8 +9,6 @@ logger = logging.getLogger(__name__)
 st.set_page_config(layout="wide")
 SideBarLinks()
 
-BASE_URL = "http://api:4000"
-
 st.title("🗳️ Election Voting")
 st.write("Cast your votes for upcoming elections")
 
@@ -23,7 +21,7 @@ if not member_id:
 
 # Fetch member's available ballots
 try:
-    ballots_response = requests.get(f"{BASE_URL}/elections/ballots/member/{member_id}")
+    ballots_response = api_client.get(f"/elections/ballots/member/{member_id}")
     if ballots_response.status_code == 200:
         ballots = ballots_response.json()
     else:
@@ -64,8 +62,8 @@ with tab1:
 
                     # Get ballot details and options for this ballot
                 try:
-                    ballot_response = requests.get(
-                        f"{BASE_URL}/elections/ballots/{ballot['BallotID']}"
+                    ballot_response = api_client.get(
+                        f"/elections/ballots/{ballot['BallotID']}"
                     )
                     if ballot_response.status_code == 200:
                         ballot_data = ballot_response.json()
@@ -73,17 +71,21 @@ with tab1:
 
                         if options:
                             st.write("**Candidates:**")
+                            seats = ballot_data["ballot"].get("Seats") or 1
+                            if seats > 1:
+                                st.caption(f"This position has {seats} seats.")
 
                             # Create voting form for this ballot
                             with st.form(f"vote_form_{ballot['BallotID']}"):
-                                # Use selectbox for cleaner UI (remove radio buttons)
+                                # Ranked ballot: the order candidates are picked in
+                                # is the order of preference
                                 candidate_options = {
                                     f"{opt['CandidateName']}": opt["OptionID"]
                                     for opt in options
                                 }
-                                selected_candidate = st.selectbox(
-                                    "Choose candidate:",
-                                    options=[""] + list(candidate_options.keys()),
+                                ranked_candidates = st.multiselect(
+                                    "Rank candidates (pick your first choice first):",
+                                    options=list(candidate_options.keys()),
                                     key=f"select_{ballot['BallotID']}",
                                 )
 
@@ -101,9 +103,10 @@ with tab1:
 
                                 # Handle vote submission
                                 if submit_vote:
-                                    if selected_candidate and selected_candidate != "":
-                                        selected_option_id = candidate_options[
-                                            selected_candidate
+                                    if ranked_candidates:
+                                        rankings = [
+                                            candidate_options[candidate]
+                                            for candidate in ranked_candidates
                                         ]
 
                                         # Confirm vote
@@ -114,12 +117,12 @@ with tab1:
                                             vote_data = {
                                                 "member_id": member_id,
                                                 "ballot_id": ballot["BallotID"],
-                                                "ballot_option_id": selected_option_id,
+                                                "rankings": rankings,
                                             }
 
                                             try:
-                                                vote_response = requests.post(
-                                                    f"{BASE_URL}/elections/votes",
+                                                vote_response = api_client.post(
+                                                    "/elections/votes",
                                                     json=vote_data,
                                                 )
 
@@ -150,7 +153,7 @@ with tab1:
                                         else:
                                             # Show confirmation
                                             st.warning(
-                                                f"⚠️ Confirm your vote for **{selected_candidate}** in {ballot['PositionTitle']}"
+                                                f"⚠️ Confirm your ranking **{' > '.join(ranked_candidates)}** in {ballot['PositionTitle']}"
                                             )
                                             st.session_state[
                                                 f"confirm_vote_{ballot['BallotID']}"
@@ -198,7 +201,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.write("**Voting Guidelines:**")
-    st.write("• One vote per position")
+    st.write("• One ballot per position; rank as many candidates as you like")
     st.write("• Votes cannot be changed once submitted")
     st.write("• All votes are anonymous")
     st.write("• Voting deadlines are strictly enforced")
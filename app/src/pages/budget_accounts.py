@@ -1,20 +1,19 @@
 # pages/budget_accounts.py
 import streamlit as st
 import requests
+from modules import api_client
 import pandas as pd
 
 st.set_page_config(page_title="Budget Accounts", page_icon="🏦")
 st.header("Budget Accounts")
 
-API_BASE = "http://api:4000/budget"
-
 # Back to overview
 st.page_link("pages/Budget_Overview.py", label="← Back to Budgets", icon="↩️")
 
 # --- Load budgets for selection (GET /budget) ---
 budgets = []
 try:
-    r = requests.get(API_BASE, timeout=15)
+    r = api_client.get("/budget", timeout=15)
     r.raise_for_status()
     data = r.json()
     budgets = data if isinstance(data, list) else data.get("results", [])
@@ -56,7 +55,7 @@ st.caption(f"Selected Budget ID: {selected_budget_id}")
 accounts = []
 try:
     with st.spinner(f"Loading accounts for budget #{selected_budget_id}..."):
-        bresp = requests.get(f"{API_BASE}/{selected_budget_id}", timeout=15)
+        bresp = api_client.get(f"/budget/{selected_budget_id}", timeout=15)
         bresp.raise_for_status()
         bdata = bresp.json()
         accounts = bdata.get("Accounts") or []
@@ -105,7 +104,7 @@ if create:
         attempts = [
             (
                 "POST",
-                f"{API_BASE}/{selected_budget_id}/accounts",
+                f"/budget/{selected_budget_id}/accounts",
                 {
                     "json": {
                         "AcctCode": acct_code.strip(),
@@ -115,7 +114,7 @@ if create:
             ),
             (
                 "POST",
-                "http://api:4000/accounts",
+                "/accounts",
                 {
                     "json": {
                         "Budget": int(selected_budget_id),
@@ -132,7 +131,7 @@ if create:
         for method, url, kwargs in attempts:
             try:
                 with st.spinner(f"Creating account via {method} {url} ..."):
-                    resp = requests.request(method, url, timeout=20, **kwargs)
+                    resp = api_client.request(method, url, timeout=20, **kwargs)
                 last_status = resp.status_code
                 try:
                     last_body = resp.json()
@@ -1,12 +1,11 @@
 # pages/budget_accounts_id.py
 import streamlit as st
 import requests
+from modules import api_client
 
 st.set_page_config(page_title="Budget Account", page_icon="🧾")
 st.header("Budget Account Details")
 
-API_BASE = "http://api:4000/budget"
-
 # Nav
 st.page_link("pages/Budget_Overview.py", label="← Back to Budgets", icon="↩️")
 st.page_link("pages/budget_accounts.py", label="← Back to Accounts", icon="↩️")
@@ -43,7 +42,7 @@ st.caption(f"Budget ID: {budget_id} • Account ID: {account_id}")
 account = None
 try:
     with st.spinner(f"Loading Budget #{budget_id}..."):
-        bresp = requests.get(f"{API_BASE}/{budget_id}", timeout=15)
+        bresp = api_client.get(f"/budget/{budget_id}", timeout=15)
         if bresp.status_code == 404:
             st.error(f"Budget {budget_id} not found.")
             st.stop()
@@ -84,10 +83,10 @@ if do_update:
     else:
         payload = {"AcctCode": new_code.strip(), "AcctTitle": new_title.strip()}
         attempts = [
-            ("PUT", f"{API_BASE}/{budget_id}/accounts/{account_id}", {"json": payload}),
+            ("PUT", f"/budget/{budget_id}/accounts/{account_id}", {"json": payload}),
             (
                 "PUT",
-                "http://api:4000/accounts/" + account_id,
+                "/accounts/" + account_id,
                 {"json": {**payload, "Budget": int(budget_id)}},
             ),
         ]
@@ -97,7 +96,7 @@ if do_update:
         for method, url, kwargs in attempts:
             try:
                 with st.spinner(f"Updating via {method} {url} ..."):
-                    resp = requests.request(method, url, timeout=20, **kwargs)
+                    resp = api_client.request(method, url, timeout=20, **kwargs)
                 last_status = resp.status_code
                 try:
                     last_body = resp.json()
@@ -133,8 +132,8 @@ st.subheader("Delete Account")
 danger = st.checkbox("I understand this will permanently delete this account.")
 if st.button("🗑️ Delete Account", disabled=not danger, use_container_width=True):
     attempts = [
-        ("DELETE", f"{API_BASE}/{budget_id}/accounts/{account_id}", {}),
-        ("DELETE", "http://api:4000/accounts/" + account_id, {}),
+        ("DELETE", f"/budget/{budget_id}/accounts/{account_id}", {}),
+        ("DELETE", "/accounts/" + account_id, {}),
     ]
     deleted = False
     last_status = None
@@ -142,7 +141,7 @@ if st.button("🗑️ Delete Account", disabled=not danger, use_container_width=
     for method, url, kwargs in attempts:
         try:
             with st.spinner(f"Deleting via {method} {url} ..."):
-                resp = requests.request(method, url, timeout=20, **kwargs)
+                resp = api_client.request(method, url, timeout=20, **kwargs)
             last_status = resp.status_code
             try:
                 last_body = resp.json()
@@ -1,6 +1,7 @@
 # pages/budget_id.py
 import streamlit as st
 import requests
+from modules import api_client
 
 # Optional nav
 try:
@@ -13,8 +14,6 @@ except Exception:
 
 st.header("Budget Details")
 
-API_URL = "http://api:4000/budget"
-
 # Back to overview link
 st.page_link("pages/Budget_Overview.py", label="← Back to Overview", icon="↩️")
 
@@ -39,7 +38,7 @@ budget_id = str(budget_id)
 # --- GET: fetch budget details (aligned to backend spec) ---
 try:
     with st.spinner(f"Loading budget #{budget_id}..."):
-        resp = requests.get(f"{API_URL}/{budget_id}", timeout=15)
+        resp = api_client.get(f"/budget/{budget_id}", timeout=15)
         resp.raise_for_status()
         budget = resp.json()
 except requests.RequestException as e:
@@ -86,8 +85,8 @@ st.subheader("Approve Budget")
 
 if st.button("✅ Approve Budget", use_container_width=True):
     try:
-        put_resp = requests.put(
-            f"{API_URL}/{budget_id}/approve",
+        put_resp = api_client.put(
+            f"/budget/{budget_id}/approve",
             json={"ApprovedBy": st.session_state["member_id"]},
             timeout=15,
         )
@@ -110,7 +109,7 @@ with st.expander("Danger Zone"):
     confirm = st.checkbox("I understand and want to delete this budget.")
     if st.button("🗑️ Delete Budget", disabled=not confirm, use_container_width=True):
         try:
-            del_resp = requests.delete(f"{API_URL}/{budget_id}", timeout=15)
+            del_resp = api_client.delete(f"/budget/{budget_id}", timeout=15)
             del_resp.raise_for_status()
             st.success("Budget deleted.")
             # Clear saved id and go back to list
@@ -1,14 +1,13 @@
 # pages/budget_id_report.py
 import streamlit as st
 import requests
+from modules import api_client
 import pandas as pd
 from datetime import date
 
 st.set_page_config(page_title="Spending Report", page_icon="📊")
 st.header("Spending Report")
 
-API_BASE = "http://api:4000/budget"
-
 # Nav
 st.page_link("pages/Budget_Overview.py", label="← Back to Overview", icon="↩️")
 
@@ -52,7 +51,7 @@ if run:
     try:
         with st.spinner("Generating report..."):
             # ✅ Correct endpoint per your backend: GET /budget/<id>/report
-            resp = requests.get(f"{API_BASE}/{budget_id}/report", timeout=20)
+            resp = api_client.get(f"/budget/{budget_id}/report", timeout=20)
             resp.raise_for_status()
             data = resp.json()
     except requests.RequestException as e:
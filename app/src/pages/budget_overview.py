@@ -1,15 +1,14 @@
 import streamlit as st
 import requests
 from modules.nav import SideBarLinks
+from modules import api_client
 
 SideBarLinks()
 
-API_BASE = "http://api:4000/budget"
-
 # GET: budgets
 budgets = []
 try:
-    r = requests.get(API_BASE, timeout=15)
+    r = api_client.get("/budget", timeout=15)
     r.raise_for_status()
     data = r.json()
     budgets = data if isinstance(data, list) else data.get("results", [])
@@ -69,7 +68,7 @@ with st.form("new_budget_form"):
             payload["Status"] = status
 
         try:
-            resp = requests.post(f"{API_BASE}/", json=payload, timeout=15)
+            resp = api_client.post("/budget/", json=payload, timeout=15)
             # Show server response to confirm what happened
             try:
                 body = resp.json()
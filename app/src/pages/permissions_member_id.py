@@ -3,12 +3,11 @@ import streamlit as st
 import requests
 import pandas as pd
 from modules.nav import SideBarLinks
+from modules import api_client
 
 st.set_page_config(page_title="Member Permissions", page_icon="🧾")
 st.header("Member Permissions")
 
-API_BASE = "http://api:4000/permissions"
-
 SideBarLinks()
 
 st.divider()
@@ -23,7 +22,7 @@ member_id = st.number_input(
 if st.button("View Member's Permissions", type="primary"):
     try:
         with st.spinner(f"Loading permissions for member #{member_id}..."):
-            resp = requests.get(f"{API_BASE}/{int(member_id)}", timeout=15)
+            resp = api_client.get(f"/permissions/{int(member_id)}", timeout=15)
             resp.raise_for_status()
             data = resp.json()
     except requests.RequestException as e:
@@ -3,12 +3,11 @@ import streamlit as st
 import requests
 import pandas as pd
 from modules.nav import SideBarLinks
+from modules import api_client
 
 st.set_page_config(page_title="Permissions Overview", page_icon="🔐")
 st.header("Permissions Overview")
 
-API_BASE = "http://api:4000/permissions"
-
 SideBarLinks()
 
 st.divider()
@@ -18,7 +17,7 @@ st.subheader("All Permissions")
 
 permissions = []
 try:
-    r = requests.get(f"{API_BASE}/", timeout=15)
+    r = api_client.get("/permissions/", timeout=15)
     r.raise_for_status()
     data = r.json()
     permissions = data if isinstance(data, list) else []
@@ -61,7 +60,7 @@ if submit:
             payload["description"] = description.strip()
 
         try:
-            resp = requests.post(f"{API_BASE}/", json=payload, timeout=15)
+            resp = api_client.post("/permissions/", json=payload, timeout=15)
             # Show the backend’s response (note: your backend is stubbed right now)
             try:
                 body = resp.json()
@@ -0,0 +1,41 @@
+USE ClubStack;
+
+-- Secondary indexes for the API's hot lookups. Each one names the query it
+-- serves; check a change with EXPLAIN on that query (the "key" column should
+-- show the index and "type" should be ref/range rather than ALL).
+--
+-- InnoDB already created single-column indexes for the foreign keys. The
+-- composite indexes below replace those on Nomination.Nominee, RSVP.Member,
+-- EventRoster.Event and CommunicationRecipients.Member (MySQL drops an
+-- implicit FK index once another index can enforce the constraint).
+--
+-- Runs automatically on a fresh db container. For an existing database run it
+-- once by hand:
+--   docker compose exec -T db mysql -uroot -p"$MYSQL_ROOT_PASSWORD" < database-files/04_query_indexes.sql
+
+-- Pending nominations (member dashboard, elections_bp.PENDING_NOMINATIONS_QUERY):
+--   WHERE N.Nominee = ? AND N.Accepted IS NULL
+ALTER TABLE Nomination
+    ADD INDEX idx_nomination_nominee_accepted (Nominee, Accepted);
+
+-- A member's RSVPs joined to their events (member dashboard, GET /events/rsvp/<member>):
+--   WHERE R.Member = ?  ... JOIN Event E ON R.Event = E.ID
+ALTER TABLE RSVP
+    ADD INDEX idx_rsvp_member_event (Member, Event);
+
+-- Event rosters (GET /events/<id>, GET /events/<id>/roster):
+--   WHERE ER.Event = ?  ... JOIN Member M ON ER.Member = M.ID
+ALTER TABLE EventRoster
+    ADD INDEX idx_eventroster_event_member (Event, Member);
+
+-- A member's inbox (GET /communications/<member>, member dashboard). The primary
+-- key is (Communication, Member), so it can't serve WHERE cr.Member = ?
+ALTER TABLE CommunicationRecipients
+    ADD INDEX idx_commrecipients_member_communication (Member, Communication);
+
+-- Upcoming events (member dashboard):
+--   WHERE EventDate >= CURDATE() ORDER BY EventDate, ID LIMIT n
+-- The range scan returns rows already in order (ID is the implicit suffix),
+-- so the LIMIT stops after n index entries with no filesort.
+ALTER TABLE Event
+    ADD INDEX idx_event_eventdate (EventDate);
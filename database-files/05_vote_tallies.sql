@@ -0,0 +1,27 @@
+USE ClubStack;
+
+-- Live vote counts per ballot option, so ballot results read one row per
+-- option instead of aggregating every Vote row.
+--
+-- POST /elections/votes bumps the option's row in the same transaction as
+-- the Vote insert. POST /elections/ballots/tallies/reconcile (or
+-- `flask elections reconcile-tallies`) recounts from Vote and fixes drift.
+--
+-- Runs automatically on a fresh db container. For an existing database run it
+-- once by hand:
+--   docker compose exec -T db mysql -uroot -p"$MYSQL_ROOT_PASSWORD" < database-files/05_vote_tallies.sql
+
+CREATE TABLE BallotOptionTally (
+    BallotOption INT PRIMARY KEY,
+    Ballot INT NOT NULL,
+    Votes INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (BallotOption) REFERENCES BallotOptions(ID),
+    FOREIGN KEY (Ballot) REFERENCES Ballot(ID)
+);
+
+-- Backfill from the votes already cast
+INSERT INTO BallotOptionTally (BallotOption, Ballot, Votes)
+SELECT BO.ID, BO.Ballot, COUNT(V.ID)
+FROM BallotOptions BO
+JOIN Vote V ON V.BallotOption = BO.ID
+GROUP BY BO.ID, BO.Ballot;
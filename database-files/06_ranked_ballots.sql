@@ -0,0 +1,27 @@
+USE ClubStack;
+
+-- Ranked ballots. A vote may list several ballot options in order of
+-- preference; Vote.BallotOption stays the first choice (so plurality results
+-- and BallotOptionTally are unchanged) and VoteRanking holds the full order.
+-- Votes cast with a single choice have no VoteRanking rows and count as a
+-- one-preference ranking.
+--
+-- GET /elections/ballots/<id>/tally?method=irv|stv|schulze tallies them;
+-- Position.Seats is how many winners STV elects for the position.
+--
+-- Runs automatically on a fresh db container. For an existing database run it
+-- once by hand:
+--   docker compose exec -T db mysql -uroot -p"$MYSQL_ROOT_PASSWORD" < database-files/06_ranked_ballots.sql
+
+ALTER TABLE `Position`
+    ADD COLUMN Seats INT NOT NULL DEFAULT 1;
+
+CREATE TABLE VoteRanking (
+    Vote INT,
+    Preference INT, -- 1 = first choice
+    BallotOption INT NOT NULL,
+    PRIMARY KEY (Vote, Preference),
+    UNIQUE KEY unique_vote_option (Vote, BallotOption),
+    FOREIGN KEY (Vote) REFERENCES Vote(ID),
+    FOREIGN KEY (BallotOption) REFERENCES BallotOptions(ID)
+);
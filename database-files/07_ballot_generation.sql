@@ -0,0 +1,14 @@
+USE ClubStack;
+
+-- At most one ballot per position per election. POST
+-- /elections/elections/<id>/generate-ballots already skips positions that
+-- have a ballot, so re-running it is safe; this key also stops two concurrent
+-- runs from both creating one (the loser gets a 409), and serves the route's
+-- "does this position have a ballot yet" lookup.
+--
+-- Runs automatically on a fresh db container. For an existing database run it
+-- once by hand (after removing any duplicate ballots it reports):
+--   docker compose exec -T db mysql -uroot -p"$MYSQL_ROOT_PASSWORD" < database-files/07_ballot_generation.sql
+
+ALTER TABLE Ballot
+    ADD UNIQUE KEY unique_election_position (Election, `Position`);